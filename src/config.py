@@ -1,5 +1,6 @@
 import os
 import logging
+import functools
 
 # Project Directory Structure
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))  # This will be <project_root>/src
@@ -8,21 +9,35 @@ DATA_DIR = os.path.join(os.path.dirname(ROOT_DIR), "data")
 OUTPUT_DIR = os.path.join(os.path.dirname(ROOT_DIR), "output")
 LOGS_DIR = os.path.join(os.path.dirname(ROOT_DIR), "logs")
 MOCK_DATA_DIR = os.path.join(DATA_DIR, "mock")
+FETCH_CACHE_DIR = os.path.join(DATA_DIR, "cache", "financial")  # On-disk cache of real API fetches
 
 # API Key Loading
+_colab_userdata = None
+_colab_checked = False
+
+def _get_colab_userdata():
+    """Returns google.colab.userdata if available. The import is only attempted once."""
+    global _colab_userdata, _colab_checked
+    if not _colab_checked:
+        try:
+            from google.colab import userdata
+            _colab_userdata = userdata
+        except ImportError:
+            # Not in Colab environment
+            _colab_userdata = None
+        _colab_checked = True
+    return _colab_userdata
+
 def load_api_key(key_name: str, colab_secret_name: str) -> str | None:
     """
     Loads an API key, trying Colab Secrets first, then environment variables.
     Prints a message if the key is not found.
     """
-    try:
-        from google.colab import userdata
+    userdata = _get_colab_userdata()
+    if userdata is not None:
         api_key = userdata.get(colab_secret_name)
         if api_key:
             return api_key
-    except ImportError:
-        # Not in Colab environment
-        pass
 
     api_key = os.getenv(key_name)
     if api_key:
@@ -32,9 +47,24 @@ def load_api_key(key_name: str, colab_secret_name: str) -> str | None:
           f"Please set it in Colab Secrets as '{colab_secret_name}' or as an environment variable.")
     return None
 
-GEMINI_API_KEY = load_api_key("GEMINI_API_KEY", "GEMINI_API_KEY")
-FRED_API_KEY = load_api_key("FRED_API_KEY", "FRED_API_KEY")
-FINMIND_API_KEY = load_api_key("FINMIND_API_KEY", "FINMIND_API_KEY")
+# Attribute name -> (environment variable, Colab secret name).
+# These keys are resolved lazily on first access (config.GEMINI_API_KEY etc.) and memoized.
+_API_KEY_SOURCES = {
+    "GEMINI_API_KEY": ("GEMINI_API_KEY", "GEMINI_API_KEY"),
+    "FRED_API_KEY": ("FRED_API_KEY", "FRED_API_KEY"),
+    "FINMIND_API_KEY": ("FINMIND_API_KEY", "FINMIND_API_KEY"),
+}
+
+@functools.cache
+def get_api_key(name: str) -> str | None:
+    """Returns the API key registered under name in _API_KEY_SOURCES, looking it up only once."""
+    key_name, colab_secret_name = _API_KEY_SOURCES[name]
+    return load_api_key(key_name, colab_secret_name)
+
+def __getattr__(name: str):
+    if name in _API_KEY_SOURCES:
+        return get_api_key(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Retry/Circuit Breaker Parameters
 RETRY_ATTEMPTS = 3
@@ -42,6 +72,33 @@ RETRY_DELAY_SECONDS = 5
 CIRCUIT_BREAKER_FAIL_MAX = 3
 CIRCUIT_BREAKER_RESET_TIMEOUT = 60  # seconds
 
+# Async Fetch Limits (financial_data_fetcher aget_* functions), per event loop
+MAX_CONCURRENT_API_CALLS = 8  # requests in flight across all APIs
+API_REQUESTS_PER_MINUTE = 60  # per API, sliding window
+
+# Adaptive Concurrency (financial_data_fetcher AIMD controllers), per API
+AIMD_MIN_CONCURRENCY = 1
+AIMD_MAX_CONCURRENCY = 16  # matches fetch_concurrently's default max_workers
+AIMD_TARGET_LATENCY_SECONDS = 5.0  # rolling mean call latency above which concurrency is cut
+
+# Fetch Cache (financial_data_fetcher): ranges ending before today are cached indefinitely,
+# ranges that include today are re-fetched once older than this.
+FETCH_CACHE_TTL_SECONDS = 3600
+# Sources that publish late and revise past values (FRED) never treat a closed range as final:
+# such entries are re-fetched once older than this.
+FETCH_CACHE_REVISED_TTL_SECONDS = 24 * 3600
+
+# SQLite Connection Tuning (applied by database_manager.get_db_connection)
+# journal_mode is skipped for in-memory databases. Set an entry to None to leave SQLite's default.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": 10 * 1024 ** 3,  # bytes
+    "cache_size": -65536,  # negative = KiB, i.e. 64 MiB
+    "busy_timeout": 5000,  # milliseconds
+}
+
 # Simulation Mode
 SIMULATION_MODE = True  # Default to True for safety
 
@@ -59,11 +116,12 @@ if __name__ == '__main__':
     print(f"OUTPUT_DIR: {OUTPUT_DIR}")
     print(f"LOGS_DIR: {LOGS_DIR}")
     print(f"MOCK_DATA_DIR: {MOCK_DATA_DIR}")
+    print(f"FETCH_CACHE_DIR: {FETCH_CACHE_DIR}")
 
     # Test API Key loading (will print warnings if not set)
-    print(f"GEMINI_API_KEY: {GEMINI_API_KEY}")
-    print(f"FRED_API_KEY: {FRED_API_KEY}")
-    print(f"FINMIND_API_KEY: {FINMIND_API_KEY}")
+    print(f"GEMINI_API_KEY: {get_api_key('GEMINI_API_KEY')}")
+    print(f"FRED_API_KEY: {get_api_key('FRED_API_KEY')}")
+    print(f"FINMIND_API_KEY: {get_api_key('FINMIND_API_KEY')}")
 
     print(f"RETRY_ATTEMPTS: {RETRY_ATTEMPTS}")
     print(f"SIMULATION_MODE: {SIMULATION_MODE}")
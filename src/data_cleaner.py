@@ -1,20 +1,196 @@
+import functools
 import pandas as pd
 import numpy as np
 import logging # Keep for type hinting if needed
 
+try:
+    from pandas.tseries.api import guess_datetime_format # pandas >= 2.2
+except ImportError:
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+try:
+    import pyarrow as pa # Optional: enables Arrow-backed date columns
+except ImportError:
+    pa = None
+
+try:
+    import numba # Optional: JIT-compiled outlier kernels
+except ImportError:
+    numba = None
+
 from src import utils
 
 # Initialize logger
 logger = utils.setup_logger(__name__)
 
+# Explicit formats tried in order before falling back to pandas' per-call format inference
+_DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d', '%Y-%m-%dT%H:%M:%S', 'ISO8601')
+
+@functools.lru_cache(maxsize=16)
+def _infer_datetime_format(sample: str) -> str | None:
+    """Guesses the strftime format of a date string. Cached, since daily files repeat the same layouts."""
+    return guess_datetime_format(sample)
+
+def _first_string(values) -> str | None:
+    """Returns the first str element of values, or None if there is none."""
+    for value in values:
+        if isinstance(value, str):
+            return value
+    return None
+
+def _to_datetime_fast(values, errors: str = 'raise', format: str | None = None):
+    """
+    pd.to_datetime with an explicit format. String input is tried against the (cached)
+    format guessed from its first string, then _DATE_FORMATS; only if none of them parses
+    every value does pandas infer the format itself.
+    """
+    if format is not None:
+        return pd.to_datetime(values, errors=errors, format=format, cache=True)
+    if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+        sample = _first_string(values)
+        inferred = _infer_datetime_format(sample) if sample is not None else None
+        candidates = _DATE_FORMATS if inferred is None else (inferred,) + tuple(
+            fmt for fmt in _DATE_FORMATS if fmt != inferred)
+        for fmt in candidates:
+            try:
+                return pd.to_datetime(values, errors='raise', format=fmt, cache=True)
+            except (ValueError, TypeError):
+                continue
+    return pd.to_datetime(values, errors=errors, cache=True)
+
+# --- NumPy Fill Kernels ---
+def _ffill_array(arr: np.ndarray, limit: int | None = None) -> np.ndarray:
+    """
+    Forward-fills NaNs along axis 0 of a 1-D or 2-D float array.
+    Each position takes the value at the running max of the last valid row index,
+    so the whole fill is a single np.maximum.accumulate pass. Leading NaNs stay NaN.
+    If limit is set, at most that many consecutive NaNs are filled after each valid value.
+    """
+    mask = np.isnan(arr)
+    if not mask.any():
+        return arr
+    row_idx = np.arange(arr.shape[0]).reshape((-1,) + (1,) * (arr.ndim - 1))
+    idx = np.where(~mask, row_idx, 0)
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    if arr.ndim == 1:
+        filled = arr[idx]
+    else:
+        filled = arr[idx, np.arange(arr.shape[1])]
+    if limit is not None:
+        filled[(row_idx - idx) > limit] = np.nan
+    return filled
+
+def _bfill_array(arr: np.ndarray, limit: int | None = None) -> np.ndarray:
+    """Backward-fills NaNs along axis 0 by forward-filling the reversed array."""
+    return _ffill_array(arr[::-1], limit=limit)[::-1]
+
+def _numpy_float_dtype(df: pd.DataFrame, cols: list[str]) -> np.dtype | None:
+    """
+    Returns the common NumPy float dtype of cols (e.g. float32 after downcast_ohlcv),
+    or None if any column is not a plain NumPy float column.
+    """
+    dtypes = [df[col].dtype for col in cols]
+    if not all(isinstance(dtype, np.dtype) and dtype.kind == 'f' for dtype in dtypes):
+        return None
+    return np.result_type(*dtypes)
+
+def _ffill_columns(df: pd.DataFrame, cols: list[str],
+                   limit: int | None = None, bfill: bool = False) -> None:
+    """
+    Forward-fills the given columns of df (optionally followed by a backward fill for
+    values the forward fill could not reach), using the NumPy kernels when all are float.
+    """
+    float_dtype = _numpy_float_dtype(df, cols)
+    if float_dtype is not None:
+        block = df[cols].to_numpy(dtype=float_dtype)
+        if not np.isnan(block).any(): # Clean data: nothing to fill, leave columns untouched
+            return
+        filled = _ffill_array(block, limit=limit)
+        if bfill:
+            filled = _bfill_array(filled, limit=limit)
+        for i, col in enumerate(cols):
+            df[col] = filled[:, i]
+    else:
+        if not df[cols].isna().to_numpy().any():
+            return
+        filled_df = df[cols].ffill(limit=limit)
+        if bfill:
+            filled_df = filled_df.bfill(limit=limit)
+        df[cols] = filled_df
+
+def _fill_zero_column(df: pd.DataFrame, col: str) -> None:
+    """Replaces NaNs in a single column with 0, using a NumPy mask for float columns."""
+    float_dtype = _numpy_float_dtype(df, [col])
+    if float_dtype is not None:
+        arr = df[col].to_numpy(dtype=float_dtype, copy=True)
+        nan_mask = np.isnan(arr)
+        if not nan_mask.any():
+            return
+        arr[nan_mask] = 0.0
+        df[col] = arr
+    elif df[col].isna().any():
+        df[col] = df[col].fillna(0)
+
+def _sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns df ordered by its 'date' column. Already-sorted input (the common case for
+    fetched time series) only costs a monotonicity check and a shallow copy.
+    """
+    if df['date'].is_monotonic_increasing:
+        return df.copy(deep=False)
+    return df.sort_values(by='date', kind='stable')
+
+def to_arrow_datetime(df: pd.DataFrame, time_column: str = 'date') -> pd.DataFrame:
+    """
+    Converts a datetime column to an Arrow-backed timestamp dtype, preserving its unit and
+    timezone. Sorting and resampling on the column then run on Arrow compute kernels.
+    Returns a new DataFrame, or df unchanged if pyarrow is not installed or the column is not datetime.
+    """
+    if pa is None:
+        logger.warning("pyarrow is not installed. Keeping NumPy-backed datetime column.")
+        return df
+    series = df[time_column]
+    if isinstance(series.dtype, pd.ArrowDtype) or not pd.api.types.is_datetime64_any_dtype(series):
+        return df
+    tz = series.dt.tz
+    df = df.copy(deep=False)
+    df[time_column] = series.astype(pd.ArrowDtype(pa.timestamp(series.dt.unit, tz=str(tz) if tz is not None else None)))
+    return df
+
+def downcast_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stores OHLCV price columns as float32 and an all-integer 'volume' as int64.
+    float32 keeps ~7 significant digits, which is enough for prices, and halves
+    the memory traffic of the fill/outlier passes. Returns a new DataFrame.
+    """
+    df_copy = df.copy(deep=False)
+    for col in ['open', 'high', 'low', 'close', 'adj_close']:
+        if col in df_copy.columns and pd.api.types.is_float_dtype(df_copy[col]):
+            df_copy[col] = pd.to_numeric(df_copy[col], downcast='float')
+
+    if 'volume' in df_copy.columns and pd.api.types.is_float_dtype(df_copy['volume']):
+        volume = df_copy['volume'].to_numpy(dtype=np.float64, na_value=np.nan)
+        # Only cast when nothing would be lost: no NaNs and no fractional volumes
+        if not np.isnan(volume).any() and np.array_equal(volume, np.trunc(volume)):
+            df_copy['volume'] = volume.astype(np.int64)
+    return df_copy
+
 # --- Missing Value Handlers ---
 def handle_missing_ohlcv(df: pd.DataFrame,
                          price_ffill: bool = True,
                          volume_fill_zero: bool = True,
-                         adj_close_ffill: bool = True) -> pd.DataFrame:
+                         adj_close_ffill: bool = True,
+                         price_ffill_limit: int | None = None,
+                         price_bfill: bool = False,
+                         arrow_dates: bool = False) -> pd.DataFrame:
     """
     Handles missing values in OHLCV DataFrame.
     Ensures 'date' column is datetime and sorts by it.
+
+    price_ffill_limit bounds how many consecutive missing rows are filled from one
+    observation (None = unbounded). price_bfill additionally back-fills what the
+    forward fill left, e.g. leading NaNs, using the same limit.
+    arrow_dates stores 'date' as an Arrow-backed timestamp (requires pyarrow).
     """
     if df.empty:
         logger.info("OHLCV DataFrame is empty. No missing values to handle.")
@@ -25,36 +201,86 @@ def handle_missing_ohlcv(df: pd.DataFrame,
         raise utils.DataProcessingError("OHLCV DataFrame missing 'date' column.")
 
     try:
-        df['date'] = pd.to_datetime(df['date'])
+        df['date'] = _to_datetime_fast(df['date'])
     except Exception as e:
         logger.error(f"Error converting 'date' column to datetime: {e}", exc_info=True)
         raise utils.DataProcessingError(f"Failed to convert 'date' column to datetime: {e}")
 
-    df = df.sort_values(by='date').copy() # Use .copy() to avoid SettingWithCopyWarning
+    if arrow_dates:
+        df = to_arrow_datetime(df)
+
+    df = _sort_by_date(df) # Returns a new frame, so no extra .copy() is needed
 
     price_cols = ['open', 'high', 'low', 'close']
     existing_price_cols = [col for col in price_cols if col in df.columns]
 
     if price_ffill and existing_price_cols:
-        df[existing_price_cols] = df[existing_price_cols].ffill()
-        logger.info(f"Forward-filled missing values for price columns: {existing_price_cols}")
+        _ffill_columns(df, existing_price_cols, limit=price_ffill_limit, bfill=price_bfill)
+        logger.info("Forward-filled missing values for price columns: %s", existing_price_cols)
 
     if adj_close_ffill and 'adj_close' in df.columns:
-        df['adj_close'] = df['adj_close'].ffill()
+        _ffill_columns(df, ['adj_close'], limit=price_ffill_limit, bfill=price_bfill)
         logger.info("Forward-filled missing values for 'adj_close' column.")
 
     if volume_fill_zero and 'volume' in df.columns:
-        df['volume'] = df['volume'].fillna(0)
+        _fill_zero_column(df, 'volume')
+        logger.info("Filled missing values in 'volume' column with 0.")
+
+    return df
+
+def handle_missing_ohlcv_grouped(df: pd.DataFrame,
+                                 group_col: str = 'symbol',
+                                 price_ffill: bool = True,
+                                 volume_fill_zero: bool = True,
+                                 adj_close_ffill: bool = True,
+                                 price_ffill_limit: int | None = None) -> pd.DataFrame:
+    """
+    Handles missing values for many symbols stored in one long-form OHLCV DataFrame.
+    Equivalent to calling handle_missing_ohlcv per symbol, but sorts once by
+    (group_col, 'date') and forward-fills with a single groupby pass, so values
+    never carry over from one symbol to the next.
+    """
+    if df.empty:
+        logger.info("OHLCV DataFrame is empty. No missing values to handle.")
+        return df
+
+    missing_cols = [col for col in ('date', group_col) if col not in df.columns]
+    if missing_cols:
+        logger.error(f"Grouped OHLCV DataFrame must contain columns: {missing_cols}")
+        raise utils.DataProcessingError(f"Grouped OHLCV DataFrame missing columns: {missing_cols}")
+
+    try:
+        dates = _to_datetime_fast(df['date'])
+    except Exception as e:
+        logger.error(f"Error converting 'date' column to datetime: {e}", exc_info=True)
+        raise utils.DataProcessingError(f"Failed to convert 'date' column to datetime: {e}")
+
+    df = df.assign(date=dates).sort_values(by=[group_col, 'date'], kind='stable')
+
+    ffill_cols = [col for col in ['open', 'high', 'low', 'close'] if price_ffill and col in df.columns]
+    if adj_close_ffill and 'adj_close' in df.columns:
+        ffill_cols.append('adj_close')
+
+    if ffill_cols and df[ffill_cols].isna().to_numpy().any():
+        df[ffill_cols] = df.groupby(group_col, sort=False)[ffill_cols].ffill(limit=price_ffill_limit)
+        logger.info("Forward-filled missing values per '%s' for columns: %s", group_col, ffill_cols)
+
+    if volume_fill_zero and 'volume' in df.columns:
+        _fill_zero_column(df, 'volume')
         logger.info("Filled missing values in 'volume' column with 0.")
 
     return df
 
 def handle_missing_macro(df: pd.DataFrame,
                          value_ffill: bool = True,
-                         value_interpolate: bool = False) -> pd.DataFrame:
+                         value_interpolate: bool = False,
+                         value_ffill_limit: int | None = None,
+                         arrow_dates: bool = False) -> pd.DataFrame:
     """
     Handles missing values in macro indicator DataFrame.
     Ensures 'date' column is datetime and sorts by it.
+    value_ffill_limit bounds how many consecutive missing rows are forward-filled.
+    arrow_dates stores 'date' as an Arrow-backed timestamp (requires pyarrow).
     """
     if df.empty:
         logger.info("Macro indicator DataFrame is empty. No missing values to handle.")
@@ -65,15 +291,18 @@ def handle_missing_macro(df: pd.DataFrame,
         raise utils.DataProcessingError("Macro DataFrame missing 'date' or 'value' columns.")
 
     try:
-        df['date'] = pd.to_datetime(df['date'])
+        df['date'] = _to_datetime_fast(df['date'])
     except Exception as e:
         logger.error(f"Error converting 'date' column to datetime: {e}", exc_info=True)
         raise utils.DataProcessingError(f"Failed to convert 'date' column to datetime: {e}")
 
-    df = df.sort_values(by='date').copy()
+    if arrow_dates:
+        df = to_arrow_datetime(df)
+
+    df = _sort_by_date(df)
 
     if value_ffill:
-        df['value'] = df['value'].ffill()
+        _ffill_columns(df, ['value'], limit=value_ffill_limit)
         logger.info("Forward-filled missing values for 'value' column in macro data.")
     elif value_interpolate: # Ensure this is mutually exclusive with ffill or applied after
         df['value'] = df['value'].interpolate(method='linear')
@@ -82,35 +311,79 @@ def handle_missing_macro(df: pd.DataFrame,
     return df
 
 # --- Outlier Detection/Handling (Basic) ---
-def detect_outliers_iqr(series: pd.Series, k: float = 1.5) -> pd.Series:
+def _iqr_severity_loop(arr: np.ndarray, lower: float, upper: float,
+                       severe_lower: float, severe_upper: float) -> np.ndarray:
+    """
+    Classifies each value as 0 (inside bounds), 1 (outside lower/upper) or
+    2 (outside severe_lower/severe_upper) in one pass. NaNs compare False and stay 0.
+    Only used when compiled with numba; the NumPy fallback is in _iqr_severity.
+    """
+    out = np.zeros(arr.shape[0], dtype=np.int8)
+    for i in range(arr.shape[0]):
+        x = arr[i]
+        if x < lower or x > upper:
+            if x < severe_lower or x > severe_upper:
+                out[i] = 2
+            else:
+                out[i] = 1
+    return out
+
+_iqr_severity_jit = numba.njit(cache=True)(_iqr_severity_loop) if numba is not None else None
+
+def _iqr_severity(arr: np.ndarray, lower: float, upper: float,
+                  severe_lower: float, severe_upper: float) -> np.ndarray:
+    """Per-value outlier severity (see _iqr_severity_loop), JIT-compiled when numba is available."""
+    if _iqr_severity_jit is not None:
+        return _iqr_severity_jit(arr, lower, upper, severe_lower, severe_upper)
+    severity = ((arr < lower) | (arr > upper)).astype(np.int8)
+    severity += ((arr < severe_lower) | (arr > severe_upper)).astype(np.int8)
+    return severity
+
+def _no_outliers(series: pd.Series, return_severity: bool) -> pd.Series:
+    """Returns an all-clear outlier result shaped like series."""
+    if return_severity:
+        return pd.Series(np.zeros(len(series), dtype=np.int8), index=series.index)
+    return pd.Series([False] * len(series), index=series.index)
+
+def detect_outliers_iqr(series: pd.Series, k: float = 1.5,
+                        return_severity: bool = False, severe_k: float = 3.0) -> pd.Series:
     """
     Detects outliers in a Series using the IQR method.
     Returns a boolean Series where True indicates an outlier.
+
+    If return_severity is True, returns an int8 Series instead:
+    0 = not an outlier, 1 = moderate (beyond k*IQR), 2 = severe (beyond severe_k*IQR).
     """
     if not isinstance(series, pd.Series):
         raise TypeError("Input must be a pandas Series.")
-    if series.empty or series.isnull().all():
-        logger.warning("Cannot detect outliers in an empty or all-NaN series.")
-        return pd.Series([False] * len(series), index=series.index)
-
-    # Ensure series is numeric
+    # Ensure series is numeric and work on a contiguous float64 buffer
     numeric_series = pd.to_numeric(series, errors='coerce')
-    # Calculate Q1, Q3, IQR on non-NaN values
-    Q1 = numeric_series.quantile(0.25)
-    Q3 = numeric_series.quantile(0.75)
+    arr = np.ascontiguousarray(numeric_series.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    # Checked on the raw buffer instead of building an isnull() Series to reduce
+    if not arr.size or not np.isfinite(arr).any():
+        logger.warning("Cannot detect outliers in an empty or all-NaN series.")
+        return _no_outliers(series, return_severity)
 
-    # If Q1 or Q3 is NaN (e.g. too many NaNs in series), cannot compute IQR
-    if pd.isna(Q1) or pd.isna(Q3):
-        logger.warning("Could not compute Q1/Q3 for outlier detection (possibly too many NaNs).")
-        return pd.Series([False] * len(series), index=series.index)
+    # Q1 and Q3 from a single partition of the non-NaN values
+    Q1, Q3 = np.nanquantile(arr, [0.25, 0.75], method='linear')
 
     IQR = Q3 - Q1
     lower_bound = Q1 - k * IQR
     upper_bound = Q3 + k * IQR
 
-    outliers = (numeric_series < lower_bound) | (numeric_series > upper_bound)
-    # Ensure the result has the same index as the input series
-    return outliers.reindex(series.index, fill_value=False)
+    # NaN comparisons are False, so missing values are never flagged
+    if not return_severity:
+        if _iqr_severity_jit is not None:
+            # With only one band, severity > 0 is exactly the outlier mask
+            outliers = _iqr_severity_jit(arr, lower_bound, upper_bound, lower_bound, upper_bound) > 0
+        else:
+            outliers = (arr < lower_bound) | (arr > upper_bound)
+        return pd.Series(outliers, index=series.index, copy=False)
+
+    severity = _iqr_severity(arr, lower_bound, upper_bound,
+                             Q1 - severe_k * IQR, Q3 + severe_k * IQR)
+    return pd.Series(severity, index=series.index, copy=False)
 
 
 def handle_outliers_percentage_change(df: pd.DataFrame, column: str, threshold: float = 0.5) -> pd.DataFrame:
@@ -126,12 +399,16 @@ def handle_outliers_percentage_change(df: pd.DataFrame, column: str, threshold:
 
     # Ensure column is numeric
     numeric_col = pd.to_numeric(df[column], errors='coerce')
-    if numeric_col.isnull().all():
+    arr = numeric_col.to_numpy(dtype=np.float64, na_value=np.nan)
+    if not np.isfinite(arr).any():
         logger.warning(f"Column '{column}' is all NaN after numeric conversion. Skipping outlier detection.")
         return df
 
-    pct_change = numeric_col.pct_change().abs()
-    outlier_mask = pct_change > threshold
+    # |cur / prev - 1| > threshold, rewritten as |cur - prev| > threshold * |prev|
+    # so the check is one multiply-compare pass with no division or temporary Series.
+    prev = arr[:-1]
+    outlier_mask = np.zeros(len(arr), dtype=bool)
+    np.greater(np.abs(arr[1:] - prev), threshold * np.abs(prev), out=outlier_mask[1:])
 
     outlier_indices = df.index[outlier_mask] # Get actual index labels
     if not outlier_indices.empty:
@@ -139,7 +416,7 @@ def handle_outliers_percentage_change(df: pd.DataFrame, column: str, threshold:
                        f"at indices: {outlier_indices.tolist()}")
         # Future: df.loc[outlier_indices, column] = np.nan # or apply winsorization etc.
     else:
-        logger.info(f"No significant outliers detected in '{column}' based on % change threshold {threshold*100}%.")
+        logger.info("No significant outliers detected in '%s' based on %% change threshold %s%%.", column, threshold * 100)
 
     return df
 
@@ -147,26 +424,57 @@ def handle_outliers_percentage_change(df: pd.DataFrame, column: str, threshold:
 # --- Data Type Validation/Conversion ---
 def ensure_numeric_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
     """Converts specified columns to numeric, coercing errors to NaN."""
-    df_copy = df.copy()
+    # Shallow copy: converted columns are assigned whole, so the caller's frame is never
+    # modified and untouched columns are shared instead of duplicated.
+    df_copy = df.copy(deep=False)
+    existing_cols = [col for col in columns if col in df_copy.columns]
     for col in columns:
-        if col in df_copy.columns:
-            original_nan_count = df_copy[col].isnull().sum()
-            df_copy[col] = pd.to_numeric(df_copy[col], errors='coerce')
-            new_nan_count = df_copy[col].isnull().sum()
-            if new_nan_count > original_nan_count:
-                logger.warning(f"Coerced NaNs introduced in column '{col}' during numeric conversion. "
-                               f"Original NaNs: {original_nan_count}, New NaNs: {new_nan_count}.")
-        else:
+        if col not in df_copy.columns:
             logger.warning(f"Column '{col}' not found for numeric conversion.")
+
+    # Already-numeric columns are left untouched; only non-numeric ones need to_numeric
+    cols_to_convert = [col for col in existing_cols if not pd.api.types.is_numeric_dtype(df_copy[col])]
+    if not cols_to_convert:
+        return df_copy
+
+    check_nans = logger.isEnabledFor(logging.WARNING)
+    if check_nans:
+        original_nan_counts = df_copy[cols_to_convert].isnull().sum()
+    for col in cols_to_convert:
+        df_copy[col] = pd.to_numeric(df_copy[col], errors='coerce')
+    if check_nans:
+        new_nan_counts = df_copy[cols_to_convert].isnull().sum()
+        for col in new_nan_counts.index[new_nan_counts > original_nan_counts]:
+            logger.warning(f"Coerced NaNs introduced in column '{col}' during numeric conversion. "
+                           f"Original NaNs: {original_nan_counts[col]}, New NaNs: {new_nan_counts[col]}.")
     return df_copy
 
-def ensure_datetime_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
-    """Converts specified columns to datetime, coercing errors to NaT."""
-    df_copy = df.copy()
+def _to_datetime_unique(series: pd.Series, format: str | None = None) -> pd.Series:
+    """
+    Converts a Series to datetime by parsing each distinct value only once
+    and mapping the results back. Columns that are already datetime are returned as-is.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    unique_values = series.dropna().unique()
+    if len(unique_values) == 0:
+        return _to_datetime_fast(series, errors='coerce', format=format)
+    parsed = _to_datetime_fast(unique_values, errors='coerce', format=format)
+    lookup = pd.Series(parsed, index=unique_values)
+    return series.map(lookup)
+
+def ensure_datetime_columns(df: pd.DataFrame, columns: list[str], format: str | None = None) -> pd.DataFrame:
+    """
+    Converts specified columns to datetime, coercing errors to NaT.
+    Pass format (e.g. 'ISO8601' or '%Y-%m-%d') when the layout is known to skip format inference.
+    """
+    # Shallow copy: converted columns are assigned whole, so the caller's frame is never
+    # modified and untouched columns are shared instead of duplicated.
+    df_copy = df.copy(deep=False)
     for col in columns:
         if col in df_copy.columns:
             original_nat_count = df_copy[col].isnull().sum()
-            df_copy[col] = pd.to_datetime(df_copy[col], errors='coerce')
+            df_copy[col] = _to_datetime_unique(df_copy[col], format=format)
             new_nat_count = df_copy[col].isnull().sum()
             if new_nat_count > original_nat_count:
                 logger.warning(f"Coerced NaTs introduced in column '{col}' during datetime conversion. "
@@ -192,24 +500,30 @@ def standardize_timezone_to_utc(df: pd.DataFrame, time_column: str = 'date') ->
 
     if not pd.api.types.is_datetime64_any_dtype(time_col_series):
         logger.warning(f"Column '{time_column}' is not datetime. Attempting conversion.")
-        time_col_series = pd.to_datetime(time_col_series, errors='coerce')
+        time_col_series = _to_datetime_fast(time_col_series, errors='coerce')
         if time_col_series.isnull().all():
             logger.error(f"Failed to convert '{time_column}' to datetime. Cannot standardize timezone.")
             return df # Return original if conversion failed badly
         df_copy[time_column] = time_col_series
 
 
-    if time_col_series.dt.tz is None: # Naive datetime
-        logger.info(f"Time column '{time_column}' is timezone-naive. Assuming UTC and localizing.")
-        df_copy[time_column] = time_col_series.dt.tz_localize('UTC')
+    # Aware datetimes are stored as UTC epoch values, so both branches below only
+    # attach/replace tz metadata on the existing buffer; no per-element arithmetic is needed.
+    source_tz = time_col_series.dt.tz
+    if source_tz is None: # Naive datetime
+        logger.info("Time column '%s' is timezone-naive. Assuming UTC and localizing.", time_column)
+        df_copy[time_column] = pd.DatetimeIndex(time_col_series.to_numpy()).tz_localize('UTC')
+    elif str(source_tz) == 'UTC': # Already UTC
+        logger.debug("Time column '%s' is already UTC. No conversion needed.", time_column)
     else: # Timezone-aware
-        logger.info(f"Time column '{time_column}' is timezone-aware. Converting to UTC.")
+        logger.info("Time column '%s' is timezone-aware. Converting to UTC.", time_column)
         df_copy[time_column] = time_col_series.dt.tz_convert('UTC')
 
     return df_copy
 
 def resample_data(df: pd.DataFrame, rule: str, time_column: str = 'date',
-                  ohlc_agg: dict | None = None) -> pd.DataFrame:
+                  ohlc_agg: dict | None = None,
+                  numeric_columns: list[str] | tuple[str, ...] | None = None) -> pd.DataFrame:
     """
     Resamples time-series data to a specified frequency.
 
@@ -221,6 +535,9 @@ def resample_data(df: pd.DataFrame, rule: str, time_column: str = 'date',
                   Example: {'open': 'first', 'high': 'max', 'low': 'min',
                             'close': 'last', 'volume': 'sum'}
                   If None, attempts a basic mean aggregation if other columns exist.
+        numeric_columns: Optional. Columns to mean-aggregate when ohlc_agg is None.
+                         Pass this when resampling the same frame to several rules
+                         to skip re-detecting numeric dtypes on every call.
 
     Returns:
         Resampled DataFrame.
@@ -234,8 +551,8 @@ def resample_data(df: pd.DataFrame, rule: str, time_column: str = 'date',
     df_copy = df.copy()
 
     if not pd.api.types.is_datetime64_any_dtype(df_copy[time_column]):
-        logger.info(f"Time column '{time_column}' is not datetime. Attempting conversion for resampling.")
-        df_copy[time_column] = pd.to_datetime(df_copy[time_column], errors='coerce')
+        logger.info("Time column '%s' is not datetime. Attempting conversion for resampling.", time_column)
+        df_copy[time_column] = _to_datetime_fast(df_copy[time_column], errors='coerce')
         if df_copy[time_column].isnull().all():
             logger.error(f"Failed to convert '{time_column}' to datetime. Cannot resample.")
             raise utils.DataProcessingError(f"Cannot resample due to invalid time column '{time_column}'.")
@@ -249,10 +566,13 @@ def resample_data(df: pd.DataFrame, rule: str, time_column: str = 'date',
 
     # Default aggregation if none provided and other numeric columns exist
     if ohlc_agg is None:
-        numeric_cols = df_copy.select_dtypes(include=np.number).columns
-        if not numeric_cols.empty:
+        if numeric_columns is not None:
+            numeric_cols = list(numeric_columns)
+        else:
+            numeric_cols = df_copy.select_dtypes(include=np.number).columns.tolist()
+        if numeric_cols:
             ohlc_agg = {col: 'mean' for col in numeric_cols} # Basic mean for other numeric columns
-            logger.info(f"No ohlc_agg provided. Using default mean aggregation for numeric columns: {numeric_cols.tolist()}")
+            logger.info("No ohlc_agg provided. Using default mean aggregation for numeric columns: %s", numeric_cols)
         else:
             logger.warning("No ohlc_agg and no other numeric columns to aggregate. Resampling might produce empty results beyond count.")
             # Resample will still count if no agg func and no numeric columns
@@ -268,8 +588,9 @@ def resample_data(df: pd.DataFrame, rule: str, time_column: str = 'date',
             resampled_df = df_copy.resample(rule).size().to_frame(name='count_in_period')
 
 
-        logger.info(f"Data successfully resampled to rule '{rule}'.")
-        return resampled_df.reset_index() # Return with time_column as a column again
+        logger.info("Data successfully resampled to rule '%s'.", rule)
+        # rename_axis keeps the column name for Arrow-backed indexes, whose resample output loses it
+        return resampled_df.rename_axis(time_column).reset_index() # Return with time_column as a column again
     except Exception as e:
         logger.error(f"Error during resampling with rule '{rule}': {e}", exc_info=True)
         raise utils.DataProcessingError(f"Resampling failed: {e}")
@@ -298,6 +619,42 @@ if __name__ == '__main__':
     assert cleaned_ohlcv['volume'].isnull().sum() == 0
     assert cleaned_ohlcv['open'].iloc[2] == 11 # Forward filled from 2023-01-02
 
+    downcast_df = downcast_ohlcv(cleaned_ohlcv)
+    logger.info(f"Downcast OHLCV dtypes:\n{downcast_df.dtypes}")
+    assert downcast_df['close'].dtype == np.float32
+    assert downcast_df['volume'].dtype == np.int64 # No NaNs left after cleaning
+    assert handle_missing_ohlcv(downcast_df)['close'].dtype == np.float32 # Fills keep float32
+
+    if pa is not None:
+        # Arrow dates keep the column's unit (dates past 2262 need more than ns) and leave the input alone
+        far_dates_df = pd.DataFrame({'date': pd.to_datetime(['2023-01-01', '2300-01-01']).as_unit('us')})
+        arrow_dates_df = to_arrow_datetime(far_dates_df)
+        assert arrow_dates_df is not far_dates_df and far_dates_df['date'].dtype == 'datetime64[us]'
+        assert arrow_dates_df['date'].dtype == pd.ArrowDtype(pa.timestamp('us'))
+        assert arrow_dates_df['date'].iloc[1] == pd.Timestamp('2300-01-01')
+
+    gap_df = pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=5),
+        'close': [np.nan, 10.0, np.nan, np.nan, np.nan],
+    })
+    limited = handle_missing_ohlcv(gap_df.copy(), price_ffill_limit=1, price_bfill=True)
+    logger.info(f"Limited ffill + bfill:\n{limited}")
+    assert limited['close'].iloc[0] == 10.0 # Back-filled leading NaN
+    assert limited['close'].iloc[2] == 10.0 # Within limit
+    assert np.isnan(limited['close'].iloc[3]) # Beyond limit
+
+    # Multiple symbols in one frame: fills must not leak across symbols
+    multi_df = pd.DataFrame({
+        'symbol': ['AAA', 'BBB', 'AAA', 'BBB'],
+        'date': ['2023-01-01', '2023-01-01', '2023-01-02', '2023-01-02'],
+        'close': [10.0, np.nan, np.nan, 20.0],
+        'volume': [100.0, np.nan, 200.0, 300.0],
+    })
+    cleaned_multi = handle_missing_ohlcv_grouped(multi_df)
+    logger.info(f"Cleaned grouped OHLCV:\n{cleaned_multi}")
+    assert cleaned_multi.loc[cleaned_multi['symbol'] == 'AAA', 'close'].tolist() == [10.0, 10.0]
+    assert np.isnan(cleaned_multi.loc[cleaned_multi['symbol'] == 'BBB', 'close'].iloc[0]) # Not filled from AAA
+
     # Sample Macro Data
     macro_data = {
         'date': pd.to_datetime(['2023-01-01', '2023-02-01', '2023-03-01', '2023-04-01']),
@@ -319,6 +676,11 @@ if __name__ == '__main__':
     assert outliers.iloc[7] == True # 100
     assert outliers.iloc[8] == True # -50
 
+    severity = detect_outliers_iqr(outlier_series, return_severity=True)
+    logger.info(f"Outlier severity (0=none, 1=moderate, 2=severe): {severity.values}")
+    assert severity.iloc[7] == 2 # 100 is beyond 3*IQR
+    assert severity.iloc[0] == 0
+
     # Percentage Change Outlier Logging
     ohlcv_df_for_pct = cleaned_ohlcv.copy()
     ohlcv_df_for_pct.loc[len(ohlcv_df_for_pct)] = ['2023-01-06', 14, 14.5, 13.5, 30.0, 30.0, 1300] # Introduce large jump in close
@@ -375,4 +737,8 @@ if __name__ == '__main__':
     logger.info(f"Weekly resampled (default agg - mean for 'close'):\n{weekly_simple_df}")
     assert 'close' in weekly_simple_df.columns or 'count_in_period' in weekly_simple_df.columns
 
+    # Reuse a precomputed numeric column list across several rules
+    daily_simple_df = resample_data(simple_resample_df, 'D', numeric_columns=('close',))
+    assert 'close' in daily_simple_df.columns
+
     logger.info("--- data_cleaner.py direct execution tests completed ---")
@@ -1,20 +1,170 @@
+import hashlib
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 import logging # Keep for type hinting if needed
 
+try:
+    import numba # Optional: JIT-compiled rolling kernels
+except ImportError:
+    numba = None
+
+try:
+    import bottleneck as bn # Optional: compiled reductions used when numba is unavailable
+except ImportError:
+    bn = None
+
 from src import utils
 
 # Initialize logger
 logger = utils.setup_logger(__name__)
 
+# --- Input Coercion ---
+def _as_datetime(values: pd.Series) -> pd.Series:
+    """pd.to_datetime, skipped when values are already datetime64 (naive or tz-aware)."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values)
+
+def _as_numeric(values: pd.Series) -> pd.Series:
+    """pd.to_numeric(errors='coerce'), skipped when values are already numeric."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    return pd.to_numeric(values, errors='coerce')
+
+# --- Summary Cache ---
+# Summaries are pure functions of their inputs and are often rebuilt for identical
+# data (backtests, retried LLM calls), so recent results are kept keyed by content.
+_SUMMARY_CACHE_SIZE = 128
+_summary_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_summary_cache_lock = threading.Lock() # Lookups reorder the dict, so even hits must hold it
+
+def _content_hash(data) -> str | None:
+    """
+    Fingerprint of a DataFrame's values or a Series' values and index, plus their dtypes;
+    None if unhashable. hash_pandas_object hashes datetimes as UTC epochs, so the dtype
+    (which carries the timezone) is what tells the same instants in two zones apart.
+    """
+    try:
+        is_series = isinstance(data, pd.Series)
+        hashes = pd.util.hash_pandas_object(data, index=is_series).to_numpy()
+    except TypeError:
+        return None
+    if is_series:
+        dtypes = (str(data.dtype), str(data.index.dtype))
+    else:
+        dtypes = tuple((str(col), str(dtype)) for col, dtype in data.dtypes.items())
+    digest = hashlib.blake2b(hashes.tobytes(), digest_size=16)
+    digest.update(repr(dtypes).encode('utf-8'))
+    return digest.hexdigest()
+
+def _cached_summary(key: tuple, build) -> str:
+    """Returns the cached summary for key, calling build() and storing its result on a miss."""
+    if key[-1] is None: # Content could not be hashed
+        return build()
+    with _summary_cache_lock:
+        summary = _summary_cache.get(key)
+        if summary is not None:
+            _summary_cache.move_to_end(key)
+            return summary
+    summary = build() # Outside the lock: concurrent misses may build twice, never block each other
+    with _summary_cache_lock:
+        _summary_cache[key] = summary
+        if len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+    return summary
+
 # --- OHLCV to Text Summary ---
+_TREND_THRESHOLD = 0.02 # Example threshold for up/downtrend
+_TREND_LABELS = ("downtrend", "sideways movement", "uptrend")
+
+# Rendered with format_map over _format_ohlcv_summary's locals
+_OHLCV_SUMMARY_TEMPLATE = (
+    "Summary for {period_desc} ({start_date} to {end_date}):\n"
+    "- Overall return: {overall_return:.2%}.\n"
+    "- Price range: Low {lowest_low:.2f} to High {highest_high:.2f}.\n"
+    "- Average daily volume: {avg_volume:,.0f}.\n"
+    "- Volatility (period range / avg open): {volatility_range_over_open:.2%}.\n"
+    "- General trend: {trend_desc}.\n"
+    "- Key price points: Started at {first_open:.2f} (on {start_date}), ended at {last_close:.2f} (on {end_date}).\n"
+    "- Period peak high: {highest_high:.2f} (on {peak_price_date}), period bottom low: {lowest_low:.2f} (on {bottom_price_date})."
+)
+
+def _ohlcv_stats_loop(prices: np.ndarray) -> tuple:
+    """
+    One pass over an (n, 5) open/high/low/close/volume block with no NaNs.
+    Returns (high max, its row, low min, its row, mean volume, mean open);
+    ties resolve to the first row, like argmax/argmin.
+    Only used when compiled with numba; the NumPy fallback is in _ohlcv_stats.
+    """
+    n = prices.shape[0]
+    high_max = prices[0, 1]
+    high_idx = 0
+    low_min = prices[0, 2]
+    low_idx = 0
+    open_sum = 0.0
+    volume_sum = 0.0
+    for i in range(n):
+        if prices[i, 1] > high_max:
+            high_max = prices[i, 1]
+            high_idx = i
+        if prices[i, 2] < low_min:
+            low_min = prices[i, 2]
+            low_idx = i
+        open_sum += prices[i, 0]
+        volume_sum += prices[i, 4]
+    return high_max, high_idx, low_min, low_idx, volume_sum / n, open_sum / n
+
+_ohlcv_stats_jit = numba.njit(cache=True)(_ohlcv_stats_loop) if numba is not None else None
+
+def _ohlcv_stats(prices: np.ndarray) -> tuple:
+    """
+    Fused OHLCV reductions (see _ohlcv_stats_loop), JIT-compiled when numba is available,
+    otherwise bottleneck's compiled kernels, otherwise plain NumPy.
+    """
+    if _ohlcv_stats_jit is not None:
+        return _ohlcv_stats_jit(np.ascontiguousarray(prices))
+    if bn is not None:
+        high_idx = int(bn.nanargmax(prices[:, 1]))
+        low_idx = int(bn.nanargmin(prices[:, 2]))
+        return (prices[high_idx, 1], high_idx, prices[low_idx, 2], low_idx,
+                bn.nanmean(prices[:, 4]), bn.nanmean(prices[:, 0]))
+    high_idx = int(prices[:, 1].argmax())
+    low_idx = int(prices[:, 2].argmin())
+    return (prices[high_idx, 1], high_idx, prices[low_idx, 2], low_idx,
+            prices[:, 4].mean(), prices[:, 0].mean())
+
+# Per-thread scratch block reused across calls, so repeated summaries of similar-length
+# periods do not allocate a fresh (n, 5) array each time. Nothing built from it is retained.
+# Capped so one oversized call does not pin its memory for the life of the thread.
+_price_buffer_tls = threading.local()
+_PRICE_BUFFER_MAX_ROWS = 65_536 # 2.5 MiB of float64 per thread
+
+def _price_buffer(n: int) -> np.ndarray:
+    """
+    Returns an (n, 5) float64 view of this thread's scratch block, growing it by doubling.
+    Above _PRICE_BUFFER_MAX_ROWS a one-off array is returned and the block is left as is.
+    """
+    if n > _PRICE_BUFFER_MAX_ROWS:
+        return np.empty((n, 5), dtype=np.float64)
+    buf = getattr(_price_buffer_tls, 'buf', None)
+    if buf is None or buf.shape[0] < n:
+        capacity = 256 if buf is None else buf.shape[0]
+        while capacity < n:
+            capacity *= 2
+        capacity = min(capacity, _PRICE_BUFFER_MAX_ROWS)
+        buf = np.empty((capacity, 5), dtype=np.float64)
+        _price_buffer_tls.buf = buf
+    return buf[:n]
+
 def summarize_ohlcv_for_llm(df_ohlcv: pd.DataFrame, period_desc: str = "this period") -> str:
     """
     Generates a textual summary of OHLCV data for a given period.
 
     Args:
         df_ohlcv: DataFrame with 'date', 'open', 'high', 'low', 'close', 'volume'.
-                  Should be sorted by date.
+                  Should be sorted by date. Not modified.
         period_desc: A string describing the period (e.g., "this week", "January 2023").
 
     Returns:
@@ -29,60 +179,175 @@ def summarize_ohlcv_for_llm(df_ohlcv: pd.DataFrame, period_desc: str = "this per
         logger.error(f"OHLCV DataFrame for summary is missing required columns: {missing_cols}")
         return f"Incomplete OHLCV data for {period_desc}. Missing: {', '.join(missing_cols)}."
 
-    # Ensure data types are correct for calculations
+    # Answer all-NaN input before any conversion, hashing or sorting work
+    numeric_frame = df_ohlcv[required_cols[1:]]
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in numeric_frame.dtypes):
+        prices = numeric_frame.to_numpy(dtype=np.float64, na_value=np.nan)
+        if not (~np.isnan(prices)).all(axis=1).any():
+            return f"OHLCV data for {period_desc} is empty after removing NaNs."
+
+    key = ('ohlcv', period_desc, df_ohlcv.shape, _content_hash(df_ohlcv[required_cols]))
+    return _cached_summary(key, lambda: _summarize_ohlcv(df_ohlcv, period_desc))
+
+def _summarize_ohlcv(df_ohlcv: pd.DataFrame, period_desc: str) -> str:
+    """Builds the summarize_ohlcv_for_llm text for a non-empty frame with all required columns."""
+    # Convert into local arrays; the caller's DataFrame is never modified
     try:
-        df_ohlcv['date'] = pd.to_datetime(df_ohlcv['date'])
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df_ohlcv[col] = pd.to_numeric(df_ohlcv[col], errors='coerce')
+        date_series = _as_datetime(df_ohlcv['date'])
+        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
+        numeric_frame = df_ohlcv[numeric_cols]
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in numeric_frame.dtypes):
+            numeric_frame = numeric_frame.apply(pd.to_numeric, errors='coerce')
+        prices = _price_buffer(len(numeric_frame))
+        for i, col in enumerate(numeric_cols):
+            np.copyto(prices[:, i], numeric_frame[col].to_numpy(dtype=np.float64, na_value=np.nan))
     except Exception as e:
         logger.error(f"Error converting OHLCV data types for summary: {e}", exc_info=True)
         return f"Error processing data types for {period_desc} summary."
+    if date_series.dt.tz is not None:
+        date_series = date_series.dt.tz_localize(None) # Keep local wall-clock dates
+    return _summarize_price_block(date_series.to_numpy(), prices, period_desc)
 
-    df_ohlcv = df_ohlcv.sort_values(by='date').dropna(subset=['open', 'high', 'low', 'close', 'volume'])
-    if df_ohlcv.empty:
-        return f"OHLCV data for {period_desc} is empty after removing NaNs."
+def summarize_ohlcv_arrays(dates: np.ndarray, opens: np.ndarray, highs: np.ndarray,
+                           lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray,
+                           period_desc: str = "this period") -> str:
+    """
+    Same summary as summarize_ohlcv_for_llm, taken straight from column arrays
+    (e.g. loaded from Parquet/Arrow) without building a DataFrame.
 
-    start_date = df_ohlcv['date'].iloc[0].strftime('%Y-%m-%d')
-    end_date = df_ohlcv['date'].iloc[-1].strftime('%Y-%m-%d')
+    Args:
+        dates: datetime64 array. Should be sorted.
+        opens, highs, lows, closes, volumes: Numeric arrays of the same length as dates.
+        period_desc: A string describing the period.
 
-    first_open = df_ohlcv['open'].iloc[0]
-    last_close = df_ohlcv['close'].iloc[-1]
+    Returns:
+        A string summarizing the OHLCV data.
+    """
+    dates = np.asarray(dates)
+    if not np.issubdtype(dates.dtype, np.datetime64):
+        raise TypeError("dates must be a datetime64 array.")
+    columns = [opens, highs, lows, closes, volumes]
+    if any(len(col) != len(dates) for col in columns):
+        raise ValueError("All OHLCV arrays must have the same length as dates.")
+    if not len(dates):
+        return f"No OHLCV data available for {period_desc} to summarize."
+    prices = np.column_stack([np.asarray(col, dtype=np.float64) for col in columns])
+    return _summarize_price_block(dates, prices, period_desc)
+
+def _summarize_price_block(dates: np.ndarray, prices: np.ndarray, period_desc: str) -> str:
+    """Summary text from datetime64 dates and an (n, 5) float64 open/high/low/close/volume block."""
+    # Input is documented as date-sorted, so only pay for a sort when it is not
+    if not (dates[1:] >= dates[:-1]).all():
+        order = np.argsort(dates, kind='stable')
+        dates = dates[order]
+        prices = prices[order]
+
+    valid = ~np.isnan(prices).any(axis=1)
+    if not valid.all():
+        dates = dates[valid]
+        prices = prices[valid]
+    if not len(dates):
+        return f"OHLCV data for {period_desc} is empty after removing NaNs."
 
+    # Every read position is taken exactly once from the cleaned arrays
+    first_open = prices[0, 0]
+    last_close = prices[-1, 3]
+    highest_high, high_idx, lowest_low, low_idx, avg_volume, period_open_avg = _ohlcv_stats(prices)
+    start_date, end_date, peak_price_date, bottom_price_date = np.datetime_as_string(
+        dates[[0, -1, high_idx, low_idx]], unit='D')
+
+    return _format_ohlcv_summary(period_desc, start_date, end_date, first_open, last_close,
+                                 highest_high, lowest_low, avg_volume, period_open_avg,
+                                 peak_price_date, bottom_price_date)
+
+def _format_ohlcv_summary(period_desc: str, start_date: str, end_date: str,
+                          first_open: float, last_close: float,
+                          highest_high: float, lowest_low: float,
+                          avg_volume: float, period_open_avg: float,
+                          peak_price_date: str, bottom_price_date: str) -> str:
+    """Derives return/volatility/trend from the period statistics and renders the summary text."""
+    # Python floats format ~2x faster than NumPy scalars, which dominates once the stats are cheap
+    first_open, last_close, highest_high, lowest_low, avg_volume, period_open_avg = map(
+        float, (first_open, last_close, highest_high, lowest_low, avg_volume, period_open_avg))
     overall_return = (last_close - first_open) / first_open if first_open != 0 else 0.0
 
-    highest_high = df_ohlcv['high'].max()
-    lowest_low = df_ohlcv['low'].min()
-
-    avg_volume = df_ohlcv['volume'].mean()
-
     # Volatility: (High - Low) / Open over the period (simplified)
-    period_open_avg = df_ohlcv['open'].mean() # Could also use first_open
+    # period_open_avg could also be first_open
     volatility_range_over_open = (highest_high - lowest_low) / period_open_avg if period_open_avg != 0 else 0.0
 
-    # Trend description (simple logic)
-    if overall_return > 0.02: # Example threshold for uptrend
-        trend_desc = "uptrend"
-    elif overall_return < -0.02: # Example threshold for downtrend
-        trend_desc = "downtrend"
-    else:
-        trend_desc = "sideways movement"
-
-    peak_price_date = df_ohlcv.loc[df_ohlcv['high'].idxmax(), 'date'].strftime('%Y-%m-%d')
-    bottom_price_date = df_ohlcv.loc[df_ohlcv['low'].idxmin(), 'date'].strftime('%Y-%m-%d')
-
-    summary = (
-        f"Summary for {period_desc} ({start_date} to {end_date}):\n"
-        f"- Overall return: {overall_return:.2%}.\n"
-        f"- Price range: Low {lowest_low:.2f} to High {highest_high:.2f}.\n"
-        f"- Average daily volume: {avg_volume:,.0f}.\n"
-        f"- Volatility (period range / avg open): {volatility_range_over_open:.2%}.\n"
-        f"- General trend: {trend_desc}.\n"
-        f"- Key price points: Started at {first_open:.2f} (on {start_date}), ended at {last_close:.2f} (on {end_date}).\n"
-        f"- Period peak high: {highest_high:.2f} (on {peak_price_date}), period bottom low: {lowest_low:.2f} (on {bottom_price_date})."
-    )
-    return summary
+    # Trend description (simple logic): strictly beyond +/- threshold picks up/down, else sideways
+    trend_desc = _TREND_LABELS[1 + int(overall_return > _TREND_THRESHOLD) - int(overall_return < -_TREND_THRESHOLD)]
+
+    return _OHLCV_SUMMARY_TEMPLATE.format_map(locals())
+
+def summarize_ohlcv_batch(df_all: pd.DataFrame, group_cols, period_desc_fn=None) -> pd.Series:
+    """
+    Summarizes many OHLCV groups (e.g. one per ticker or per month) with a single groupby
+    instead of calling summarize_ohlcv_for_llm once per group.
+
+    Args:
+        df_all: DataFrame with the group column(s) plus 'date', 'open', 'high', 'low', 'close', 'volume'.
+                Not modified.
+        group_cols: Column name or list of column names to group by.
+        period_desc_fn: Optional callable mapping a group key to its period description.
+                        Defaults to str(key).
+
+    Returns:
+        A Series of summary strings indexed by group key, each identical to what
+        summarize_ohlcv_for_llm would return for that group. Groups left empty after
+        dropping NaN rows are omitted.
+    """
+    if isinstance(group_cols, str):
+        group_cols = [group_cols]
+    numeric_cols = ['open', 'high', 'low', 'close', 'volume']
+    required_cols = list(group_cols) + ['date'] + numeric_cols
+    missing_cols = [col for col in required_cols if col not in df_all.columns]
+    if missing_cols:
+        logger.error(f"OHLCV DataFrame for batch summary is missing required columns: {missing_cols}")
+        return pd.Series(dtype=object, name='summary')
+    if period_desc_fn is None:
+        period_desc_fn = str
+
+    dates = _as_datetime(df_all['date'])
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None) # Keep local wall-clock dates
+    work = df_all[required_cols].assign(
+        date=dates, **{col: _as_numeric(df_all[col]) for col in numeric_cols})
+    work = work.dropna(subset=numeric_cols).sort_values(group_cols + ['date'], kind='stable').reset_index(drop=True)
+    if work.empty:
+        return pd.Series(dtype=object, name='summary')
+
+    grouped = work.groupby(group_cols, sort=True)
+    stats = grouped.agg(start_date=('date', 'first'), end_date=('date', 'last'),
+                        first_open=('open', 'first'), last_close=('close', 'last'),
+                        highest_high=('high', 'max'), lowest_low=('low', 'min'),
+                        avg_volume=('volume', 'mean'), period_open_avg=('open', 'mean'))
+    date_values = work['date'].to_numpy()
+    peak_dates = date_values[grouped['high'].idxmax().to_numpy()]
+    bottom_dates = date_values[grouped['low'].idxmin().to_numpy()]
+
+    summaries = [
+        _format_ohlcv_summary(period_desc_fn(key), *row)
+        for key, row in zip(stats.index, zip(
+            np.datetime_as_string(stats['start_date'].to_numpy(), unit='D'),
+            np.datetime_as_string(stats['end_date'].to_numpy(), unit='D'),
+            stats['first_open'], stats['last_close'], stats['highest_high'], stats['lowest_low'],
+            stats['avg_volume'], stats['period_open_avg'],
+            np.datetime_as_string(peak_dates, unit='D'),
+            np.datetime_as_string(bottom_dates, unit='D')))
+    ]
+    return pd.Series(summaries, index=stats.index, name='summary')
 
 # --- Macro Indicator to Text Summary ---
+# Rendered with format_map over _summarize_macro_indicator_fast's locals
+_MACRO_SUMMARY_TEMPLATE = (
+    "Macro Indicator Summary for '{indicator_name}' ({period_desc}, data from {start_date} to {end_date}):\n"
+    "- Latest value ({latest_date_str}): {latest_value:.2f}.\n"
+    "- Previous value ({prev_date_str}): {prev_value_str}.\n"
+    "- Change from previous: {change_str} ({pct_change_str}).\n"
+    "- Range in period: Min {min_val:.2f} to Max {max_val:.2f}."
+)
+
 def summarize_macro_indicator_for_llm(series_macro: pd.Series,
                                       indicator_name: str,
                                       period_desc: str = "this period") -> str:
@@ -104,11 +369,16 @@ def summarize_macro_indicator_for_llm(series_macro: pd.Series,
     if series_macro.empty:
         return f"No data available for macro indicator '{indicator_name}' for {period_desc}."
 
+    key = ('macro', indicator_name, period_desc, _content_hash(series_macro))
+    return _cached_summary(key, lambda: _summarize_macro(series_macro, indicator_name, period_desc))
+
+def _summarize_macro(series_macro: pd.Series, indicator_name: str, period_desc: str) -> str:
+    """Validates/cleans a non-empty Series, then hands raw arrays to _summarize_macro_indicator_fast."""
     # Ensure Series is numeric and index is datetime
     try:
-        series_macro = pd.to_numeric(series_macro, errors='coerce')
+        series_macro = _as_numeric(series_macro)
         if not isinstance(series_macro.index, pd.DatetimeIndex):
-            series_macro.index = pd.to_datetime(series_macro.index, errors='coerce')
+            series_macro = series_macro.set_axis(pd.to_datetime(series_macro.index, errors='coerce'))
     except Exception as e:
         logger.error(f"Error converting macro series data types for summary: {e}", exc_info=True)
         return f"Error processing data types for {indicator_name} summary."
@@ -117,39 +387,47 @@ def summarize_macro_indicator_for_llm(series_macro: pd.Series,
     if series_macro.empty:
         return f"Data for macro indicator '{indicator_name}' for {period_desc} is empty after removing NaNs."
 
-    start_date = series_macro.index[0].strftime('%Y-%m-%d')
-    end_date = series_macro.index[-1].strftime('%Y-%m-%d')
+    index = series_macro.index
+    if index.tz is not None:
+        index = index.tz_localize(None) # Keep local wall-clock dates
+    return _summarize_macro_indicator_fast(series_macro.to_numpy(dtype=np.float64), index.to_numpy(),
+                                           indicator_name, period_desc)
 
-    latest_date = series_macro.index[-1]
-    latest_value = series_macro.iloc[-1]
+def _summarize_macro_indicator_fast(values: np.ndarray, index: np.ndarray,
+                                    indicator_name: str, period_desc: str) -> str:
+    """
+    Arithmetic and formatting only, for already-validated input: values is a non-empty,
+    NaN-free float64 array and index the matching date-sorted datetime64 array.
+    Bulk callers holding such arrays can call this directly.
+    """
+    n = values.size
+    latest_value = float(values[-1]) # Python floats format faster than NumPy scalars
+    start_date, end_date = np.datetime_as_string(index[[0, -1]], unit='D')
+    latest_date_str = end_date
 
     prev_date_str = "N/A"
     prev_value_str = "N/A"
     change_str = "N/A"
     pct_change_str = "N/A"
 
-    if len(series_macro) >= 2:
-        prev_date = series_macro.index[-2]
-        prev_value = series_macro.iloc[-2]
+    if n >= 2:
+        prev_value = float(values[-2])
         change = latest_value - prev_value
         pct_change = (change / prev_value) if prev_value != 0 else 0.0
 
-        prev_date_str = prev_date.strftime('%Y-%m-%d')
+        prev_date_str = np.datetime_as_string(index[-2], unit='D')
         prev_value_str = f"{prev_value:.2f}"
         change_str = f"{change:.2f}"
         pct_change_str = f"{pct_change:.2%}"
 
-    min_val = series_macro.min()
-    max_val = series_macro.max()
+    # A single observation is its own range
+    if n > 1:
+        min_val = float(bn.nanmin(values) if bn is not None else values.min())
+        max_val = float(bn.nanmax(values) if bn is not None else values.max())
+    else:
+        min_val = max_val = latest_value
 
-    summary = (
-        f"Macro Indicator Summary for '{indicator_name}' ({period_desc}, data from {start_date} to {end_date}):\n"
-        f"- Latest value ({latest_date.strftime('%Y-%m-%d')}): {latest_value:.2f}.\n"
-        f"- Previous value ({prev_date_str}): {prev_value_str}.\n"
-        f"- Change from previous: {change_str} ({pct_change_str}).\n"
-        f"- Range in period: Min {min_val:.2f} to Max {max_val:.2f}."
-    )
-    return summary
+    return _MACRO_SUMMARY_TEMPLATE.format_map(locals())
 
 # --- Basic Financial Calculations ---
 def calculate_returns(price_series: pd.Series, period: int = 1) -> pd.Series:
@@ -158,7 +436,59 @@ def calculate_returns(price_series: pd.Series, period: int = 1) -> pd.Series:
         raise TypeError("Input must be a pandas Series.")
     if price_series.empty:
         return pd.Series(dtype=float)
-    return price_series.pct_change(periods=period)
+    if period <= 0 or not pd.api.types.is_numeric_dtype(price_series):
+        return price_series.pct_change(periods=period)
+
+    # (p[t] - p[t-period]) / p[t-period] straight into one preallocated buffer
+    prices = price_series.to_numpy(dtype=np.float64, na_value=np.nan)
+    returns = np.full(len(prices), np.nan)
+    if period < len(prices):
+        prev = prices[:-period]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.subtract(prices[period:], prev, out=returns[period:])
+            np.divide(returns[period:], prev, out=returns[period:])
+    return pd.Series(returns, index=price_series.index, name=price_series.name)
+
+def _rolling_std_loop(arr: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """
+    Sliding-window sample std in O(N) using Welford's add/remove updates.
+    Matches Series.rolling(window).std(): a window containing any NaN or ±inf yields NaN.
+    Non-finite values are counted, never added, so they cannot poison the running sums.
+    Only used when compiled with numba; otherwise pandas' rolling std is used.
+    """
+    n_total = arr.shape[0]
+    out = np.full(n_total, np.nan)
+    count = 0
+    nan_count = 0 # Non-finite values (NaN, ±inf) in the window
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n_total):
+        x = arr[i]
+        if not np.isfinite(x):
+            nan_count += 1
+        else:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += (x - mean) * delta
+        if i >= window:
+            y = arr[i - window]
+            if not np.isfinite(y):
+                nan_count -= 1
+            else:
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = y - mean
+                    mean -= delta / count
+                    m2 -= (y - mean) * delta
+        if i >= window - 1 and nan_count == 0 and count > ddof:
+            out[i] = np.sqrt(max(m2, 0.0) / (count - ddof))
+    return out
+
+_rolling_std_jit = numba.njit(cache=True)(_rolling_std_loop) if numba is not None else None
 
 def calculate_rolling_volatility_std_dev(returns_series: pd.Series, window: int = 20) -> pd.Series:
     """
@@ -172,6 +502,15 @@ def calculate_rolling_volatility_std_dev(returns_series: pd.Series, window: int
         logger.warning(f"Returns series is too short for window {window}. Returning NaNs or empty series.")
         return pd.Series([np.nan] * len(returns_series), index=returns_series.index, dtype=float)
 
+    if _rolling_std_jit is not None:
+        arr = returns_series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return pd.Series(_rolling_std_jit(arr, window), index=returns_series.index, name=returns_series.name)
+    if bn is not None:
+        # Default min_count=window gives NaN for any window containing a NaN, as pandas does.
+        # bottleneck's running sums do not recover from ±inf (e.g. returns off a zero price): leave those to pandas.
+        arr = returns_series.to_numpy(dtype=np.float64, na_value=np.nan)
+        if not np.isinf(arr).any():
+            return pd.Series(bn.move_std(arr, window, ddof=1), index=returns_series.index, name=returns_series.name)
     return returns_series.rolling(window=window).std()
 
 
@@ -190,10 +529,37 @@ if __name__ == '__main__':
     ohlcv_df_sample = pd.DataFrame(ohlcv_data_dict)
 
     logger.info(f"Sample OHLCV DataFrame:\n{ohlcv_df_sample}")
-    ohlcv_summary = summarize_ohlcv_for_llm(ohlcv_df_sample.copy(), period_desc="first week of Jan 2023")
+    ohlcv_summary = summarize_ohlcv_for_llm(ohlcv_df_sample, period_desc="first week of Jan 2023")
     logger.info(f"OHLCV Summary:\n{ohlcv_summary}")
     assert "Overall return" in ohlcv_summary
     assert "Average daily volume" in ohlcv_summary
+    assert ohlcv_df_sample['open'].dtype == np.int64 # Input left untouched
+    assert summarize_ohlcv_for_llm(ohlcv_df_sample, period_desc="first week of Jan 2023") is ohlcv_summary # Cache hit
+
+    # Oversized calls get a one-off array; the retained scratch block stays capped
+    assert _price_buffer(_PRICE_BUFFER_MAX_ROWS + 1).shape == (_PRICE_BUFFER_MAX_ROWS + 1, 5)
+    assert _price_buffer_tls.buf.shape[0] <= _PRICE_BUFFER_MAX_ROWS
+
+    # Same instants in another timezone are a different cache entry with local dates
+    utc_df = ohlcv_df_sample.assign(date=ohlcv_df_sample['date'].dt.tz_localize('UTC'))
+    eastern_df = utc_df.assign(date=utc_df['date'].dt.tz_convert('US/Eastern'))
+    assert "(2023-01-01 to 2023-01-05)" in summarize_ohlcv_for_llm(utc_df, period_desc="tz period")
+    assert "(2022-12-31 to 2023-01-04)" in summarize_ohlcv_for_llm(eastern_df, period_desc="tz period")
+
+    # Batch summary over two tickers matches per-group calls
+    batch_df = pd.concat([ohlcv_df_sample.assign(symbol='AAA'), ohlcv_df_sample.assign(symbol='BBB')])
+    batch_summaries = summarize_ohlcv_batch(batch_df, 'symbol')
+    logger.info(f"Batch OHLCV Summaries:\n{batch_summaries}")
+    assert batch_summaries['AAA'] == summarize_ohlcv_for_llm(ohlcv_df_sample, period_desc='AAA')
+
+    # Array entry point gives the same text without a DataFrame
+    array_summary = summarize_ohlcv_arrays(*(ohlcv_df_sample[col].to_numpy() for col in ohlcv_df_sample.columns),
+                                           period_desc="first week of Jan 2023")
+    assert array_summary == ohlcv_summary
+
+    # All-NaN prices short-circuit to the empty message
+    nan_ohlcv_summary = summarize_ohlcv_for_llm(ohlcv_df_sample.assign(open=np.nan), period_desc="NaN period")
+    assert "empty after removing NaNs" in nan_ohlcv_summary
 
     # Test with empty OHLCV df
     empty_ohlcv_summary = summarize_ohlcv_for_llm(pd.DataFrame(columns=ohlcv_df_sample.columns), period_desc="empty period")
@@ -207,7 +573,7 @@ if __name__ == '__main__':
     macro_series_sample = pd.Series(macro_values, index=macro_dates, name="Unemployment Rate")
 
     logger.info(f"Sample Macro Series:\n{macro_series_sample}")
-    macro_summary = summarize_macro_indicator_for_llm(macro_series_sample.copy(),
+    macro_summary = summarize_macro_indicator_for_llm(macro_series_sample,
                                                       indicator_name="Unemployment Rate",
                                                       period_desc="Q1 2023")
     logger.info(f"Macro Summary:\n{macro_summary}")
@@ -240,4 +606,9 @@ if __name__ == '__main__':
     assert volatility_s.isnull().sum() == 1 # First entry is NaN due to window
     assert not volatility_s.dropna().empty
 
+    # ±inf (returns off a zero price) only blanks the windows containing it, as in pandas
+    inf_returns = pd.Series([0.01, 0.02, np.inf, 0.01, 0.03, 0.02, 0.01, -np.inf, 0.05, 0.04, 0.02])
+    pd.testing.assert_series_equal(calculate_rolling_volatility_std_dev(inf_returns, window=3),
+                                   inf_returns.rolling(window=3).std())
+
     logger.info("--- data_transformer.py direct execution tests completed ---")
@@ -1,14 +1,56 @@
+from __future__ import annotations
+
 import sqlite3
-import pandas as pd
+import atexit
+import collections
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import queue
+import threading
+import urllib.parse
+import weakref
+from typing import Iterable, Iterator
 import os
+from typing import TYPE_CHECKING
 import logging # Keep this for type hinting if needed, though utils.setup_logger is primary
 
 from src import utils
 from src import config
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Initialize logger
 logger = utils.setup_logger(__name__)
 
+# pandas, pyarrow and ADBC are imported on first use: connection, schema and raw SQL
+# paths (get_db_connection, initialize_database, ...) never touch them, and pandas alone
+# dominates the module's import time.
+def _pd():
+    """Returns the pandas module, importing it on first call."""
+    import pandas
+    return pandas
+
+@functools.cache
+def _pyarrow():
+    """Returns pyarrow with pyarrow.parquet loaded, or None if it is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.parquet # Optional: enables the tuned Parquet defaults below
+    except ImportError:
+        return None
+    return pyarrow
+
+@functools.cache
+def _adbc_sqlite():
+    """Returns adbc_driver_sqlite.dbapi (columnar Arrow query results), or None if not installed."""
+    try:
+        import adbc_driver_sqlite.dbapi
+    except ImportError:
+        return None
+    return adbc_driver_sqlite.dbapi
+
 # --- Database Constants (Consider moving to config if they become more complex) ---
 # Define table schemas here for clarity or fetch from a dedicated schema definition module later
 OHLCV_TABLE_SCHEMA = {
@@ -18,7 +60,7 @@ OHLCV_TABLE_SCHEMA = {
     "high": "REAL",
     "low": "REAL",
     "close": "REAL",
-    "volume": "INTEGER",
+    "volume": "REAL", # Fractional for crypto; STRICT tables reject non-integral values in INTEGER columns
     "source_api": "TEXT", # e.g., 'gemini', 'finnhub', 'yfinance_daily', 'yfinance_intraday'
     "data_type": "TEXT", # e.g., 'crypto', 'stock', 'forex', 'commodity'
     "timeframe": "TEXT" # e.g., '1D', '1H', '5min'
@@ -46,13 +88,89 @@ FINANCIAL_EVENTS_PRIMARY_KEYS = ["event_id"] # Or a composite like ['event_type'
 
 
 # --- Database Connection ---
-def get_db_connection(db_path: str = None, in_memory: bool = False) -> sqlite3.Connection:
+class _TunedConnection(sqlite3.Connection):
+    """sqlite3.Connection that refreshes planner statistics (PRAGMA optimize) before closing."""
+    def close(self):
+        try:
+            self.execute("PRAGMA optimize;")
+        except sqlite3.Error: # Already closed, or the database is read-only/locked
+            pass
+        super().close()
+
+# Connections still open at interpreter exit get PRAGMA optimize too (weakly held, never kept alive)
+_open_connections = weakref.WeakSet()
+
+@atexit.register
+def _optimize_open_connections():
+    for conn in list(_open_connections):
+        try:
+            conn.execute("PRAGMA optimize;")
+        except sqlite3.Error:
+            pass
+
+def close_db_connection(conn: sqlite3.Connection):
+    """
+    Runs PRAGMA optimize (refreshing sqlite_stat1 so the planner keeps using the composite
+    indexes) and closes conn. Connections from get_db_connection already do this in close().
+    """
+    if not isinstance(conn, _TunedConnection):
+        try:
+            conn.execute("PRAGMA optimize;")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed before closing connection: {e}")
+    conn.close()
+
+def _schedule_optimize(conn: sqlite3.Connection, interval: float, lock: threading.Lock) -> threading.Event:
+    """
+    Runs PRAGMA optimize on conn every interval seconds from a daemon thread, holding lock so
+    it never lands inside another thread's transaction. Stops when the returned Event is set
+    or conn is closed or garbage-collected.
+
+    Raises:
+        ValueError: If conn was not opened by get_db_connection with check_same_thread=False.
+    """
+    if getattr(conn, "check_same_thread", True):
+        raise ValueError("Periodic PRAGMA optimize needs a connection from "
+                         "get_db_connection(..., check_same_thread=False).")
+    conn_ref = weakref.ref(conn)
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            target = conn_ref()
+            if target is None:
+                return
+            with lock:
+                try:
+                    target.execute("PRAGMA optimize;")
+                except sqlite3.ProgrammingError as e: # Closed
+                    logger.debug(f"Stopping periodic PRAGMA optimize: {e}")
+                    return
+                except sqlite3.Error as e:
+                    logger.warning(f"Periodic PRAGMA optimize failed: {e}")
+            del target # Do not keep the connection alive while waiting
+
+    threading.Thread(target=run, name="sqlite-optimize", daemon=True).start()
+    return stop
+
+def _apply_pragmas(conn: sqlite3.Connection, set_journal_mode: bool = True):
+    """Applies config.SQLITE_PRAGMAS (WAL, synchronous=NORMAL, cache/mmap sizes, busy timeout)."""
+    for pragma, value in config.SQLITE_PRAGMAS.items():
+        if value is None or (not set_journal_mode and pragma == "journal_mode"):
+            continue
+        conn.execute(f"PRAGMA {pragma}={value};")
+
+def get_db_connection(db_path: str = None, in_memory: bool = False,
+                      read_only: bool = False, check_same_thread: bool = True) -> sqlite3.Connection:
     """
     Establishes a connection to the SQLite database.
 
     Args:
         db_path: Path to the database file. Uses config.DATABASE_PATH if None.
         in_memory: If True, creates an in-memory database.
+        read_only: If True, opens an existing database file with mode=ro.
+        check_same_thread: Passed to sqlite3.connect; False allows sharing across threads.
+        PRAGMAs from config.SQLITE_PRAGMAS are applied to the new connection.
 
     Returns:
         sqlite3.Connection object.
@@ -64,18 +182,28 @@ def get_db_connection(db_path: str = None, in_memory: bool = False) -> sqlite3.C
         db_path_to_use = ":memory:"
         logger.info("Connecting to in-memory SQLite database.")
     else:
-        db_path_to_use = db_path if db_path is not None else config.DATABASE_PATH
+        db_path_to_use = db_path if db_path is not None else getattr(config, "DATABASE_PATH", None)
         if db_path_to_use is None:
             raise utils.ConfigError("DATABASE_PATH is not set in config and no db_path provided.")
 
         # Ensure the directory for the database file exists
         db_dir = os.path.dirname(db_path_to_use)
-        if db_dir: # Only if db_path_to_use includes a directory
+        if db_dir and not read_only: # Only if db_path_to_use includes a directory
             utils.ensure_directory_exists(db_dir)
-        logger.info(f"Connecting to SQLite database at: {db_path_to_use}")
+        logger.info(f"Connecting to SQLite database at: {db_path_to_use}{' (read-only)' if read_only else ''}")
 
     try:
-        conn = sqlite3.connect(db_path_to_use, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+        if read_only and not in_memory:
+            target, uri = f"file:{urllib.parse.quote(os.path.abspath(db_path_to_use))}?mode=ro", True
+        else:
+            target, uri = db_path_to_use, False
+        conn = sqlite3.connect(target, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                               factory=_TunedConnection, uri=uri, check_same_thread=check_same_thread)
+        # WAL + synchronous=NORMAL avoids an fsync per commit on the upsert-heavy write path.
+        # journal_mode is a property of the file, so only writable file connections set it.
+        _apply_pragmas(conn, set_journal_mode=not (in_memory or read_only))
+        conn.check_same_thread = check_same_thread # Checked by _schedule_optimize
+        _open_connections.add(conn)
         # Enable foreign key support if needed, though not explicitly used in these schemas yet
         # conn.execute("PRAGMA foreign_keys = ON;")
         return conn
@@ -84,141 +212,365 @@ def get_db_connection(db_path: str = None, in_memory: bool = False) -> sqlite3.C
         raise utils.DataProcessingError(f"Failed to connect to database '{db_path_to_use}': {e}")
 
 
-# --- Table Creation Functions ---
-def create_table_ohlcv(conn: sqlite3.Connection):
-    """Creates the ohlcv_data table if it doesn't exist."""
+class DBPool:
+    """
+    Long-lived connections to one database file, so callers stop reopening it per operation:
+    a single read-write connection shared under a lock, plus up to max_readers read-only
+    connections checked out per block. With WAL, readers run alongside the writer.
+
+    Usage:
+        pool = DBPool(db_path)
+        with pool.writer() as conn:
+            save_dataframe_to_db(df, "ohlcv_data", conn, primary_keys=OHLCV_PRIMARY_KEYS)
+        with pool.reader() as conn:
+            df = read_dataframe_from_db("SELECT ...", conn)
+        pool.close()
+    """
+    def __init__(self, db_path: str | None = None, max_readers: int = 4):
+        # Opening the writer first creates the file (and its WAL) before any read-only open
+        self._writer = get_db_connection(db_path, check_same_thread=False)
+        self._db_path = self._writer.execute("PRAGMA database_list;").fetchone()[2]
+        self._writer_lock = threading.Lock()
+        self._max_readers = max_readers
+        self._idle_readers = queue.Queue(max_readers)
+        self._opened_readers = 0 # Readers opened so far; never more than max_readers
+        self._readers_lock = threading.Lock()
+        self._optimize_stops = []
+
+    @contextlib.contextmanager
+    def writer(self):
+        """Yields the shared read-write connection, holding it exclusively for the block."""
+        with self._writer_lock:
+            yield self._writer
+
+    def schedule_optimize(self, interval: float = 15 * 60) -> threading.Event:
+        """
+        Re-runs PRAGMA optimize on the writer every interval seconds under the writer lock,
+        until close() or the returned Event is set.
+        """
+        stop = _schedule_optimize(self._writer, interval, self._writer_lock)
+        self._optimize_stops.append(stop)
+        return stop
+
+    def _checkout_reader(self) -> sqlite3.Connection:
+        """An idle reader, a newly opened one while under max_readers, or else waits for one."""
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._readers_lock:
+            open_new = self._opened_readers < self._max_readers
+            if open_new:
+                self._opened_readers += 1
+        if not open_new:
+            return self._idle_readers.get()
+        try:
+            return get_db_connection(self._db_path, read_only=True, check_same_thread=False)
+        except BaseException:
+            with self._readers_lock:
+                self._opened_readers -= 1
+            raise
+
+    @contextlib.contextmanager
+    def reader(self):
+        """Yields a read-only connection from the pool, returning it when the block exits."""
+        conn = self._checkout_reader()
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put(conn)
+
+    def close(self):
+        """Closes the writer and every idle reader; call once no reader() block is active."""
+        for stop in self._optimize_stops:
+            stop.set()
+        while True:
+            try:
+                conn = self._idle_readers.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._readers_lock:
+                self._opened_readers -= 1
+        with self._writer_lock:
+            self._writer.close()
+
+
+@contextlib.contextmanager
+def _immediate_transaction(conn: sqlite3.Connection):
+    """
+    Runs the block inside one explicit BEGIN IMMEDIATE ... COMMIT (ROLLBACK on error),
+    bypassing sqlite3's implicit transaction handling so a bulk write costs a single commit.
+    """
+    if conn.in_transaction:
+        conn.commit() # Flush whatever the implicit transaction had pending, as conn.commit() did before
+    previous_isolation_level = conn.isolation_level
+    conn.isolation_level = None
     try:
-        cols_with_types = [f'"{col_name}" {col_type}' for col_name, col_type in OHLCV_TABLE_SCHEMA.items()]
-        # Primary key definition: making it composite
-        pk_cols_str = ", ".join([f'"{pk}"' for pk in OHLCV_PRIMARY_KEYS])
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK;")
+            raise
+        conn.execute("COMMIT;")
+    finally:
+        conn.isolation_level = previous_isolation_level
 
-        create_table_sql = f"""
-        CREATE TABLE IF NOT EXISTS ohlcv_data (
+
+# --- Table Creation Functions ---
+# STRICT tables (SQLite >= 3.37) enforce the declared column types instead of storing
+# whatever each value happens to be; older libraries get ordinary tables.
+_STRICT_TABLES = sqlite3.sqlite_version_info >= (3, 37, 0)
+
+def _create_table_sql(table_name: str, schema: tuple, primary_keys: tuple) -> str:
+    """CREATE TABLE IF NOT EXISTS statement for (column, type) pairs; see _SCHEMA_META."""
+    cols_with_types = [f'"{col_name}" {col_type}' for col_name, col_type in schema]
+    # Primary key definition: composite where more than one column is given
+    pk_cols_str = ", ".join([f'"{pk}"' for pk in primary_keys])
+    table_options = " STRICT" if _STRICT_TABLES else ""
+    return f"""
+        CREATE TABLE IF NOT EXISTS {table_name} (
             {', '.join(cols_with_types)},
             PRIMARY KEY ({pk_cols_str})
-        );
+        ){table_options};
         """
-        conn.execute(create_table_sql)
 
-        # Example Indexes (add more as needed based on query patterns)
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_ohlcv_symbol_date ON ohlcv_data (symbol, date);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_ohlcv_source_api ON ohlcv_data (source_api);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_ohlcv_data_type ON ohlcv_data (data_type);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_ohlcv_timeframe ON ohlcv_data (timeframe);")
+# Table name -> (schema, primary keys, index statements)
+# Every index is another B-tree each upsert must update, so only composite indexes that serve
+# the lookups in this module are kept. Each leads with the equality filters and ends with date,
+# making the filtered MAX(date) in get_latest_timestamp an index-only seek. The DROPs remove
+# the former low-cardinality single-column indexes from existing database files.
+_TABLE_DEFINITIONS = {
+    "ohlcv_data": (OHLCV_TABLE_SCHEMA, OHLCV_PRIMARY_KEYS, [
+        "DROP INDEX IF EXISTS idx_ohlcv_symbol_date;",
+        "DROP INDEX IF EXISTS idx_ohlcv_source_api;",
+        "DROP INDEX IF EXISTS idx_ohlcv_data_type;",
+        "DROP INDEX IF EXISTS idx_ohlcv_timeframe;",
+        "CREATE INDEX IF NOT EXISTS idx_ohlcv_symbol_timeframe_source_date ON ohlcv_data (symbol, timeframe, source_api, date);",
+    ]),
+    "macro_indicators": (MACRO_INDICATORS_TABLE_SCHEMA, MACRO_INDICATORS_PRIMARY_KEYS, [
+        # (indicator_name, date) is already the leading part of the primary key index
+        "DROP INDEX IF EXISTS idx_macro_indicator_name_date;",
+        "DROP INDEX IF EXISTS idx_macro_source_api;",
+        "CREATE INDEX IF NOT EXISTS idx_macro_indicator_source_date ON macro_indicators (indicator_name, source_api, date);",
+    ]),
+    "financial_events": (FINANCIAL_EVENTS_TABLE_SCHEMA, FINANCIAL_EVENTS_PRIMARY_KEYS, [
+        "DROP INDEX IF EXISTS idx_financial_event_symbol;",
+        "DROP INDEX IF EXISTS idx_financial_event_source_api;",
+        "CREATE INDEX IF NOT EXISTS idx_financial_event_type_date ON financial_events (event_type, date);",
+        "CREATE INDEX IF NOT EXISTS idx_financial_event_symbol_date ON financial_events (symbol, date);",
+    ]),
+}
+
+def _table_ddl(table_name: str) -> str:
+    """CREATE TABLE plus all CREATE INDEX statements for table_name as one script."""
+    meta = _SCHEMA_META[table_name]
+    return meta.create_sql + "\n".join(meta.index_sql)
 
-        conn.commit()
-        logger.info("Table 'ohlcv_data' checked/created successfully with indexes.")
+def _create_tables(conn: sqlite3.Connection, table_names: list[str]):
+    """
+    Runs the DDL for table_names as a single executescript inside one BEGIN/COMMIT,
+    so all statements are parsed in one call and made durable with one commit.
+    """
+    script = "\n".join(_table_ddl(name) for name in table_names)
+    try:
+        conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
     except sqlite3.Error as e:
-        logger.error(f"Error creating table 'ohlcv_data': {e}", exc_info=True)
-        raise utils.DataProcessingError(f"Failed to create table 'ohlcv_data': {e}")
+        if conn.in_transaction:
+            conn.rollback()
+        logger.error(f"Error creating tables {table_names}: {e}", exc_info=True)
+        raise utils.DataProcessingError(f"Failed to create tables {table_names}: {e}")
+    for name in table_names:
+        logger.info(f"Table '{name}' checked/created successfully with indexes.")
+
+def create_table_ohlcv(conn: sqlite3.Connection):
+    """Creates the ohlcv_data table if it doesn't exist."""
+    _create_tables(conn, ["ohlcv_data"])
 
 def create_table_macro_indicators(conn: sqlite3.Connection):
     """Creates the macro_indicators table if it doesn't exist."""
-    try:
-        cols_with_types = [f'"{col_name}" {col_type}' for col_name, col_type in MACRO_INDICATORS_TABLE_SCHEMA.items()]
-        pk_cols_str = ", ".join([f'"{pk}"' for pk in MACRO_INDICATORS_PRIMARY_KEYS])
-
-        create_table_sql = f"""
-        CREATE TABLE IF NOT EXISTS macro_indicators (
-            {', '.join(cols_with_types)},
-            PRIMARY KEY ({pk_cols_str})
-        );
-        """
-        conn.execute(create_table_sql)
-
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_macro_indicator_name_date ON macro_indicators (indicator_name, date);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_macro_source_api ON macro_indicators (source_api);")
-
-        conn.commit()
-        logger.info("Table 'macro_indicators' checked/created successfully with indexes.")
-    except sqlite3.Error as e:
-        logger.error(f"Error creating table 'macro_indicators': {e}", exc_info=True)
-        raise utils.DataProcessingError(f"Failed to create table 'macro_indicators': {e}")
+    _create_tables(conn, ["macro_indicators"])
 
 def create_table_financial_events(conn: sqlite3.Connection):
     """Creates the financial_events table if it doesn't exist."""
-    try:
-        cols_with_types = [f'"{col_name}" {col_type}' for col_name, col_type in FINANCIAL_EVENTS_TABLE_SCHEMA.items()]
-        pk_cols_str = ", ".join([f'"{pk}"' for pk in FINANCIAL_EVENTS_PRIMARY_KEYS])
+    _create_tables(conn, ["financial_events"])
 
-        create_table_sql = f"""
-        CREATE TABLE IF NOT EXISTS financial_events (
-            {', '.join(cols_with_types)},
-            PRIMARY KEY ({pk_cols_str})
-        );
-        """
-        conn.execute(create_table_sql)
+def initialize_database(conn: sqlite3.Connection, optimize_interval: float | None = None,
+                        optimize_lock: threading.Lock | None = None) -> threading.Event | None:
+    """
+    Initializes all tables in the database in a single transaction.
 
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_financial_event_type_date ON financial_events (event_type, date);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_financial_event_symbol ON financial_events (symbol);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_financial_event_source_api ON financial_events (source_api);")
+    Args:
+        conn: SQLite connection object.
+        optimize_interval: If set (e.g. 15 * 60), PRAGMA optimize is re-run on conn every
+                           optimize_interval seconds until conn is closed or the returned
+                           Event is set. conn must come from get_db_connection with
+                           check_same_thread=False. For a DBPool, use pool.schedule_optimize().
+        optimize_lock: Lock that every thread using conn holds around its statements and
+                       transactions; the periodic optimize holds it too. Required with
+                       optimize_interval.
 
-        conn.commit()
-        logger.info("Table 'financial_events' checked/created successfully with indexes.")
-    except sqlite3.Error as e:
-        logger.error(f"Error creating table 'financial_events': {e}", exc_info=True)
-        raise utils.DataProcessingError(f"Failed to create table 'financial_events': {e}")
+    Returns:
+        Event that stops the periodic optimize when set, or None without optimize_interval.
 
-def initialize_database(conn: sqlite3.Connection):
-    """Initializes all tables in the database."""
+    Raises:
+        ValueError: If optimize_interval is set without optimize_lock, or conn does not
+                    allow cross-thread use.
+    """
+    if optimize_interval and optimize_lock is None:
+        raise ValueError("optimize_interval needs the optimize_lock that guards conn.")
     logger.info("Initializing database schema...")
-    create_table_ohlcv(conn)
-    create_table_macro_indicators(conn)
-    create_table_financial_events(conn)
+    _create_tables(conn, list(_TABLE_DEFINITIONS))
+    stop = _schedule_optimize(conn, optimize_interval, optimize_lock) if optimize_interval else None
     logger.info("Database schema initialization complete.")
+    return stop
 
 
 # --- DataFrame to SQLite ---
-def save_dataframe_to_db(df: pd.DataFrame, table_name: str, conn: sqlite3.Connection,
-                         if_exists: str = "append", primary_keys: list[str] | None = None):
+@functools.lru_cache(maxsize=64)
+def _build_upsert_sql(table_name: str, columns: tuple, primary_keys: tuple) -> str:
+    """
+    INSERT ... ON CONFLICT(primary_keys) DO UPDATE SET <other columns> = excluded.<column>.
+    Falls back to DO NOTHING when every column is part of the key.
+    Cached, and since the text is identical across calls sqlite3's per-connection
+    statement cache also reuses the prepared statement instead of re-preparing it.
+    """
+    cols = ', '.join([f'"{c}"' for c in columns])
+    placeholders = ', '.join(['?'] * len(columns))
+    conflict_cols = ', '.join([f'"{pk}"' for pk in primary_keys])
+    update_cols = [c for c in columns if c not in primary_keys]
+    if update_cols:
+        assignments = ', '.join([f'"{c}" = excluded."{c}"' for c in update_cols])
+        on_conflict = f"DO UPDATE SET {assignments}"
+    else:
+        on_conflict = "DO NOTHING"
+    return (f"INSERT INTO {table_name} ({cols}) VALUES ({placeholders}) "
+            f"ON CONFLICT ({conflict_cols}) {on_conflict}")
+
+# Everything derivable from a known table's schema, built once at import so the save path
+# only compares column order and looks the SQL up.
+SchemaMeta = collections.namedtuple(
+    "SchemaMeta", ["columns", "primary_keys", "placeholders", "create_sql", "index_sql", "upsert_sql"])
+
+def _build_schema_meta(table_name: str) -> SchemaMeta:
+    schema, primary_keys, index_sql = _TABLE_DEFINITIONS[table_name]
+    columns, primary_keys = tuple(schema), tuple(primary_keys)
+    return SchemaMeta(
+        columns=columns,
+        primary_keys=primary_keys,
+        placeholders=", ".join(["?"] * len(columns)),
+        create_sql=_create_table_sql(table_name, tuple(schema.items()), primary_keys),
+        index_sql=tuple(index_sql),
+        upsert_sql=_build_upsert_sql(table_name, columns, primary_keys),
+    )
+
+_SCHEMA_META: dict[str, SchemaMeta] = {name: _build_schema_meta(name) for name in _TABLE_DEFINITIONS}
+
+def _upsert_sql_for(table_name: str, columns: tuple, primary_keys: tuple) -> str:
+    """Precomputed upsert SQL when columns/keys match the table's schema exactly, else built (and cached)."""
+    meta = _SCHEMA_META.get(table_name)
+    if meta is not None and meta.columns == columns and meta.primary_keys == primary_keys:
+        return meta.upsert_sql
+    return _build_upsert_sql(table_name, columns, primary_keys)
+
+def _format_datetimes(series: pd.Series, fmt: str) -> pd.Series:
+    """
+    Same result as series.dt.strftime(fmt), but each distinct timestamp is formatted once.
+    OHLCV frames repeat every date across symbols, so this is far fewer strftime calls.
+    """
+    import numpy as np
+    pd = _pd()
+    codes, uniques = pd.factorize(series)
+    formatted = np.full(len(codes), np.nan, dtype=object) # NaT -> NaN, as dt.strftime gives
+    if len(uniques):
+        valid = codes >= 0
+        formatted[valid] = np.asarray(uniques.strftime(fmt), dtype=object)[codes[valid]]
+    return pd.Series(formatted, index=series.index, name=series.name)
+
+_DEFAULT_CHUNK_SIZE = 50_000
+
+def _iter_frame_chunks(data: pd.DataFrame | Iterable[pd.DataFrame], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Yields the non-empty chunks of a DataFrame (sliced by chunk_size rows) or of an iterable of DataFrames."""
+    frames = [data] if isinstance(data, _pd().DataFrame) else data
+    for frame in frames:
+        for start in range(0, len(frame), max(1, chunk_size)):
+            yield frame.iloc[start:start + chunk_size]
+
+def _prepare_upsert_chunk(chunk: pd.DataFrame, primary_keys: list[str]) -> pd.DataFrame:
+    """Deduplicates a chunk on its primary keys and converts datetime columns to SQLite text."""
+    # Shallow copy: converted columns are replaced whole, never written into
+    df_copy = chunk.copy(deep=False)
+
+    # Collapse repeated keys in memory (last row wins, as sequential upserts would)
+    # so each key is written to the B-tree once
+    duplicated = df_copy.duplicated(subset=primary_keys, keep='last')
+    if duplicated.any():
+        logger.debug("Dropping %d rows with duplicate primary keys before upsert.", int(duplicated.sum()))
+        df_copy = df_copy[~duplicated]
+
+    # Convert Timestamp objects to ISO format strings if they are not already
+    for col in df_copy.select_dtypes(include=['datetime64[ns]', 'datetime64[ns, UTC]']).columns:
+        logger.debug("Converting column %s to ISO 8601 string format for SQLite.", col)
+        df_copy[col] = _format_datetimes(df_copy[col], '%Y-%m-%d %H:%M:%S') # Adjust format as needed
+    return df_copy
+
+def save_dataframe_to_db(df: pd.DataFrame | Iterable[pd.DataFrame], table_name: str, conn: sqlite3.Connection,
+                         if_exists: str = "append", primary_keys: list[str] | None = None,
+                         chunk_size: int = _DEFAULT_CHUNK_SIZE):
     """
     Saves a Pandas DataFrame to a specified SQLite table with an upsert mechanism.
 
     Args:
-        df: DataFrame to save.
+        df: DataFrame to save, or an iterable of DataFrames (e.g. from read_dataframe_chunks)
+            that are written in order without being concatenated.
         table_name: Name of the table to save to.
         conn: SQLite connection object.
         if_exists: How to behave if the table already exists.
-                   'append': Appends new rows. Uses INSERT OR REPLACE for rows with
-                             conflicting primary keys if primary_keys are provided.
+                   'append': Appends new rows. Uses INSERT ... ON CONFLICT DO UPDATE for rows
+                             with conflicting primary keys if primary_keys are provided.
                    'replace': Drops the table before inserting new values.
                    'fail': Raises ValueError if table exists.
         primary_keys: List of column names that form the primary key.
                       Required for 'append' with upsert behavior.
                       If 'append' and primary_keys is None, it will be a simple append,
                       which might lead to duplicates or errors if PKs are violated.
+        chunk_size: Maximum rows converted and sent to SQLite per batch. Upserts of all chunks
+                    share a single transaction.
     """
-    if df.empty:
+    if isinstance(df, _pd().DataFrame) and df.empty:
         logger.info(f"DataFrame for table '{table_name}' is empty. Nothing to save.")
         return
 
+    rows_written = 0
     try:
         if if_exists == "append" and primary_keys:
-            # Using INSERT OR REPLACE for simplicity, assuming primary keys are defined in the table.
-            # This will replace rows if their primary key already exists.
-            cols = ', '.join([f'"{c}"' for c in df.columns])
-            placeholders = ', '.join(['?'] * len(df.columns))
-            sql_upsert = f"INSERT OR REPLACE INTO {table_name} ({cols}) VALUES ({placeholders})"
-
-            # Convert Timestamp objects to ISO format strings if they are not already
-            df_copy = df.copy()
-            for col in df_copy.select_dtypes(include=['datetime64[ns]', 'datetime64[ns, UTC]']).columns:
-                logger.debug(f"Converting column {col} to ISO 8601 string format for SQLite.")
-                df_copy[col] = df_copy[col].dt.strftime('%Y-%m-%d %H:%M:%S') # Adjust format as needed
-
-            conn.executemany(sql_upsert, df_copy.to_records(index=False).tolist())
-            conn.commit()
-            logger.info(f"{len(df)} rows upserted into table '{table_name}'.")
+            # Native UPSERT, assuming primary_keys match the table's PRIMARY KEY. Conflicting rows
+            # are updated in place rather than deleted and re-inserted as INSERT OR REPLACE does.
+            with _immediate_transaction(conn):
+                for chunk in _iter_frame_chunks(df, chunk_size):
+                    df_copy = _prepare_upsert_chunk(chunk, primary_keys)
+                    sql_upsert = _upsert_sql_for(table_name, tuple(df_copy.columns), tuple(primary_keys))
+                    # executemany pulls rows from the lazy tuple iterator one at a time, so no
+                    # intermediate recarray or list of all rows is built
+                    conn.executemany(sql_upsert, df_copy.itertuples(index=False, name=None))
+                    rows_written += len(df_copy)
+            logger.info(f"{rows_written} rows upserted into table '{table_name}'.")
         else:
-            # Standard pandas to_sql for 'replace', 'fail', or simple 'append'
-            df.to_sql(table_name, conn, if_exists=if_exists, index=False)
-            logger.info(f"DataFrame saved to table '{table_name}' with if_exists='{if_exists}'.")
+            # Standard pandas to_sql for 'replace', 'fail', or simple 'append'.
+            # Only the first chunk applies if_exists; later chunks append to it.
+            mode = if_exists
+            for chunk in _iter_frame_chunks(df, chunk_size):
+                chunk.to_sql(table_name, conn, if_exists=mode, index=False)
+                mode = "append"
+                rows_written += len(chunk)
+            logger.info(f"{rows_written} rows saved to table '{table_name}' with if_exists='{if_exists}'.")
 
     except sqlite3.Error as e:
         logger.error(f"SQLite error saving DataFrame to table '{table_name}': {e}", exc_info=True)
         conn.rollback() # Rollback on error
         raise utils.DataProcessingError(f"Failed to save DataFrame to table '{table_name}': {e}")
-    except Exception as e: # Catch other potential errors like issues with df.to_records
+    except Exception as e: # Catch other potential errors like unsupported value types
         logger.error(f"Unexpected error saving DataFrame to table '{table_name}': {e}", exc_info=True)
         if conn: conn.rollback()
         raise utils.DataProcessingError(f"Unexpected error saving DataFrame to table '{table_name}': {e}")
@@ -241,7 +593,7 @@ def read_dataframe_from_db(query: str, conn: sqlite3.Connection, params: tuple |
         DataProcessingError: If data cannot be read.
     """
     try:
-        df = pd.read_sql_query(query, conn, params=params)
+        df = _pd().read_sql_query(query, conn, params=params)
         logger.info(f"Successfully executed query and fetched {len(df)} rows.")
         return df
     except sqlite3.Error as e:
@@ -251,8 +603,80 @@ def read_dataframe_from_db(query: str, conn: sqlite3.Connection, params: tuple |
         logger.error(f"Unexpected error reading DataFrame from database with query '{query[:100]}...': {e}", exc_info=True)
         raise utils.DataProcessingError(f"Unexpected error reading DataFrame from database: {e}")
 
+def read_dataframe_chunks(query: str, conn: sqlite3.Connection, chunksize: int = _DEFAULT_CHUNK_SIZE,
+                          params: tuple | None = None) -> Iterator[pd.DataFrame]:
+    """
+    Reads query results lazily as a sequence of DataFrames of at most chunksize rows,
+    so memory stays bounded by one chunk regardless of the result size.
+
+    Raises:
+        DataProcessingError: If data cannot be read (raised while iterating).
+    """
+    rows_read = 0
+    try:
+        for chunk in _pd().read_sql_query(query, conn, params=params, chunksize=chunksize):
+            rows_read += len(chunk)
+            yield chunk
+    except sqlite3.Error as e:
+        logger.error(f"Error reading DataFrame chunks from database with query '{query[:100]}...': {e}", exc_info=True)
+        raise utils.DataProcessingError(f"Failed to read DataFrame chunks from database: {e}")
+    logger.info(f"Successfully streamed {rows_read} rows in chunks of up to {chunksize}.")
+
+def read_arrow_from_db(query: str, conn: sqlite3.Connection, params: tuple | None = None) -> pd.DataFrame:
+    """
+    Like read_dataframe_from_db, but returns Arrow-backed columns (pd.ArrowDtype).
+
+    With adbc_driver_sqlite installed, the result is fetched column-wise as an Arrow table
+    through a separate ADBC connection to the same file (so it only sees committed data),
+    skipping the per-row Python tuples of the DB-API path. Otherwise, and for in-memory
+    databases, it falls back to read_dataframe_from_db and converts the dtypes.
+
+    Raises:
+        DataProcessingError: If data cannot be read.
+    """
+    db_file = conn.execute("PRAGMA database_list;").fetchone()[2]
+    adbc_sqlite = _adbc_sqlite()
+    if adbc_sqlite is not None and db_file:
+        try:
+            with adbc_sqlite.connect(db_file) as adbc_conn, adbc_conn.cursor() as cursor:
+                cursor.execute(query, params or ())
+                table = cursor.fetch_arrow_table()
+            df = table.to_pandas(types_mapper=_pd().ArrowDtype)
+            logger.info(f"Successfully executed query via ADBC and fetched {len(df)} rows.")
+            return df
+        except Exception as e:
+            logger.error(f"Error reading Arrow table from database with query '{query[:100]}...': {e}", exc_info=True)
+            raise utils.DataProcessingError(f"Failed to read Arrow table from database: {e}")
+
+    df = read_dataframe_from_db(query, conn, params=params)
+    if _pyarrow() is not None:
+        df = df.convert_dtypes(dtype_backend="pyarrow")
+    return df
+
 
 # --- Get Latest Timestamp ---
+# Not cached across calls: the filtered MAX(date) is an index-only seek, and a cache would miss
+# writes made through other connections (e.g. DBPool's writer) or processes.
+_MAX_SQL_VARIABLES = 500 # Symbols per IN (...) query, well under SQLite's bound-parameter limit
+
+# Identifiers cannot be bound as parameters, so only known tables/columns are ever interpolated.
+# The fixed set also means the query prefixes can be built once here.
+_ALLOWED_TABLES = frozenset(_TABLE_DEFINITIONS)
+_ALLOWED_DATE_COLUMNS = frozenset({"date"})
+_MAX_DATE_SQL = {(table, column): f'SELECT MAX("{column}") FROM {table}'
+                 for table in _ALLOWED_TABLES for column in _ALLOWED_DATE_COLUMNS}
+# The per-symbol (batched) form only applies to tables that have a symbol column
+_SYMBOL_TABLES = frozenset(table for table, (schema, _, _) in _TABLE_DEFINITIONS.items() if "symbol" in schema)
+_SYMBOL_MAX_DATE_SQL = {(table, column): f'SELECT symbol, MAX("{column}") FROM {table}'
+                        for table in _SYMBOL_TABLES for column in _ALLOWED_DATE_COLUMNS}
+
+def _check_table_and_date_column(table_name: str, date_column: str):
+    """Raises ValueError unless table_name/date_column are in the allow-lists above."""
+    if table_name not in _ALLOWED_TABLES:
+        raise ValueError(f"Unknown table '{table_name}'. Expected one of {sorted(_ALLOWED_TABLES)}.")
+    if date_column not in _ALLOWED_DATE_COLUMNS:
+        raise ValueError(f"Unknown date column '{date_column}'. Expected one of {sorted(_ALLOWED_DATE_COLUMNS)}.")
+
 def get_latest_timestamp(table_name: str, conn: sqlite3.Connection,
                          date_column: str = "date",
                          symbol: str | None = None,
@@ -272,7 +696,11 @@ def get_latest_timestamp(table_name: str, conn: sqlite3.Connection,
 
     Returns:
         pd.Timestamp of the latest entry, or None if no data or error.
+
+    Raises:
+        ValueError: If table_name or date_column is not a known table/date column.
     """
+    _check_table_and_date_column(table_name, date_column)
     conditions = []
     params = []
 
@@ -287,12 +715,10 @@ def get_latest_timestamp(table_name: str, conn: sqlite3.Connection,
         params.append(timeframe)
 
     where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-    query = f"SELECT MAX({date_column}) FROM {table_name} {where_clause}"
+    query = f"{_MAX_DATE_SQL[(table_name, date_column)]} {where_clause}"
 
     try:
-        cursor = conn.cursor()
-        cursor.execute(query, tuple(params))
-        result = cursor.fetchone()
+        result = conn.execute(query, tuple(params)).fetchone()
 
         if result and result[0] is not None:
             # SQLite stores dates as TEXT, REAL, or INTEGER. Pandas can parse many string formats.
@@ -300,12 +726,12 @@ def get_latest_timestamp(table_name: str, conn: sqlite3.Connection,
             # If stored as unix epoch (INTEGER or REAL), specify unit.
             # Assuming ISO string format for now as per OHLCV_TABLE_SCHEMA.
             latest_ts_str = result[0]
-            latest_ts = pd.to_datetime(latest_ts_str)
+            latest_ts = _pd().to_datetime(latest_ts_str)
             logger.info(f"Latest timestamp for {table_name} (filters: symbol={symbol}, source_api={source_api}, timeframe={timeframe}): {latest_ts}")
-            return latest_ts
         else:
+            latest_ts = None
             logger.info(f"No timestamp found for {table_name} (filters: symbol={symbol}, source_api={source_api}, timeframe={timeframe}). Table might be empty or filters too restrictive.")
-            return None
+        return latest_ts
     except sqlite3.Error as e:
         logger.error(f"Error getting latest timestamp from '{table_name}': {e}", exc_info=True)
         # Not raising DataProcessingError here to allow flow to continue if this is optional
@@ -314,9 +740,97 @@ def get_latest_timestamp(table_name: str, conn: sqlite3.Connection,
         logger.error(f"Unexpected error processing latest timestamp from '{table_name}': {e}", exc_info=True)
         return None
 
+def get_latest_timestamps(table_name: str, conn: sqlite3.Connection, symbols: list[str],
+                          date_column: str = "date",
+                          source_api: str | None = None,
+                          timeframe: str | None = None) -> dict[str, pd.Timestamp | None]:
+    """
+    Batch form of get_latest_timestamp for many symbols: one GROUP BY query per
+    _MAX_SQL_VARIABLES symbols instead of one query each.
+
+    Returns:
+        Dict mapping each symbol to its latest pd.Timestamp, or None if it has no rows.
+
+    Raises:
+        ValueError: If table_name or date_column is not a known table/date column,
+                    or table_name has no symbol column.
+        DataProcessingError: If the query fails.
+    """
+    _check_table_and_date_column(table_name, date_column)
+    if table_name not in _SYMBOL_TABLES:
+        raise ValueError(f"Table '{table_name}' has no symbol column. Expected one of {sorted(_SYMBOL_TABLES)}.")
+    latest = dict.fromkeys(symbols)
+    extra_conditions = []
+    extra_params = []
+    if source_api:
+        extra_conditions.append("source_api = ?")
+        extra_params.append(source_api)
+    if timeframe and table_name == "ohlcv_data": # timeframe is specific to ohlcv
+        extra_conditions.append("timeframe = ?")
+        extra_params.append(timeframe)
+
+    unique_symbols = list(latest)
+    try:
+        for start in range(0, len(unique_symbols), _MAX_SQL_VARIABLES):
+            chunk = unique_symbols[start:start + _MAX_SQL_VARIABLES]
+            conditions = [f"symbol IN ({', '.join(['?'] * len(chunk))})"] + extra_conditions
+            query = (f"{_SYMBOL_MAX_DATE_SQL[(table_name, date_column)]} "
+                     f"WHERE {' AND '.join(conditions)} GROUP BY symbol")
+            for symbol, latest_ts_str in conn.execute(query, tuple(chunk) + tuple(extra_params)):
+                if latest_ts_str is not None:
+                    latest[symbol] = _pd().to_datetime(latest_ts_str)
+    except sqlite3.Error as e:
+        logger.error(f"Error getting latest timestamps from '{table_name}': {e}", exc_info=True)
+        raise utils.DataProcessingError(f"Failed to get latest timestamps from '{table_name}': {e}")
+
+    logger.info(f"Latest timestamps fetched for {len(latest)} symbols from {table_name}.")
+    return latest
+
 
 # --- Parquet Operations ---
-def save_df_to_parquet(df: pd.DataFrame, file_name: str, parquet_dir: str = None, **kwargs):
+# Symbol/source/type columns are highly repetitive, so dictionary pages + ZSTD shrink files
+# considerably. Only used with the pyarrow engine; explicit kwargs override any of these.
+_PARQUET_WRITE_DEFAULTS = {
+    "engine": "pyarrow",
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "row_group_size": 128_000,
+}
+_PARQUET_READ_DEFAULTS = {
+    "engine": "pyarrow",
+    "use_threads": True,
+}
+
+def _write_parquet_row_groups(df: pd.DataFrame, file_path: str, row_group_size: int,
+                              max_workers: int | None, **writer_kwargs):
+    """
+    Writes df with pyarrow.parquet.ParquetWriter, one row group per slice, against a schema
+    inferred once from the whole frame. Only the pandas -> Arrow conversion of the slices runs
+    on the thread pool (it releases the GIL); compression and writing stay in order on this
+    thread. At most max_workers converted slices are in flight, so memory stays bounded by a
+    few row groups rather than an Arrow copy of the whole frame.
+    """
+    pyarrow = _pyarrow()
+    schema = pyarrow.Schema.from_pandas(df, preserve_index=False)
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4) # ThreadPoolExecutor's default
+
+    def to_table(start: int):
+        chunk = df.iloc[start:start + row_group_size]
+        return pyarrow.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+            pyarrow.parquet.ParquetWriter(file_path, schema, **writer_kwargs) as writer:
+        pending = collections.deque()
+        for start in range(0, len(df), row_group_size):
+            pending.append(executor.submit(to_table, start))
+            if len(pending) >= workers:
+                writer.write_table(pending.popleft().result(), row_group_size=row_group_size)
+        while pending:
+            writer.write_table(pending.popleft().result(), row_group_size=row_group_size)
+
+def save_df_to_parquet(df: pd.DataFrame, file_name: str, parquet_dir: str = None,
+                       row_group_size: int | None = None, max_workers: int | None = None, **kwargs):
     """
     Saves a DataFrame to a Parquet file.
 
@@ -324,7 +838,13 @@ def save_df_to_parquet(df: pd.DataFrame, file_name: str, parquet_dir: str = None
         df: DataFrame to save.
         file_name: Name of the file (e.g., 'my_data.parquet'). Extension will be checked.
         parquet_dir: Directory to save the Parquet file. Uses config.PARQUET_DATA_DIR if None.
-        **kwargs: Additional arguments to pass to df.to_parquet().
+        row_group_size: Rows per row group (pyarrow only). Defaults to
+                        _PARQUET_WRITE_DEFAULTS['row_group_size'].
+        max_workers: Threads converting row-group slices to Arrow when the frame spans more
+                     than one (pyarrow only); compression stays single-threaded. None uses
+                     ThreadPoolExecutor's default; 1 writes through df.to_parquet instead.
+        **kwargs: Additional arguments to pass to df.to_parquet(). With the pyarrow engine these
+                  override _PARQUET_WRITE_DEFAULTS (ZSTD level 3, dictionary encoding).
     """
     if df.empty:
         logger.info(f"DataFrame for Parquet file '{file_name}' is empty. Nothing to save.")
@@ -343,7 +863,19 @@ def save_df_to_parquet(df: pd.DataFrame, file_name: str, parquet_dir: str = None
     file_path = os.path.join(target_dir, file_name)
 
     try:
-        df.to_parquet(file_path, index=False, **kwargs)
+        # fastparquet rejects pyarrow's writer options, so the defaults only apply to pyarrow
+        use_pyarrow = _pyarrow() is not None and kwargs.get("engine", "pyarrow") == "pyarrow"
+        if use_pyarrow:
+            kwargs = {**_PARQUET_WRITE_DEFAULTS, **kwargs}
+            if row_group_size is not None:
+                kwargs["row_group_size"] = row_group_size
+
+        group_size = kwargs.get("row_group_size")
+        if use_pyarrow and max_workers != 1 and group_size and len(df) > group_size:
+            writer_kwargs = {k: v for k, v in kwargs.items() if k not in ("engine", "row_group_size")}
+            _write_parquet_row_groups(df, file_path, group_size, max_workers, **writer_kwargs)
+        else:
+            df.to_parquet(file_path, index=False, **kwargs)
         logger.info(f"DataFrame successfully saved to Parquet: {file_path}")
     except Exception as e: # Pandas errors or other OS errors
         logger.error(f"Error saving DataFrame to Parquet file '{file_path}': {e}", exc_info=True)
@@ -358,7 +890,8 @@ def read_df_from_parquet(file_name: str, parquet_dir: str = None,
         file_name: Name of the Parquet file.
         parquet_dir: Directory where the Parquet file is located. Uses config.PARQUET_DATA_DIR if None.
         columns: List of columns to read. Reads all if None.
-        **kwargs: Additional arguments to pass to pd.read_parquet().
+        **kwargs: Additional arguments to pass to pd.read_parquet(). With the pyarrow engine these
+                  override _PARQUET_READ_DEFAULTS (multi-threaded read).
 
     Returns:
         Pandas DataFrame.
@@ -388,7 +921,9 @@ def read_df_from_parquet(file_name: str, parquet_dir: str = None,
 
 
     try:
-        df = pd.read_parquet(file_path, columns=columns, **kwargs)
+        if _pyarrow() is not None and kwargs.get("engine", "pyarrow") == "pyarrow":
+            kwargs = {**_PARQUET_READ_DEFAULTS, **kwargs}
+        df = _pd().read_parquet(file_path, columns=columns, **kwargs)
         logger.info(f"DataFrame successfully read from Parquet: {file_path} (read {len(df)} rows).")
         return df
     except FileNotFoundError:
@@ -401,18 +936,23 @@ def read_df_from_parquet(file_name: str, parquet_dir: str = None,
 
 if __name__ == '__main__':
     # This section is for basic testing when the script is run directly.
-    # It requires config.py to have DATABASE_PATH and PARQUET_DATA_DIR set.
+    # DATABASE_PATH and PARQUET_DATA_DIR fall back to temporary locations if config lacks them,
+    # and the timings logged below give a quick regression check on the save/read paths.
+    import tempfile
+    import time
+    import pandas as pd
 
     logger.info("--- Running database_manager.py direct execution tests ---")
 
     # Ensure essential config paths are set for testing
-    if not config.DATABASE_PATH:
+    temp_test_dir = tempfile.mkdtemp(prefix="database_manager_test_")
+    if not getattr(config, "DATABASE_PATH", None):
         # Create a temporary db path for testing if not defined in config
-        config.DATABASE_PATH = os.path.join(config.SRC_DIR, "temp_test_db.sqlite")
+        config.DATABASE_PATH = os.path.join(temp_test_dir, "temp_test_db.sqlite")
         logger.warning(f"config.DATABASE_PATH not set. Using temporary: {config.DATABASE_PATH}")
 
-    if not config.PARQUET_DATA_DIR:
-        config.PARQUET_DATA_DIR = os.path.join(os.path.dirname(config.SRC_DIR), "temp_test_parquet_data")
+    if not getattr(config, "PARQUET_DATA_DIR", None):
+        config.PARQUET_DATA_DIR = os.path.join(temp_test_dir, "temp_test_parquet_data")
         utils.ensure_directory_exists(config.PARQUET_DATA_DIR)
         logger.warning(f"config.PARQUET_DATA_DIR not set. Using temporary: {config.PARQUET_DATA_DIR}")
 
@@ -428,6 +968,8 @@ if __name__ == '__main__':
 
     logger.info("Initializing database...")
     initialize_database(conn)
+    if _STRICT_TABLES:
+        assert conn.execute("SELECT strict FROM pragma_table_list WHERE name = 'ohlcv_data'").fetchone()[0] == 1
 
     # Test OHLCV data saving and reading
     logger.info("--- Testing OHLCV Data ---")
@@ -442,14 +984,31 @@ if __name__ == '__main__':
     # Convert date column to datetime objects for proper handling by save_dataframe_to_db's conversion
     ohlcv_df['date'] = pd.to_datetime(ohlcv_df['date'])
 
+    start_time = time.perf_counter()
     save_dataframe_to_db(ohlcv_df, "ohlcv_data", conn, if_exists="append", primary_keys=OHLCV_PRIMARY_KEYS)
+    logger.info(f"OHLCV upsert took {time.perf_counter() - start_time:.4f}s.")
 
+    start_time = time.perf_counter()
     retrieved_ohlcv_df = read_dataframe_from_db("SELECT * FROM ohlcv_data WHERE symbol = 'BTCUSD'", conn)
+    logger.info(f"OHLCV read took {time.perf_counter() - start_time:.4f}s.")
     logger.info(f"Retrieved BTCUSD OHLCV data ({len(retrieved_ohlcv_df)} rows):\n{retrieved_ohlcv_df}")
     assert len(retrieved_ohlcv_df) == 2, "Upsert logic for OHLCV failed or data not inserted."
     assert retrieved_ohlcv_df[retrieved_ohlcv_df['date'] == '2023-01-01 00:00:00']['open'].iloc[0] == 30001.0, "Upsert did not update existing row."
 
 
+    # Test chunked streaming: read back in 1-row chunks and re-save them as an iterator
+    ohlcv_chunks = read_dataframe_chunks("SELECT * FROM ohlcv_data ORDER BY symbol, date", conn, chunksize=1)
+    save_dataframe_to_db(ohlcv_chunks, "ohlcv_data", conn, primary_keys=OHLCV_PRIMARY_KEYS, chunk_size=2)
+    assert conn.execute("SELECT COUNT(*) FROM ohlcv_data").fetchone()[0] == 3, "Chunked re-save changed row count."
+
+    arrow_ohlcv_df = read_arrow_from_db("SELECT * FROM ohlcv_data WHERE symbol = ?", conn, params=("BTCUSD",))
+    assert len(arrow_ohlcv_df) == 2 and isinstance(arrow_ohlcv_df['open'].dtype, pd.ArrowDtype)
+
+    latest_plan = conn.execute(
+        "EXPLAIN QUERY PLAN " + _MAX_DATE_SQL[("ohlcv_data", "date")] + " WHERE symbol = ? AND source_api = ? AND timeframe = ?",
+        ("BTCUSD", "test_api", "1D")).fetchall()
+    assert any("COVERING INDEX idx_ohlcv_symbol_timeframe_source_date" in row[-1] for row in latest_plan), latest_plan
+
     latest_btc_ts = get_latest_timestamp("ohlcv_data", conn, symbol="BTCUSD", source_api="test_api", timeframe="1D")
     logger.info(f"Latest BTCUSD timestamp: {latest_btc_ts}")
     assert latest_btc_ts == pd.Timestamp('2023-01-02 00:00:00'), "Latest timestamp for BTCUSD incorrect."
@@ -458,6 +1017,27 @@ if __name__ == '__main__':
     logger.info(f"Latest ETHUSD timestamp: {latest_eth_ts}") # Should be 2023-01-01
     assert latest_eth_ts == pd.Timestamp('2023-01-01 00:00:00'), "Latest timestamp for ETHUSD incorrect."
 
+    latest_by_symbol = get_latest_timestamps("ohlcv_data", conn, ["BTCUSD", "ETHUSD", "XRPUSD"], source_api="test_api")
+    logger.info(f"Latest timestamps by symbol: {latest_by_symbol}")
+    assert latest_by_symbol == {"BTCUSD": pd.Timestamp('2023-01-02'), "ETHUSD": pd.Timestamp('2023-01-01'), "XRPUSD": None}
+
+    try:
+        get_latest_timestamps("macro_indicators", conn, ["GDP_USA"])
+        assert False, "Batched latest timestamps accepted a table without a symbol column."
+    except ValueError as e:
+        logger.info(f"Successfully rejected table without symbol column: {e}")
+
+    try:
+        get_latest_timestamp("ohlcv_data; DROP TABLE ohlcv_data", conn)
+        assert False, "Unknown table name was accepted."
+    except ValueError as e:
+        logger.info(f"Successfully rejected unknown table name: {e}")
+
+    # A later write is reflected in the latest timestamp
+    save_dataframe_to_db(ohlcv_df.assign(date=pd.Timestamp('2023-01-03')).head(1), "ohlcv_data", conn,
+                         if_exists="append", primary_keys=OHLCV_PRIMARY_KEYS)
+    assert get_latest_timestamp("ohlcv_data", conn, symbol="BTCUSD", source_api="test_api", timeframe="1D") == pd.Timestamp('2023-01-03')
+
     # Test Macro Indicators data saving and reading
     logger.info("--- Testing Macro Indicators Data ---")
     macro_sample_data = [
@@ -473,7 +1053,8 @@ if __name__ == '__main__':
     retrieved_macro_df = read_dataframe_from_db("SELECT * FROM macro_indicators WHERE indicator_name = 'GDP_USA'", conn)
     logger.info(f"Retrieved GDP_USA Macro data ({len(retrieved_macro_df)} rows):\n{retrieved_macro_df}")
     assert len(retrieved_macro_df) == 2, "Upsert logic for Macro indicators failed."
-    assert retrieved_macro_df[retrieved_macro_df['date'] == '2023-01-01']['value'].iloc[0] == 25000.6, "Upsert did not update existing macro row."
+    # Datetime columns are stored with a time component
+    assert retrieved_macro_df[retrieved_macro_df['date'] == '2023-01-01 00:00:00']['value'].iloc[0] == 25000.6, "Upsert did not update existing macro row."
 
     # Test Financial Events data saving and reading
     logger.info("--- Testing Financial Events Data ---")
@@ -491,15 +1072,70 @@ if __name__ == '__main__':
     assert len(retrieved_events_df) == 1, "Upsert logic for Financial Events failed."
     assert retrieved_events_df['details_json'].iloc[0] == '{"eps": "1.55"}', "Upsert did not update event."
 
-    conn.close() # Close in-memory or file DB connection
+    close_db_connection(conn) # Close in-memory or file DB connection
+
+    # Test periodic PRAGMA optimize on a long-lived connection; the returned Event stops it
+    optimize_path = os.path.join(temp_test_dir, "optimize_test_db.sqlite")
+    optimize_conn = get_db_connection(optimize_path, check_same_thread=False)
+    optimize_threads = threading.active_count()
+    optimize_stop = initialize_database(optimize_conn, optimize_interval=0.05, optimize_lock=threading.Lock())
+    time.sleep(0.2)
+    optimize_stop.set()
+    time.sleep(0.1)
+    assert threading.active_count() == optimize_threads, "Periodic PRAGMA optimize did not stop."
+    close_db_connection(optimize_conn)
+    same_thread_conn = get_db_connection(optimize_path)
+    try:
+        initialize_database(same_thread_conn, optimize_interval=0.05, optimize_lock=threading.Lock())
+        assert False, "Periodic optimize accepted a check_same_thread=True connection."
+    except ValueError as e:
+        logger.info(f"Successfully rejected same-thread connection for periodic optimize: {e}")
+    close_db_connection(same_thread_conn)
+    logger.info("Periodic PRAGMA optimize test successful.")
+
+    # Test the connection pool against a file database
+    pool = DBPool(os.path.join(temp_test_dir, "pool_test_db.sqlite"), max_readers=2)
+    with pool.writer() as pool_conn:
+        initialize_database(pool_conn)
+        save_dataframe_to_db(ohlcv_df, "ohlcv_data", pool_conn, if_exists="append", primary_keys=OHLCV_PRIMARY_KEYS)
+    with pool.reader() as pool_reader:
+        assert len(read_dataframe_from_db("SELECT * FROM ohlcv_data", pool_reader)) == 3
+        assert get_latest_timestamp("ohlcv_data", pool_reader, symbol="BTCUSD") == pd.Timestamp('2023-01-02')
+    # Writes through the writer are seen by readers (no stale per-connection results)
+    with pool.writer() as pool_conn:
+        save_dataframe_to_db(ohlcv_df.assign(date=pd.Timestamp('2024-05-05')).head(1), "ohlcv_data", pool_conn,
+                             if_exists="append", primary_keys=OHLCV_PRIMARY_KEYS)
+    with pool.reader() as pool_reader:
+        assert get_latest_timestamp("ohlcv_data", pool_reader, symbol="BTCUSD") == pd.Timestamp('2024-05-05')
+        try:
+            pool_reader.execute("DELETE FROM ohlcv_data;")
+            assert False, "Read-only pool connection accepted a write."
+        except sqlite3.OperationalError as e:
+            logger.info(f"Read-only pool connection rejected write as expected: {e}")
+    # Many short-lived threads share the same max_readers connections
+    def _pool_read(_):
+        with pool.reader() as pool_reader:
+            return id(pool_reader), pool_reader.execute("SELECT COUNT(*) FROM ohlcv_data;").fetchone()[0]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pool_reads = list(executor.map(_pool_read, range(32)))
+    assert all(count == 4 for _, count in pool_reads)
+    assert len({conn_id for conn_id, _ in pool_reads}) <= 2 and pool._opened_readers <= 2, "Pool opened more than max_readers."
+    pool_optimize_stop = pool.schedule_optimize(0.01)
+    for _ in range(20): # Optimize ticks share the writer lock with these transactions
+        with pool.writer() as pool_conn:
+            save_dataframe_to_db(ohlcv_df.head(1), "ohlcv_data", pool_conn, if_exists="append", primary_keys=OHLCV_PRIMARY_KEYS)
+    pool.close()
+    assert pool_optimize_stop.is_set()
+    assert pool._opened_readers == 0, "Pool left readers open after close()."
 
     # Test Parquet operations
     logger.info("--- Testing Parquet Operations ---")
     # Use ohlcv_df from before for Parquet test
     parquet_file_name = "test_ohlcv_data.parquet"
+    start_time = time.perf_counter()
     save_df_to_parquet(ohlcv_df, parquet_file_name) # Uses default PARQUET_DATA_DIR from config
-
     read_parquet_df = read_df_from_parquet(parquet_file_name)
+    logger.info(f"Parquet round-trip took {time.perf_counter() - start_time:.4f}s.")
     logger.info(f"Read {len(read_parquet_df)} rows from Parquet file '{parquet_file_name}'.")
     pd.testing.assert_frame_equal(ohlcv_df.reset_index(drop=True), read_parquet_df.reset_index(drop=True), check_dtype=False) # dtypes can be tricky with Parquet I/O
     logger.info("Parquet save and read test successful.")
@@ -511,10 +1147,20 @@ if __name__ == '__main__':
     pd.testing.assert_frame_equal(ohlcv_df.reset_index(drop=True), read_parquet_custom_df.reset_index(drop=True), check_dtype=False)
     logger.info(f"Parquet save and read test with custom directory '{custom_parquet_dir}' successful.")
 
+    # Test row-group-parallel Parquet write (one row group per row here)
+    save_df_to_parquet(ohlcv_df, "row_groups.parquet", parquet_dir=custom_parquet_dir, row_group_size=1, max_workers=2)
+    read_row_groups_df = read_df_from_parquet("row_groups.parquet", parquet_dir=custom_parquet_dir)
+    pd.testing.assert_frame_equal(ohlcv_df.reset_index(drop=True), read_row_groups_df, check_dtype=False)
+    if _pyarrow() is not None:
+        assert _pyarrow().parquet.ParquetFile(os.path.join(custom_parquet_dir, "row_groups.parquet")).num_row_groups == len(ohlcv_df)
+    logger.info("Parallel row-group Parquet write test successful.")
+
     # Test reading non-existent parquet
     try:
         read_df_from_parquet("non_existent_file.parquet")
     except utils.FileIOError as e:
         logger.info(f"Successfully caught expected error for non-existent Parquet: {e}")
 
+    import shutil
+    shutil.rmtree(temp_test_dir, ignore_errors=True)
     logger.info("--- database_manager.py direct execution tests completed ---")
@@ -1,18 +1,50 @@
 import os
+import re
+import copy
 import json
 import time
+import asyncio
+import weakref
+import contextlib
+import collections
+import datetime
+import functools
+import inspect
+import threading
 import pandas as pd
 import requests # For FinMind and News API placeholders
-import hashlib # For _get_mock_data_path
+import hashlib # For _short_hash
+import email.utils
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlencode # For _get_mock_data_path
 
 import logging # Keep for type hinting if needed
 from src import utils
 from src import config
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 import pybreaker
 
+try:
+    import orjson # Optional: faster parsing of JSON API responses
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa # Optional: columnar construction of large FinMind frames
+except ImportError:
+    pa = None
+
+try:
+    import ijson # Optional: incremental parsing of large FinMind responses
+except ImportError:
+    ijson = None
+
+try:
+    import aiohttp # Optional: needed only by the async fetchers (aget_finmind_data, ...)
+except ImportError:
+    aiohttp = None
+
 # Initialize logger
 logger = utils.setup_logger(__name__)
 
@@ -42,42 +74,250 @@ news_breaker = pybreaker.CircuitBreaker(
     name="News_API"
 )
 
+# --- Adaptive Concurrency ---
+def _is_overload_error(exception: BaseException) -> bool:
+    """True for rate limiting (429, RateLimitError) and server-side (5xx) failures."""
+    if isinstance(exception, utils.RateLimitError):
+        return True
+    if isinstance(exception, utils.APIError):
+        status_code = exception.status_code
+    elif isinstance(exception, requests.exceptions.HTTPError) and exception.response is not None:
+        status_code = exception.response.status_code
+    else:
+        return False
+    return status_code is not None and (status_code == 429 or 500 <= status_code <= 599)
+
+class AIMDController:
+    """
+    Adaptive limit on concurrent calls to one API (additive increase, multiplicative decrease).
+
+    Calls past the limit wait for a slot. After each call the limit grows by alpha while the
+    rolling mean latency stays within target_latency, and is multiplied by beta when it does
+    not or the call failed with a 429/5xx. Complements the circuit breakers: the limit sheds
+    load from a degraded provider before it fails often enough to open the breaker.
+    """
+
+    def __init__(self, name: str, c_min: int = config.AIMD_MIN_CONCURRENCY, c_max: int = config.AIMD_MAX_CONCURRENCY,
+                 alpha: float = 0.5, beta: float = 0.5,
+                 target_latency: float = config.AIMD_TARGET_LATENCY_SECONDS, window: int = 20):
+        self.name = name
+        self.c_min, self.c_max = c_min, c_max
+        self.alpha, self.beta = alpha, beta
+        self.target_latency = target_latency
+        self.limit = float(c_max) # Start open; only backs off once the provider shows strain
+        self._latencies = collections.deque(maxlen=window)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, elapsed: float, overloaded: bool = False):
+        with self._cond:
+            self._in_flight -= 1
+            self._latencies.append(elapsed)
+            mean_latency = sum(self._latencies) / len(self._latencies)
+            if overloaded or mean_latency > self.target_latency:
+                new_limit = max(self.c_min, self.limit * self.beta)
+                if int(new_limit) < int(self.limit):
+                    logger.warning(f"{self.name}: concurrency limit cut to {int(new_limit)} "
+                                   f"(mean latency {mean_latency:.2f}s, overloaded={overloaded}).")
+                # Start a fresh window so the latencies that caused this cut don't cut again
+                self._latencies.clear()
+            else:
+                new_limit = min(self.c_max, self.limit + self.alpha)
+            self.limit = new_limit
+            self._cond.notify_all()
+
+    def __call__(self, fn):
+        """Decorator: each call to fn holds one slot and reports its latency and outcome."""
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            self.acquire()
+            start = time.monotonic()
+            overloaded = False
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                overloaded = _is_overload_error(e)
+                raise
+            finally:
+                self.release(time.monotonic() - start, overloaded)
+        return wrapper
+
+# Applied beneath the retry decorators, so each attempt is measured on its own and
+# backoff sleeps between attempts do not hold a slot.
+fred_aimd = AIMDController("FRED_API")
+yf_aimd = AIMDController("YFinance_API")
+finmind_aimd = AIMDController("FinMind_API")
+news_aimd = AIMDController("News_API")
+
 # --- Tenacity Retry Configuration ---
 # Common retry decorator for API calls
 # Retry on general request exceptions, specific API errors that indicate server-side issues (5xx),
-# or custom RateLimitError.
-RETRYABLE_EXCEPTIONS = (
-    requests.exceptions.RequestException, # Includes ConnectionError, Timeout, etc.
-    utils.APIError, # Base for specific API errors
-    # utils.RateLimitError, # If RateLimitError should always be retried (careful with strict limits)
-    # Add other exceptions if needed, e.g. specific library errors that are transient
-)
+# or custom RateLimitError. Client errors (other 4XX) are final: repeating the request won't help.
+def _retry_rate_limit(exception) -> bool:
+    logger.warning(f"Rate limit hit, retrying: {exception}")
+    return True # Retry on rate limits
+
+def _retry_if_server_side(exception) -> bool:
+    status_code = exception.status_code
+    if status_code is None: # Wrapped unexpected error (e.g. connection failure): may be transient
+        logger.warning(f"API error without status code, retrying: {exception}")
+        return True
+    if status_code == 429 or 500 <= status_code <= 599:
+        logger.warning(f"Server-side API error ({status_code}), retrying: {exception}")
+        return True # Retry on 5xx errors
+    return False
 
-def retry_if_api_error_is_server_side_or_rate_limit(exception):
-    """Retries only if APIError has a 5xx status code or is a RateLimitError."""
-    if isinstance(exception, utils.RateLimitError):
-        logger.warning(f"Rate limit hit, retrying: {exception}")
-        return True # Retry on rate limits
-    if isinstance(exception, utils.APIError):
-        if exception.status_code and 500 <= exception.status_code <= 599:
-            logger.warning(f"Server-side API error ({exception.status_code}), retrying: {exception}")
-            return True # Retry on 5xx errors
-    if isinstance(exception, requests.exceptions.RequestException):
-        logger.warning(f"Request exception, retrying: {exception}")
-        return True # Retry on general request exceptions
+def _retry_transport_error(exception) -> bool:
+    logger.warning(f"Request exception, retrying: {exception}")
+    return True # Retry on connection errors, timeouts, etc.
+
+# Exception type -> retry decision. Looked up along type(exception).__mro__, so the most
+# specific registered class wins (RateLimitError before its APIError base).
+_RETRY_HANDLERS = {
+    utils.RateLimitError: _retry_rate_limit,
+    utils.APIError: _retry_if_server_side,
+    requests.exceptions.RequestException: _retry_transport_error, # Includes ConnectionError, Timeout, etc.
+    asyncio.TimeoutError: _retry_transport_error,
+}
+if aiohttp is not None:
+    _RETRY_HANDLERS[aiohttp.ClientError] = _retry_transport_error
+
+def retry_if_api_error_is_server_side_or_rate_limit(exception) -> bool:
+    """Retries RateLimitError, APIError with a 429/5xx (or unknown) status, and transport errors."""
+    for cls in type(exception).__mro__:
+        handler = _RETRY_HANDLERS.get(cls)
+        if handler is not None:
+            return handler(exception)
     return False
 
 
 common_retry_decorator = retry(
     stop=stop_after_attempt(config.RETRY_ATTEMPTS),
     wait=wait_exponential(multiplier=1, min=config.RETRY_DELAY_SECONDS, max=config.RETRY_DELAY_SECONDS * 4), # Exponential backoff
-    retry=retry_if_exception_type(RETRYABLE_EXCEPTIONS) # Initial broad retry
-    # For more fine-grained control, use retry_if_api_error_is_server_side_or_rate_limit:
-    # retry=retry_if_api_error_is_server_side_or_rate_limit
+    retry=retry_if_exception(retry_if_api_error_is_server_side_or_rate_limit)
 )
 
 
+# --- On-disk Fetch Cache ---
+# Arguments that select credentials rather than data; left out of cache keys (and file names)
+_CACHE_KEY_EXCLUDED_ARGS = {"api_key", "api_token"}
+
+def _short_hash(text: str) -> str:
+    """16-hex-digit identifier for file names (cache keys, long mock params); blake2b is stdlib, so names match everywhere."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+_CACHE_ID_UNSAFE_RE = re.compile(r'[^\w\-.^]') # Characters replaced in the id part of cache file names
+
+def _fetch_cache_path(api_name: str, data_id: str, start_date: str, end_date: str, extra: dict) -> str:
+    """
+    Cache file for one fetch: {FETCH_CACHE_DIR}/{api_name}/{id}_{start}_{end}[_{hash of other args}].parquet.
+    An id that needed sanitizing also gets a hash of the original, so e.g. 'BRK/A' and 'BRK_A' stay apart.
+    """
+    safe_id = _CACHE_ID_UNSAFE_RE.sub('_', data_id)
+    if safe_id != data_id:
+        safe_id += f"_{_short_hash(data_id)}"
+    filename_base = _CACHE_ID_UNSAFE_RE.sub('_', f"{safe_id}_{start_date}_{end_date}")
+    if extra:
+        extra_hash = _short_hash(repr(sorted(extra.items())))
+        filename_base += f"_{extra_hash}"
+    return os.path.join(config.FETCH_CACHE_DIR, api_name, f"{filename_base}.parquet")
+
+def _fetch_cache_is_fresh(cache_path: str, end_date: str, revised: bool = False) -> bool:
+    """
+    A cached range that ended before today is final, unless the source revises past values
+    (revised=True), in which case it expires after FETCH_CACHE_REVISED_TTL_SECONDS. A range
+    reaching today expires after FETCH_CACHE_TTL_SECONDS.
+    """
+    if not os.path.exists(cache_path):
+        return False
+    try:
+        range_closed = pd.Timestamp(end_date).date() < datetime.date.today()
+    except (ValueError, TypeError):
+        range_closed = False
+    if range_closed and not revised:
+        return True
+    ttl_seconds = config.FETCH_CACHE_REVISED_TTL_SECONDS if range_closed else config.FETCH_CACHE_TTL_SECONDS
+    return time.time() - os.path.getmtime(cache_path) < ttl_seconds
+
+def _read_fetch_cache(api_name: str, cache_path: str, data_id: str, end_date: str,
+                      revised: bool = False) -> pd.DataFrame | None:
+    """The cached frame at cache_path if it is still fresh (see _fetch_cache_is_fresh) and readable, else None."""
+    if not _fetch_cache_is_fresh(cache_path, end_date, revised):
+        return None
+    try:
+        df = pd.read_parquet(cache_path)
+        logger.info(f"Loaded cached {api_name} data for {data_id} from {cache_path}")
+        return df
+    except Exception as e:
+        logger.warning(f"Could not read fetch cache file {cache_path}, re-fetching: {e}")
+        return None
+
+def _write_fetch_cache(cache_path: str, df):
+    """Stores a non-empty DataFrame result at cache_path; anything else is not cached."""
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return
+    try:
+        utils.ensure_directory_exists(os.path.dirname(cache_path))
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path) # Readers never see a partially written file
+    except Exception as e:
+        logger.warning(f"Could not write fetch cache file {cache_path}: {e}")
+
+def disk_cached(api_name: str, key: tuple[str, str, str], revised: bool = False):
+    """
+    Decorator caching a fetcher's DataFrame result as Parquet under config.FETCH_CACHE_DIR, keyed by
+    the (id, start_date, end_date) parameters named in key plus any other data-selecting arguments.
+    revised=True marks sources that revise past values, so closed ranges still expire (see
+    _fetch_cache_is_fresh). The wrapped function gains a force_refresh keyword to bypass the cache.
+    Simulation mode, empty results and a None FETCH_CACHE_DIR are never cached. Apply outermost
+    so cache hits skip the breaker and retries.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        missing = [name for name in key if name not in signature.parameters]
+        if missing:
+            raise TypeError(f"disk_cached key parameters {missing} are not parameters of {func.__name__}.")
+        var_keyword = next((name for name, param in signature.parameters.items()
+                            if param.kind is inspect.Parameter.VAR_KEYWORD), None)
+
+        @functools.wraps(func)
+        def wrapper(*args, force_refresh: bool = False, **kwargs):
+            if config.SIMULATION_MODE or not getattr(config, "FETCH_CACHE_DIR", None):
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            data_id, start_date, end_date = (arguments.pop(name) for name in key)
+            extra_kwargs = arguments.pop(var_keyword, {}) if var_keyword else {}
+            extra = {k: v for k, v in arguments.items() if k not in _CACHE_KEY_EXCLUDED_ARGS}
+            extra.update(extra_kwargs) # Flatten **kwargs into the key
+            cache_path = _fetch_cache_path(api_name, data_id, start_date, end_date, extra)
+
+            if not force_refresh:
+                df = _read_fetch_cache(api_name, cache_path, data_id, end_date, revised)
+                if df is not None:
+                    return df
+
+            df = func(*args, **kwargs)
+            _write_fetch_cache(cache_path, df)
+            return df
+        return wrapper
+    return decorator
+
+
 # --- API Key Simulation Helper ---
+# Filename sanitizers for mock file names, compiled once
+_SANITIZE_RE = re.compile(r'[=&<>:"/\\|?*]+') # Separators in a urlencoded param string
+_SANITIZE_RE2 = re.compile(r'[^\w\-_\.]') # Anything not safe in a k=v_k=v name part
+
 def _get_mock_data_path(api_name: str, endpoint_name: str, params: dict) -> str:
     """
     Creates a unique, sorted, and hashed filename for mock data
@@ -88,18 +328,17 @@ def _get_mock_data_path(api_name: str, endpoint_name: str, params: dict) -> str:
         raise utils.ConfigError("MOCK_DATA_DIR is not configured.")
 
     # Sort params by key to ensure consistent filenames
-    sorted_params = sorted(params.items())
     # Create a string representation that is filename-friendly
     # Use urlencode for a robust representation, then hash for brevity if too long
-    param_string = urlencode(sorted_params)
+    param_string = urlencode(tuple(sorted(params.items())))
 
     # Hash the param_string if it's too long to be a convenient filename part
     if len(param_string) > 100: # Arbitrary length limit
-        param_hash = hashlib.md5(param_string.encode('utf-8')).hexdigest()
+        param_hash = _short_hash(param_string)
         filename_base = f"{api_name}_{endpoint_name}_{param_hash}"
     else:
         # Replace characters that are problematic in filenames
-        safe_param_string = re.sub(r'[=&<>:"/\\|?*]+', '_', param_string)
+        safe_param_string = _SANITIZE_RE.sub('_', param_string)
         filename_base = f"{api_name}_{endpoint_name}_{safe_param_string}"
 
     # Ensure filename doesn't get excessively long
@@ -108,11 +347,61 @@ def _get_mock_data_path(api_name: str, endpoint_name: str, params: dict) -> str:
 
     return os.path.join(config.MOCK_DATA_DIR, f"{filename_base}.mock")
 
+def _mock_file_base(api_name: str, endpoint_name: str, params: dict) -> str:
+    """Mock file name without extension: {api}_{endpoint}_{k_v_...} with params sorted and sanitized."""
+    sorted_params = tuple(sorted(params.items())) # Sort for consistency
+    try:
+        return _mock_file_base_cached(api_name, endpoint_name, sorted_params)
+    except TypeError: # Unhashable param value: build the name uncached
+        return _mock_file_base_cached.__wrapped__(api_name, endpoint_name, sorted_params)
+
+@functools.lru_cache(maxsize=512)
+def _mock_file_base_cached(api_name: str, endpoint_name: str, sorted_params: tuple) -> str:
+    # Sanitize the k=v string for file systems
+    param_filename_part = _SANITIZE_RE2.sub('_', "_".join(f"{k}={v}" for k, v in sorted_params))
+    return f"{api_name}_{endpoint_name}_{param_filename_part}"
+
+# Column names parsed as datetimes when reading CSV mocks
+_DATE_COL_CANDIDATES = frozenset(['date', 'Date', 'Datetime', 'timestamp', 'Timestamp'])
+
+# Formats that load_simulated_data may serve from a {base}.parquet copy instead
+_PARQUET_MOCK_FORMATS = {"json_df_records", "csv"}
+
+# Mock file name base -> {extension: absolute path}, built by one scan of MOCK_DATA_DIR and
+# rebuilt when the directory's mtime changes (files added, removed or renamed)
+_MOCK_INDEX: dict[str, dict[str, str]] = {}
+_MOCK_INDEX_KEY = None # (MOCK_DATA_DIR, st_mtime_ns) the index was built from
+_mock_index_lock = threading.Lock()
+
+def _mock_index(force_rescan: bool = False) -> dict[str, dict[str, str]]:
+    """Returns the mock file index, rescanning MOCK_DATA_DIR only if it changed since the last scan."""
+    global _MOCK_INDEX, _MOCK_INDEX_KEY
+    mock_dir = config.MOCK_DATA_DIR
+    try:
+        index_key = (mock_dir, os.stat(mock_dir).st_mtime_ns)
+    except (OSError, TypeError): # Missing or unset directory: nothing to index
+        return {}
+    if force_rescan or index_key != _MOCK_INDEX_KEY:
+        with _mock_index_lock:
+            if force_rescan or index_key != _MOCK_INDEX_KEY:
+                index = {}
+                with os.scandir(mock_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            base, ext = os.path.splitext(entry.name)
+                            index.setdefault(base, {})[ext] = entry.path
+                _MOCK_INDEX, _MOCK_INDEX_KEY = index, index_key
+                logger.debug(f"Indexed {len(index)} mock file names in {mock_dir}.")
+    return _MOCK_INDEX
+
 def load_simulated_data(api_name: str, endpoint_name: str, params: dict,
                         expected_format: str = "json_df_records") -> pd.DataFrame | list | None:
     """
     Loads data from a mock file if SIMULATION_MODE is True.
 
+    For the DataFrame formats a {base}.parquet file, when present, is preferred over
+    the .json/.csv one.
+
     Args:
         api_name: Name of the API (e.g., "fred").
         endpoint_name: Name of the endpoint or series type (e.g., "series_GDPC1").
@@ -135,71 +424,289 @@ def load_simulated_data(api_name: str, endpoint_name: str, params: dict,
     else:
         ext = ".mock" # Generic extension
 
-    # Construct mock file path using a simplified version of _get_mock_data_path for this example
-    # A more robust approach would be to ensure _get_mock_data_path produces the base and then add ext
-
-    # Create a string from params for filename uniqueness
-    param_str_parts = []
-    for k, v in sorted(params.items()): # Sort for consistency
-        param_str_parts.append(f"{k}={v}")
-    param_filename_part = "_".join(param_str_parts)
-    # Sanitize param_filename_part for file systems
-    param_filename_part = re.sub(r'[^\w\-_\.]', '_', param_filename_part)
+    mock_filename_base = _mock_file_base(api_name, endpoint_name, params)
+    paths_by_ext = _mock_index().get(mock_filename_base)
+    if paths_by_ext is None:
+        # Coarse filesystem timestamps can hide a file created right after the last scan
+        paths_by_ext = _mock_index(force_rescan=True).get(mock_filename_base, {})
+
+    actual_path_to_load = paths_by_ext.get(ext)
+    if expected_format in _PARQUET_MOCK_FORMATS and ".parquet" in paths_by_ext:
+        # A Parquet copy (see convert_mock_data_to_parquet) loads much faster and is already typed
+        actual_path_to_load, expected_format = paths_by_ext[".parquet"], "parquet"
+    elif actual_path_to_load is None:
+        actual_path_to_load = paths_by_ext.get(".mock") # Fallback to generic .mock extension
+        if actual_path_to_load is None:
+            logger.warning(f"Mock data file not found for {api_name}/{endpoint_name} with params {params}. "
+                           f"Checked: {mock_filename_base}{ext} and {mock_filename_base}.mock in {config.MOCK_DATA_DIR}")
+            return None
+        logger.info(f"Found generic mock file: {actual_path_to_load} after specific extension not found.")
 
-    mock_filename_base = f"{api_name}_{endpoint_name}_{param_filename_part}"
-    mock_file_path_with_ext = os.path.join(config.MOCK_DATA_DIR, f"{mock_filename_base}{ext}")
+    try:
+        logger.info(f"SIMULATION: Loading data from mock file: {actual_path_to_load}")
+        mtime_ns = os.stat(actual_path_to_load).st_mtime_ns
+        data = _parse_mock_file(actual_path_to_load, mtime_ns, expected_format)
+    except Exception as e:
+        logger.error(f"Error loading or parsing mock data from {actual_path_to_load}: {e}", exc_info=True)
+        raise utils.FileIOError(f"Failed to load mock data {actual_path_to_load}: {e}")
 
-    # Fallback to generic .mock extension if specific extension file not found
-    generic_mock_file_path = os.path.join(config.MOCK_DATA_DIR, f"{mock_filename_base}.mock")
+    # The parsed object is shared through the cache; hand out copies callers may modify
+    if isinstance(data, pd.DataFrame):
+        return data.copy(deep=False)
+    return copy.deepcopy(data)
 
-    actual_path_to_load = None
-    if os.path.exists(mock_file_path_with_ext):
-        actual_path_to_load = mock_file_path_with_ext
-    elif os.path.exists(generic_mock_file_path): # Try .mock if specific ext not found
-        actual_path_to_load = generic_mock_file_path
-        logger.info(f"Found generic mock file: {actual_path_to_load} after specific extension not found.")
+@functools.lru_cache(maxsize=128)
+def _parse_mock_file(path: str, mtime_ns: int, expected_format: str) -> pd.DataFrame | list | None:
+    """
+    Parses a mock file according to expected_format. Cached on (path, mtime_ns, format), so
+    repeated simulated fetches of an unchanged file skip re-reading it; editing the file
+    changes mtime_ns and forces a fresh parse. Returned objects are shared: do not mutate.
+    """
+    if expected_format == "json_df_records":
+        # Ensure dates are parsed if they are common index/column names
+        df = pd.read_json(path, orient='records')
+        if 'date' in df.columns: df['date'] = pd.to_datetime(df['date'])
+        if 'Date' in df.columns: df['Date'] = pd.to_datetime(df['Date'])
+        return df
+    elif expected_format == "csv":
+        # Let the C parser convert the known date columns; the header-only read is cheap
+        header = pd.read_csv(path, nrows=0).columns
+        df = pd.read_csv(path, parse_dates=[col for col in header if col in _DATE_COL_CANDIDATES])
+        if 'Date' in df.columns: # common yfinance structure
+            df = df.set_index('Date')
+        return df
+    elif expected_format == "parquet":
+        return pd.read_parquet(path, engine="pyarrow")
+    elif expected_format == "json_list_dict":
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
     else:
-        logger.warning(f"Mock data file not found for {api_name}/{endpoint_name} with params {params}. "
-                       f"Checked: {mock_file_path_with_ext} and {generic_mock_file_path}")
+        logger.error(f"Unsupported mock data format: {expected_format}")
         return None
 
+def convert_mock_data_to_parquet(mock_dir: str | None = None, overwrite: bool = False) -> list[str]:
+    """
+    Writes a {base}.parquet next to every .csv and records-style .json mock in mock_dir
+    (default: config.MOCK_DATA_DIR), parsed exactly as load_simulated_data would parse it,
+    so dates are stored as datetime64 and need no conversion on load. Originals are kept:
+    list-of-dict loads (news) still read the .json. Returns the paths written.
+    """
+    mock_dir = mock_dir or config.MOCK_DATA_DIR
+    if not mock_dir or not os.path.isdir(mock_dir):
+        raise utils.ConfigError(f"Mock data directory not found: {mock_dir}")
+
+    written = []
+    with os.scandir(mock_dir) as entries:
+        sources = sorted(entry.path for entry in entries if entry.is_file())
+    for path in sources:
+        base, ext = os.path.splitext(path)
+        source_format = {".csv": "csv", ".json": "json_df_records"}.get(ext)
+        target = f"{base}.parquet"
+        if source_format is None or (os.path.exists(target) and not overwrite):
+            continue
+        try:
+            df = _parse_mock_file(path, os.stat(path).st_mtime_ns, source_format)
+        except ValueError as e: # JSON that is not a list of records
+            logger.info(f"Skipping {path}: not tabular ({e})")
+            continue
+        if df is None:
+            continue
+        df.to_parquet(target, engine="pyarrow")
+        written.append(target)
+        logger.info(f"Converted mock {path} -> {target}")
+    return written
+
+def clear_mock_cache():
+    """Drops cached mock parses and the mock directory index (e.g. between tests)."""
+    global _MOCK_INDEX, _MOCK_INDEX_KEY
+    _parse_mock_file.cache_clear()
+    with _mock_index_lock:
+        _MOCK_INDEX, _MOCK_INDEX_KEY = {}, None
+
+
+# --- Shared HTTP Session ---
+# One keep-alive session for all HTTP APIs (FRED, FinMind, news), so consecutive requests to a
+# host reuse pooled connections and skip the TCP/TLS handshake. Sized for fetch_concurrently.
+HTTP_POOL_MAXSIZE = 32
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=HTTP_POOL_MAXSIZE))
+
+def _loads_json(content: bytes):
+    """Parses a JSON response body, with orjson when installed."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+# --- Provider Rate-Limit Hints ---
+# Quota hints read from response headers (Retry-After, x-ratelimit-remaining / -reset), so the
+# next call waits for the reset instead of spending a request on a 429/402 that trips retries
+# and the circuit breaker. api_name -> (remaining requests, reset time as epoch seconds).
+RATE_LIMIT_MIN_REMAINING = 2 # Wait for the reset once this few requests are left
+RATE_LIMIT_MAX_WAIT_SECONDS = 60 # Longer waits raise RateLimitError instead of blocking
+_RATE_LIMIT_STATE: dict[str, tuple[int, float]] = {}
+_rate_limit_lock = threading.Lock()
+
+def _header_seconds(value: str | None, now: float) -> float | None:
+    """Seconds from now encoded by a Retry-After / x-ratelimit-reset value (delta, epoch or HTTP date)."""
+    if not value:
+        return None
     try:
-        logger.info(f"SIMULATION: Loading data from mock file: {actual_path_to_load}")
-        if expected_format == "json_df_records":
-            # Ensure dates are parsed if they are common index/column names
-            df = pd.read_json(actual_path_to_load, orient='records')
-            if 'date' in df.columns: df['date'] = pd.to_datetime(df['date'])
-            if 'Date' in df.columns: df['Date'] = pd.to_datetime(df['Date'])
-            return df
-        elif expected_format == "csv":
-            # Try to infer date columns, common ones are 'date', 'Date', 'Datetime'
-            df = pd.read_csv(actual_path_to_load)
-            for col in ['date', 'Date', 'Datetime', 'timestamp', 'Timestamp']:
-                if col in df.columns:
-                    try:
-                        df[col] = pd.to_datetime(df[col])
-                        logger.info(f"Parsed column '{col}' as datetime for CSV mock.")
-                    except Exception as e:
-                        logger.warning(f"Could not parse column '{col}' as datetime: {e}")
-            if 'Date' in df.columns and df.index.name != 'Date': # common yfinance structure
-                 if not pd.api.types.is_datetime64_any_dtype(df['Date']):
-                     df['Date'] = pd.to_datetime(df['Date'])
-                 df = df.set_index('Date')
-            return df
-        elif expected_format == "json_list_dict":
-            with open(actual_path_to_load, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        else:
-            logger.error(f"Unsupported mock data format: {expected_format}")
+        number = float(value)
+    except ValueError:
+        try:
+            return email.utils.parsedate_to_datetime(value).timestamp() - now
+        except (TypeError, ValueError):
             return None
-    except Exception as e:
-        logger.error(f"Error loading or parsing mock data from {actual_path_to_load}: {e}", exc_info=True)
-        raise utils.FileIOError(f"Failed to load mock data {actual_path_to_load}: {e}")
+    return number - now if number > 1e9 else number # Large values are epoch timestamps
+
+def _apply_rate_limit(headers, api_name: str):
+    """Records the quota hints in a response's headers (requests or aiohttp) for api_name."""
+    now = time.time()
+    retry_after = _header_seconds(headers.get('Retry-After'), now)
+    if retry_after is not None:
+        state = (0, now + retry_after)
+    else:
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_in = _header_seconds(headers.get('X-RateLimit-Reset'), now)
+        if remaining is None or reset_in is None:
+            return
+        try:
+            state = (int(float(remaining)), now + reset_in)
+        except ValueError:
+            return
+    with _rate_limit_lock:
+        _RATE_LIMIT_STATE[api_name] = state
+
+def _rate_limit_wait_seconds(api_name: str, raise_if_long: bool = True) -> float:
+    """
+    Seconds to wait before calling api_name (0 if its quota allows a call now). A wait beyond
+    RATE_LIMIT_MAX_WAIT_SECONDS raises RateLimitError, or with raise_if_long=False returns 0
+    and leaves the server to refuse the call.
+    """
+    with _rate_limit_lock:
+        remaining, reset_at = _RATE_LIMIT_STATE.get(api_name, (RATE_LIMIT_MIN_REMAINING + 1, 0.0))
+    wait_seconds = reset_at - time.time()
+    if remaining > RATE_LIMIT_MIN_REMAINING or wait_seconds <= 0:
+        return 0.0
+    if wait_seconds > RATE_LIMIT_MAX_WAIT_SECONDS:
+        if not raise_if_long:
+            return 0.0
+        raise utils.RateLimitError(f"{api_name} quota exhausted; resets in {wait_seconds:.0f}s.")
+    logger.warning(f"{api_name}: {remaining} requests left in quota, waiting {wait_seconds:.1f}s for reset.")
+    return wait_seconds
+
+def _maybe_wait(api_name: str, raise_if_long: bool = True):
+    """Blocks until api_name's quota allows a call (see _apply_rate_limit)."""
+    wait_seconds = _rate_limit_wait_seconds(api_name, raise_if_long)
+    if wait_seconds:
+        time.sleep(wait_seconds)
+
+
+# --- Simulation Schema Adapters ---
+class SchemaAdapter(collections.namedtuple("SchemaAdapter", ["rename", "datetime_cols", "index_col", "reset_index"],
+                                           defaults=(None, False))):
+    """
+    Declarative fix-up of a mock frame into a fetcher's output schema: move a named index
+    into the columns (reset_index), one rename, parse datetime_cols, then set index_col.
+    Renames onto a column that already exists are skipped, and parsed dates are left as is.
+    """
+    __slots__ = ()
+
+    def apply(self, df: pd.DataFrame, extra_rename: dict | None = None) -> pd.DataFrame:
+        if self.reset_index and df.index.name is not None:
+            df = df.reset_index()
+        columns = set(df.columns)
+        rename = {**self.rename, **extra_rename} if extra_rename else self.rename
+        rename = {src: dst for src, dst in rename.items() if src in columns and dst not in columns}
+        if rename:
+            df = df.rename(columns=rename)
+        for col in self.datetime_cols:
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], cache=True)
+        if self.index_col is not None and self.index_col in df.columns:
+            df = df.set_index(self.index_col)
+        return df
+
+# FRED mocks may use the CSV download's 'DATE' / <series_id> headers (series_id is passed as extra_rename)
+_FRED_ADAPTER = SchemaAdapter(rename={'DATE': 'date'}, datetime_cols=('date',))
+# yfinance CSV mocks keep their 'Date'/'Datetime' column name; prices become lowercase
+_YF_ADAPTER = SchemaAdapter(
+    rename={'Open': 'open', 'High': 'high', 'Low': 'low', 'Close': 'close',
+            'Volume': 'volume', 'Dividends': 'dividends', 'Stock Splits': 'stock_splits'},
+    datetime_cols=('Date', 'Datetime', 'date', 'datetime'), reset_index=True)
+_FINMIND_ADAPTER = SchemaAdapter(rename={}, datetime_cols=('date',))
+
+
+# --- Simulation Mode ---
+def simulated_if_mocked(api_name: str, endpoint_fn, param_names: tuple, fmt: str,
+                        adapter: SchemaAdapter | None = None, extra_rename_fn=None):
+    """
+    Decorator: in SIMULATION_MODE the call is answered from the mock file for its arguments
+    (see load_simulated_data), fixed up by adapter, and the wrapped function (with its
+    breaker, retries and concurrency limit) never runs. Outside simulation mode it is a
+    plain pass-through. Place it directly beneath @disk_cached.
+
+    Args:
+        api_name: Mock file prefix (e.g. "fred").
+        endpoint_fn: Maps the bound arguments (dict) to the endpoint name, e.g. "series_GDPC1".
+        param_names: Arguments that make up the mock params, in order.
+        fmt: expected_format for load_simulated_data.
+        adapter: Optional SchemaAdapter applied to DataFrame results.
+        extra_rename_fn: Optional; maps the bound arguments to call-specific renames for adapter.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not config.SIMULATION_MODE:
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            mock_params = {name: arguments[name] for name in param_names}
+            data = load_simulated_data(api_name, endpoint_fn(arguments), mock_params, expected_format=fmt)
+            if adapter is not None and isinstance(data, pd.DataFrame):
+                data = adapter.apply(data, extra_rename=extra_rename_fn(arguments) if extra_rename_fn else None)
+            return data # None if the mock file is missing
+        return wrapper
+    return decorator
+
+def quota_guarded(api_name: str):
+    """
+    Decorator: before the call, waits out api_name's nearly spent quota or raises RateLimitError
+    if the reset is too far off. Place it above the breaker: a call refused here never reached
+    the API, so it must not be retried, cut AIMD concurrency, or count as a breaker failure.
+    Works on sync and async functions.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                wait_seconds = _rate_limit_wait_seconds(api_name)
+                if wait_seconds:
+                    await asyncio.sleep(wait_seconds)
+                return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            _maybe_wait(api_name)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
 
 
 # --- FRED API Fetcher ---
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+FRED_REQUEST_TIMEOUT_SECONDS = 30
+
+@disk_cached("fred", key=("series_id", "start_date", "end_date"), revised=True)
+@simulated_if_mocked("fred", lambda a: f"series_{a['series_id']}", ("series_id", "start_date", "end_date"),
+                     "json_df_records", _FRED_ADAPTER, extra_rename_fn=lambda a: {a['series_id']: 'value'})
+@quota_guarded("fred")
 @fred_breaker
 @common_retry_decorator
+@fred_aimd
 def get_fred_data(series_id: str, start_date: str, end_date: str,
                   api_key: str | None = None, **kwargs) -> pd.DataFrame | None:
     """
@@ -210,26 +717,11 @@ def get_fred_data(series_id: str, start_date: str, end_date: str,
         start_date: Start date in "YYYY-MM-DD" format.
         end_date: End date in "YYYY-MM-DD" format.
         api_key: FRED API key. Uses config.FRED_API_KEY if None.
-        **kwargs: Additional arguments for fredapi.get_series().
+        **kwargs: Additional FRED observations API parameters (e.g. frequency, units).
 
     Returns:
         DataFrame with 'date' and 'value' columns, or None if error.
     """
-    endpoint_name = f"series_{series_id}"
-    mock_params = {"series_id": series_id, "start_date": start_date, "end_date": end_date}
-
-    if config.SIMULATION_MODE:
-        sim_data = load_simulated_data("fred", endpoint_name, mock_params, expected_format="json_df_records")
-        # Ensure DataFrame has 'date' and 'value' columns as expected from real call
-        if sim_data is not None and isinstance(sim_data, pd.DataFrame):
-            if 'date' not in sim_data.columns or 'value' not in sim_data.columns:
-                logger.warning(f"FRED mock data for {series_id} is missing 'date' or 'value' columns. Adapting.")
-                # This is a basic adaptation. Real mock data should match schema.
-                if 'DATE' in sim_data.columns and 'date' not in sim_data.columns: sim_data = sim_data.rename(columns={'DATE':'date'})
-                if series_id in sim_data.columns and 'value' not in sim_data.columns: sim_data = sim_data.rename(columns={series_id:'value'})
-                if 'date' in sim_data.columns: sim_data['date'] = pd.to_datetime(sim_data['date'])
-            return sim_data
-        return None # load_simulated_data returns None if file not found
 
     # Real API call
     key_to_use = api_key if api_key is not None else config.FRED_API_KEY
@@ -237,27 +729,34 @@ def get_fred_data(series_id: str, start_date: str, end_date: str,
         logger.error("FRED API key not available in config or arguments.")
         raise utils.ConfigError("FRED API key not available.") # Raise error, don't just return None
 
+    _maybe_wait("fred", raise_if_long=False) # Between retries: honour a short Retry-After
     try:
-        from fredapi import Fred
-        fred = Fred(api_key=key_to_use)
         logger.info(f"Fetching FRED data for series: {series_id} from {start_date} to {end_date}")
+        # Query the JSON observations endpoint directly (fredapi fetches and parses XML per call)
+        params = {
+            'series_id': series_id,
+            'api_key': key_to_use,
+            'file_type': 'json',
+            'observation_start': start_date,
+            'observation_end': end_date,
+            **kwargs
+        }
+        response = _SESSION.get(FRED_OBSERVATIONS_URL, params=params, timeout=FRED_REQUEST_TIMEOUT_SECONDS)
+        _apply_rate_limit(response.headers, "fred")
+        response.raise_for_status() # Raises HTTPError for 4XX/5XX status codes
+        observations = _loads_json(response.content).get('observations', [])
 
-        series_data = fred.get_series(series_id,
-                                      observation_start=start_date,
-                                      observation_end=end_date,
-                                      **kwargs)
-
-        if series_data.empty:
+        if not observations:
             logger.warning(f"No data returned for FRED series {series_id} for the given period.")
             return pd.DataFrame({'date': [], 'value': []}) # Return empty DF consistent with schema
 
-        df = series_data.reset_index()
-        df.columns = ['date', 'value']
-        df['date'] = pd.to_datetime(df['date'])
+        df = pd.DataFrame(observations, columns=['date', 'value'])
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d')
+        df['value'] = pd.to_numeric(df['value'], errors='coerce') # FRED marks missing values as "."
         logger.info(f"Successfully fetched {len(df)} data points for FRED series {series_id}.")
         return df
 
-    except requests.exceptions.HTTPError as e: # fredapi raises this for API errors
+    except requests.exceptions.HTTPError as e:
         status_code = e.response.status_code
         error_message = f"FRED API HTTP error for series {series_id}: {status_code} - {e.response.text}"
         logger.error(error_message, exc_info=True)
@@ -270,7 +769,7 @@ def get_fred_data(series_id: str, start_date: str, end_date: str,
         else: # Server errors or other HTTP errors
             raise utils.APIError(error_message, status_code=status_code) # Generic API error for retry
 
-    except Exception as e: # Catch other fredapi or unexpected errors
+    except Exception as e: # Catch connection, parsing or unexpected errors
         error_message = f"Unexpected error fetching FRED series {series_id}: {e}"
         logger.error(error_message, exc_info=True)
         # Don't know status code, so raise a generic one that might be retried by common_retry_decorator
@@ -278,8 +777,31 @@ def get_fred_data(series_id: str, start_date: str, end_date: str,
 
 
 # --- yfinance Fetcher ---
+@functools.cache
+def _yf():
+    """Returns the yfinance module, importing it on first call (it is slow to import)."""
+    import yfinance
+    return yfinance
+
+# yfinance column names -> ours. The index is 'Date' for daily and 'Datetime' for intraday data.
+_YF_COLMAP = {'Datetime': 'date', 'Date': 'date',
+              'Open': 'open', 'High': 'high', 'Low': 'low', 'Close': 'close', 'Volume': 'volume'}
+_YF_LEADING_COLS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
+def _standardize_yfinance_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Turns a yfinance price frame (DatetimeIndex, 'Open'/'High'/... columns) into date + lowercase OHLCV columns."""
+    data = data.reset_index().rename(columns=_YF_COLMAP)
+    # Date + OHLCV first, then any other columns returned (e.g. dividends, stock splits if auto_adjust=False)
+    data = data[_YF_LEADING_COLS + [col for col in data.columns if col not in _YF_COLMAP.values()]]
+    data['date'] = pd.to_datetime(data['date'], cache=True)
+    return data
+
+@disk_cached("yfinance", key=("ticker", "start_date", "end_date"))
+@simulated_if_mocked("yfinance", lambda a: f"ticker_{a['ticker']}", ("ticker", "start_date", "end_date", "interval"),
+                     "csv", _YF_ADAPTER)
 @yf_breaker
 @common_retry_decorator # yfinance can raise various exceptions, some network-related
+@yf_aimd
 def get_yfinance_data(ticker: str, start_date: str, end_date: str,
                       interval: str = "1d", **kwargs) -> pd.DataFrame | None:
     """
@@ -296,32 +818,10 @@ def get_yfinance_data(ticker: str, start_date: str, end_date: str,
     Returns:
         DataFrame with OHLCV data, or None if error.
     """
-    endpoint_name = f"ticker_{ticker}"
-    mock_params = {"ticker": ticker, "start_date": start_date, "end_date": end_date, "interval": interval}
-
-    if config.SIMULATION_MODE:
-        df = load_simulated_data("yfinance", endpoint_name, mock_params, expected_format="csv")
-        if df is not None and isinstance(df, pd.DataFrame):
-            # Standardize columns for simulated data
-            df = df.rename(columns={
-                'Open': 'open', 'High': 'high', 'Low': 'low', 'Close': 'close',
-                'Volume': 'volume', 'Dividends': 'dividends', 'Stock Splits': 'stock_splits'
-            })
-            if df.index.name is not None: # If index has a name (likely 'Date' or 'Datetime')
-                df = df.reset_index() # Make it a column for consistency before returning
-            # Ensure date column is datetime
-            date_col_names = ['Date', 'Datetime', 'date', 'datetime']
-            for col_name in date_col_names:
-                if col_name in df.columns:
-                    df[col_name] = pd.to_datetime(df[col_name])
-                    break
-            return df
-        return None
-
 
     # Real API call
     try:
-        import yfinance as yf
+        yf = _yf()
         logger.info(f"Fetching yfinance data for ticker: {ticker}, interval: {interval}, from {start_date} to {end_date}")
 
         tick = yf.Ticker(ticker)
@@ -335,30 +835,7 @@ def get_yfinance_data(ticker: str, start_date: str, end_date: str,
             # Return empty DF with expected schema
             return pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume'])
 
-        # Standardize: yfinance returns index as Datetime, columns 'Open', 'High', etc.
-        data = data.reset_index() # Moves 'Date' or 'Datetime' from index to column
-
-        # Rename columns to lowercase and common names
-        # Handle both 'Date' (for daily) and 'Datetime' (for intraday)
-        if 'Datetime' in data.columns:
-            data = data.rename(columns={'Datetime': 'date'})
-        elif 'Date' in data.columns:
-            data = data.rename(columns={'Date': 'date'})
-
-        data = data.rename(columns={
-            'Open': 'open', 'High': 'high', 'Low': 'low', 'Close': 'close', 'Volume': 'volume'
-        })
-
-        # Select and reorder common columns, ensure date is present
-        final_cols = ['date', 'open', 'high', 'low', 'close', 'volume']
-        # Add any other columns that might have been returned and are useful (e.g. dividends, stock splits if auto_adjust=False)
-        for col in data.columns:
-            if col not in final_cols:
-                final_cols.append(col)
-
-        data = data[final_cols]
-        data['date'] = pd.to_datetime(data['date'])
-
+        data = _standardize_yfinance_frame(data)
         logger.info(f"Successfully fetched {len(data)} data points for yfinance ticker {ticker}.")
         return data
 
@@ -377,80 +854,235 @@ def get_yfinance_data(ticker: str, start_date: str, end_date: str,
         raise utils.YFinanceError(error_message)
 
 
-# --- FinMind API Fetcher Framework ---
-@finmind_breaker
+_YF_BATCH_SIZE = 20 # Tickers per yf.download request; larger batches risk Yahoo's limits
+
+@yf_breaker
 @common_retry_decorator
-def get_finmind_data(dataset: str, stock_id: str, start_date: str, end_date: str,
-                     api_token: str | None = None, **kwargs) -> pd.DataFrame | None:
+@yf_aimd
+def _download_yfinance_batch(tickers: list[str], start_date: str, end_date: str,
+                             interval: str, **kwargs) -> pd.DataFrame:
+    """One yf.download request for up to _YF_BATCH_SIZE tickers, under the same breaker, retries and concurrency limit as get_yfinance_data."""
+    try:
+        yf = _yf()
+        logger.info(f"Fetching yfinance data for {len(tickers)} tickers in one request, interval: {interval}, "
+                    f"from {start_date} to {end_date}")
+        return yf.download(tickers, start=start_date, end=end_date, interval=interval,
+                           group_by='ticker', auto_adjust=True, threads=True, progress=False, **kwargs)
+    except Exception as e:
+        error_message = f"Error fetching yfinance data for {tickers}: {e}"
+        logger.error(error_message, exc_info=True)
+        raise utils.YFinanceError(error_message)
+
+def _split_yfinance_batch(data: pd.DataFrame, tickers: list[str]) -> dict[str, pd.DataFrame]:
+    """Slices a yf.download result into one standardized frame per ticker (empty if it had no rows)."""
+    # Detect the column layout once: group_by='ticker' gives (ticker, field) columns, while
+    # older yfinance versions return flat columns for a single ticker
+    grouped_tickers = set(data.columns.get_level_values(0)) if isinstance(data.columns, pd.MultiIndex) else None
+
+    results = {}
+    for ticker in tickers:
+        if grouped_tickers is None:
+            ticker_data = data
+        elif ticker in grouped_tickers:
+            ticker_data = data.xs(ticker, axis=1, level=0)
+        else:
+            ticker_data = pd.DataFrame()
+        # Rows are aligned across tickers, so markets closed on a date leave all-NaN rows
+        ticker_data = ticker_data.dropna(how='all')
+        if ticker_data.empty:
+            logger.warning(f"No yfinance data returned for ticker {ticker} for the given period/interval.")
+            results[ticker] = pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume'])
+        else:
+            results[ticker] = _standardize_yfinance_frame(ticker_data)
+    return results
+
+def get_yfinance_data_multi(tickers: list[str], start_date: str, end_date: str,
+                            interval: str = "1d", force_refresh: bool = False,
+                            **kwargs) -> dict[str, pd.DataFrame | None]:
     """
-    Fetches data from FinMind API (Taiwan market data). Framework function.
+    Fetches several tickers with one yf.download request per _YF_BATCH_SIZE tickers instead of
+    one request per ticker. Shares get_yfinance_data's on-disk cache entries: cached tickers
+    are not downloaded again, and downloaded ones are cached for either function.
 
     Args:
-        dataset: FinMind dataset name (e.g., "TaiwanStockPrice").
-        stock_id: Stock ID (e.g., "2330").
-        start_date: "YYYY-MM-DD".
-        end_date: "YYYY-MM-DD".
-        api_token: FinMind API token. Uses config.FINMIND_API_KEY if None.
-        **kwargs: Additional parameters for the API request.
+        tickers: Ticker symbols (e.g., ["^VIX", "AGG", "IEF"]).
+        start_date: Start date "YYYY-MM-DD".
+        end_date: End date "YYYY-MM-DD".
+        interval: Data interval, as for get_yfinance_data.
+        force_refresh: Download every ticker even if a fresh cache entry exists.
+        **kwargs: Additional arguments for yf.download().
 
     Returns:
-        DataFrame with data, or None.
+        Mapping of ticker -> DataFrame in the same shape get_yfinance_data returns
+        (empty if the ticker had no rows, None in simulation mode if its mock is missing).
     """
-    endpoint_name = f"dataset_{dataset}_stock_{stock_id}"
-    mock_params = {"dataset": dataset, "stock_id": stock_id, "start_date": start_date, "end_date": end_date}
+    tickers = list(dict.fromkeys(tickers)) # Drop repeats, keep order
+    if not tickers:
+        return {}
 
     if config.SIMULATION_MODE:
-        df = load_simulated_data("finmind", endpoint_name, mock_params, expected_format="json_df_records")
-        # TODO: Add schema standardization for FinMind mock data if needed
-        return df
+        # Mock files are stored per ticker
+        return {ticker: get_yfinance_data(ticker, start_date, end_date, interval=interval) for ticker in tickers}
+
+    results = {}
+    cache_paths = {}
+    if getattr(config, "FETCH_CACHE_DIR", None):
+        extra = {"interval": interval, **kwargs} # Same key as get_yfinance_data's disk_cached
+        for ticker in tickers:
+            cache_paths[ticker] = _fetch_cache_path("yfinance", ticker, start_date, end_date, extra)
+            cached = None if force_refresh else _read_fetch_cache("yfinance", cache_paths[ticker], ticker, end_date)
+            if cached is not None:
+                results[ticker] = cached
+
+    missing = [ticker for ticker in tickers if ticker not in results]
+    for start in range(0, len(missing), _YF_BATCH_SIZE):
+        batch = missing[start:start + _YF_BATCH_SIZE]
+        data = _download_yfinance_batch(batch, start_date, end_date, interval, **kwargs)
+        for ticker, ticker_df in _split_yfinance_batch(data, batch).items():
+            results[ticker] = ticker_df
+            if ticker in cache_paths:
+                _write_fetch_cache(cache_paths[ticker], ticker_df)
+    logger.info(f"Successfully fetched yfinance data for {sum(not df.empty for df in results.values())}/{len(tickers)} tickers "
+                f"({len(tickers) - len(missing)} from cache).")
+    return {ticker: results[ticker] for ticker in tickers}
 
-    # Real API call
+
+# --- FinMind API Fetcher Framework ---
+FINMIND_DATA_URL = "https://api.finmindtrade.com/api/v4/data"
+_FINMIND_ARROW_MIN_ROWS = 10_000 # Below this, pd.DataFrame(records) is as fast as going through Arrow
+
+def _finmind_request_params(dataset: str, stock_id: str, start_date: str, end_date: str,
+                            api_token: str | None, extra: dict) -> dict:
+    """Query parameters for a FinMind data request; raises ConfigError if no token is available."""
     token_to_use = api_token if api_token is not None else config.FINMIND_API_KEY
     if not token_to_use:
         logger.error("FinMind API key not available in config or arguments.")
         raise utils.ConfigError("FinMind API key not available.")
-
-    base_url = "https://api.finmindtrade.com/api/v4/data"
-    params = {
+    return {
         'dataset': dataset,
         'data_id': stock_id,
         'start_date': start_date,
         'end_date': end_date,
         'token': token_to_use,
-        **kwargs
+        **extra
     }
 
-    logger.info(f"Fetching FinMind data for {dataset} / {stock_id} from {start_date} to {end_date}")
+def _finmind_stream_body(stream) -> dict:
+    """
+    Parses a FinMind response body incrementally with ijson. Returns the top-level fields
+    with 'data' as a dict of column lists (rows missing a field get None), so records are
+    never all held as dicts at once.
+    """
+    body = {}
+    columns = {}
+    n_rows = 0
+    record = None
+    field = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if prefix == 'data.item':
+            if event == 'start_map':
+                record = {}
+            elif event == 'map_key':
+                field = value
+            elif event == 'end_map':
+                for key, item in record.items():
+                    column = columns.get(key)
+                    if column is None: # Field first seen in this row: earlier rows lack it
+                        column = columns[key] = [None] * n_rows
+                    column.append(item)
+                n_rows += 1
+                for column in columns.values():
+                    if len(column) < n_rows:
+                        column.append(None)
+        elif record is not None and prefix.startswith('data.item.'):
+            record[field] = value # FinMind records are flat, so every value here is a scalar
+        elif '.' not in prefix and prefix and event not in ('start_map', 'start_array', 'end_map', 'end_array', 'map_key'):
+            body[prefix] = value
+    body['data'] = columns
+    return body
+
+def _finmind_frame(data_json: dict, status_code: int, dataset: str, stock_id: str) -> pd.DataFrame:
+    """Turns a successful FinMind response body into a DataFrame (raises FinMindAPIError if msg != 'success')."""
+    if data_json.get('msg') != 'success':
+        logger.error(f"FinMind API call not successful for {dataset}/{stock_id}: {data_json.get('msg')}")
+        raise utils.FinMindAPIError(f"FinMind API error: {data_json.get('msg')}", status_code=status_code) # Use actual status code
+
+    records = data_json.get('data', [])
+    if isinstance(records, dict): # Already columnar (_finmind_stream_body)
+        df = pd.DataFrame(records)
+    elif pa is not None and len(records) >= _FINMIND_ARROW_MIN_ROWS:
+        # Arrow builds the columns in C; to_pandas() keeps the usual NumPy-backed dtypes
+        df = pa.Table.from_pylist(records).to_pandas()
+    else:
+        df = pd.DataFrame(records)
+    if df.empty:
+        logger.warning(f"No data returned by FinMind for {dataset}/{stock_id} for the period.")
+    else:
+        logger.info(f"Successfully fetched {len(df)} records from FinMind for {dataset}/{stock_id}.")
+        if 'date' in df.columns: df['date'] = pd.to_datetime(df['date']) # Common transformation
+    return df
+
+def _finmind_http_error(status_code: int, body_text: str, dataset: str, stock_id: str) -> utils.APIError:
+    """Maps a FinMind 4XX/5XX response to the exception to raise."""
+    error_message = f"FinMind API HTTP error for {dataset}/{stock_id}: {status_code} - {body_text}"
+    if status_code == 401: # Unauthorized
+        return utils.FinMindAPIError(error_message, status_code=status_code)
+    elif status_code == 402: # Token usage limit
+        return utils.RateLimitError(f"FinMind API usage limit hit for {dataset}/{stock_id}.", status_code=status_code)
+    elif 400 <= status_code < 500: # Other client errors
+        return utils.FinMindAPIError(error_message, status_code=status_code)
+    else: # Server errors or other HTTP errors
+        return utils.APIError(error_message, status_code=status_code) # Generic API error for retry
+
+@simulated_if_mocked("finmind", lambda a: f"dataset_{a['dataset']}_stock_{a['stock_id']}",
+                     ("dataset", "stock_id", "start_date", "end_date"), "json_df_records", _FINMIND_ADAPTER)
+@quota_guarded("finmind")
+@finmind_breaker
+@common_retry_decorator
+@finmind_aimd
+def get_finmind_data(dataset: str, stock_id: str, start_date: str, end_date: str,
+                     api_token: str | None = None, **kwargs) -> pd.DataFrame | None:
+    """
+    Fetches data from FinMind API (Taiwan market data). Framework function.
 
-    try:
-        response = requests.get(base_url, params=params)
-        response.raise_for_status() # Raises HTTPError for 4XX/5XX status codes
+    Args:
+        dataset: FinMind dataset name (e.g., "TaiwanStockPrice").
+        stock_id: Stock ID (e.g., "2330").
+        start_date: "YYYY-MM-DD".
+        end_date: "YYYY-MM-DD".
+        api_token: FinMind API token. Uses config.FINMIND_API_KEY if None.
+        **kwargs: Additional parameters for the API request.
 
-        data_json = response.json()
-        if data_json.get('msg') != 'success':
-            logger.error(f"FinMind API call not successful for {dataset}/{stock_id}: {data_json.get('msg')}")
-            raise utils.FinMindAPIError(f"FinMind API error: {data_json.get('msg')}", status_code=response.status_code) # Use actual status code
+    Returns:
+        DataFrame with data, or None.
+    """
 
-        df = pd.DataFrame(data_json.get('data', []))
-        if df.empty:
-            logger.warning(f"No data returned by FinMind for {dataset}/{stock_id} for the period.")
-        else:
-            logger.info(f"Successfully fetched {len(df)} records from FinMind for {dataset}/{stock_id}.")
-            if 'date' in df.columns: df['date'] = pd.to_datetime(df['date']) # Common transformation
-        return df
+    # Real API call
+    params = _finmind_request_params(dataset, stock_id, start_date, end_date, api_token, kwargs)
+    logger.info(f"Fetching FinMind data for {dataset} / {stock_id} from {start_date} to {end_date}")
+
+    _maybe_wait("finmind", raise_if_long=False) # Between retries: honour a short Retry-After
+    try:
+        if ijson is None:
+            response = _SESSION.get(FINMIND_DATA_URL, params=params)
+            _apply_rate_limit(response.headers, "finmind")
+            response.raise_for_status() # Raises HTTPError for 4XX/5XX status codes
+            return _finmind_frame(_loads_json(response.content), response.status_code, dataset, stock_id)
+
+        # Parse the body as it arrives instead of holding the whole response in memory
+        with _SESSION.get(FINMIND_DATA_URL, params=params, stream=True) as response:
+            _apply_rate_limit(response.headers, "finmind")
+            if not response.ok:
+                response.content # Read the error body while the connection is still open
+                response.raise_for_status()
+            response.raw.decode_content = True # Let urllib3 undo gzip/deflate
+            data_json = _finmind_stream_body(response.raw)
+        return _finmind_frame(data_json, response.status_code, dataset, stock_id)
 
     except requests.exceptions.HTTPError as e:
-        status_code = e.response.status_code
-        error_message = f"FinMind API HTTP error for {dataset}/{stock_id}: {status_code} - {e.response.text}"
-        logger.error(error_message, exc_info=True)
-        if status_code == 401: # Unauthorized
-            raise utils.FinMindAPIError(error_message, status_code=status_code)
-        elif status_code == 402: # Token usage limit
-             raise utils.RateLimitError(f"FinMind API usage limit hit for {dataset}/{stock_id}.", status_code=status_code)
-        elif 400 <= status_code < 500: # Other client errors
-            raise utils.FinMindAPIError(error_message, status_code=status_code)
-        else: # Server errors or other HTTP errors
-            raise utils.APIError(error_message, status_code=status_code) # Generic API error for retry
+        error = _finmind_http_error(e.response.status_code, e.response.text, dataset, stock_id)
+        logger.error(str(error), exc_info=True)
+        raise error
 
     except Exception as e:
         error_message = f"Unexpected error fetching FinMind data for {dataset}/{stock_id}: {e}"
@@ -459,8 +1091,26 @@ def get_finmind_data(dataset: str, stock_id: str, start_date: str, end_date: str
 
 
 # --- News API Fetcher Framework ---
+def _news_api_key(api_key: str | None, source: str) -> str:
+    """Returns api_key, or the configured key for source; raises ConfigError if there is none."""
+    # Example: Determine key based on source
+    key_to_use = api_key
+    if not key_to_use:
+        if source == "GEMINI_NEWS" and config.GEMINI_API_KEY: # Example if Gemini has news
+             key_to_use = config.GEMINI_API_KEY
+        # Add elif for other news sources and their respective config keys
+        # elif source == "NEWSAPI_ORG" and config.NEWSAPI_ORG_KEY:
+        # key_to_use = config.NEWSAPI_ORG_KEY
+        else:
+            logger.error(f"News API key for source '{source}' not available in config or arguments.")
+            raise utils.ConfigError(f"News API key for source '{source}' not available.")
+    return key_to_use
+
+@simulated_if_mocked("news", lambda a: f"query_{a['query']}_source_{a['source']}",
+                     ("query", "start_date", "end_date", "source"), "json_list_dict")
 @news_breaker
 @common_retry_decorator
+@news_aimd
 def fetch_market_news(query: str, start_date: str, end_date: str,
                       api_key: str | None = None, source: str = "default_news_api",
                       **kwargs) -> list[dict] | None:
@@ -478,26 +1128,11 @@ def fetch_market_news(query: str, start_date: str, end_date: str,
     Returns:
         List of news articles (dicts), or None.
     """
-    endpoint_name = f"query_{query}_source_{source}"
-    mock_params = {"query": query, "start_date": start_date, "end_date": end_date, "source": source}
-
-    if config.SIMULATION_MODE:
-        return load_simulated_data("news", endpoint_name, mock_params, expected_format="json_list_dict")
 
     # Real API call - Placeholder
     logger.warning(f"Real News API call for source '{source}' not yet fully implemented. This is placeholder logic.")
 
-    # Example: Determine key based on source
-    key_to_use = api_key
-    if not key_to_use:
-        if source == "GEMINI_NEWS" and config.GEMINI_API_KEY: # Example if Gemini has news
-             key_to_use = config.GEMINI_API_KEY
-        # Add elif for other news sources and their respective config keys
-        # elif source == "NEWSAPI_ORG" and config.NEWSAPI_ORG_KEY:
-        # key_to_use = config.NEWSAPI_ORG_KEY
-        else:
-            logger.error(f"News API key for source '{source}' not available in config or arguments.")
-            raise utils.ConfigError(f"News API key for source '{source}' not available.")
+    key_to_use = _news_api_key(api_key, source)
 
     # --- Placeholder for actual API call logic ---
     # This section would be replaced with actual requests to a news API.
@@ -505,7 +1140,9 @@ def fetch_market_news(query: str, start_date: str, end_date: str,
     # url = "..."
     # params = {"q": query, "from": start_date, "to": end_date, "apiKey": key_to_use, **kwargs}
     # try:
-    #     response = requests.get(url, params=params)
+    #     _maybe_wait("news", raise_if_long=False)
+    #     response = _SESSION.get(url, params=params)
+    #     _apply_rate_limit(response.headers, "news")
     #     response.raise_for_status()
     #     news_data = response.json().get('articles', []) # Example for NewsAPI.org structure
     #     # Transform news_data to a standard list of dicts:
@@ -536,6 +1173,158 @@ def fetch_market_news(query: str, start_date: str, end_date: str,
     return []
 
 
+# --- Concurrent Fetching ---
+def fetch_concurrently(tasks: dict, max_workers: int = 16) -> dict:
+    """
+    Runs independent fetcher calls on a thread pool. The fetchers spend nearly all their time
+    waiting on HTTP round-trips, so overlapping them cuts wall time roughly by the number of
+    calls in flight (breakers and retries still apply per call).
+
+    Identical calls (same function and arguments, e.g. two keyword aliases for one ticker)
+    are deduplicated before dispatch: the call runs once and every key gets its result.
+
+    Args:
+        tasks: Mapping of key -> (fetch_function, args, kwargs), e.g.
+               {"VIX": (get_yfinance_data, ("^VIX", "2024-01-01", "2024-01-31"), {})}.
+        max_workers: Maximum number of concurrent calls (capped at the number of distinct calls).
+
+    Returns:
+        Mapping of key -> fetch result. Keys whose call raised map to None; the error is logged.
+    """
+    if not tasks:
+        return {}
+
+    # Distinct call -> (fn, args, kwargs, keys sharing it)
+    calls = {}
+    for key, (fn, args, kwargs) in tasks.items():
+        try:
+            call_id = (fn, tuple(args), tuple(sorted(kwargs.items())))
+            hash(call_id)
+        except TypeError: # Unhashable arguments: never merged with another task
+            call_id = ("unhashable", key)
+        calls.setdefault(call_id, (fn, args, kwargs, []))[3].append(key)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        futures = {executor.submit(fn, *args, **kwargs): keys for fn, args, kwargs, keys in calls.values()}
+        for future in as_completed(futures):
+            keys = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Concurrent fetch for {keys} failed: {e}", exc_info=True)
+                result = None
+            for key in keys:
+                results[key] = result
+    logger.info(f"Fetched {len(results)} tasks with {len(calls)} distinct calls (max_workers={max_workers}).")
+    return results
+
+
+# --- Async Fetching ---
+# Async variants for orchestrators that asyncio.gather() many calls on one event loop. Calls in
+# flight are capped by a bulkhead semaphore and paced per API by a sliding-window
+# requests-per-minute limiter; retries back off with asyncio.sleep, so waits never block the loop.
+async_retry_decorator = retry(
+    stop=stop_after_attempt(config.RETRY_ATTEMPTS),
+    wait=wait_exponential(multiplier=1, min=config.RETRY_DELAY_SECONDS, max=config.RETRY_DELAY_SECONDS * 4),
+    retry=retry_if_exception(retry_if_api_error_is_server_side_or_rate_limit)
+)
+
+class SlidingWindowRateLimiter:
+    """Lets at most max_calls acquisitions through in any window_seconds span."""
+
+    def __init__(self, max_calls: int, window_seconds: float = 60.0):
+        self.max_calls = max_calls
+        self.window_seconds = window_seconds
+        self._call_times = collections.deque() # monotonic times of the calls inside the window
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            while self._call_times and now - self._call_times[0] >= self.window_seconds:
+                self._call_times.popleft()
+            if len(self._call_times) < self.max_calls:
+                self._call_times.append(now)
+                return
+            await asyncio.sleep(self.window_seconds - (now - self._call_times[0]))
+
+# asyncio primitives belong to one event loop, so each loop gets its own bulkhead and limiters
+_ASYNC_LIMITS = weakref.WeakKeyDictionary() # loop -> (bulkhead semaphore, {api_name: limiter})
+
+def _async_limits(api_name: str) -> tuple[asyncio.Semaphore, SlidingWindowRateLimiter]:
+    """Returns the running loop's bulkhead and the rate limiter for api_name."""
+    loop = asyncio.get_running_loop()
+    limits = _ASYNC_LIMITS.get(loop)
+    if limits is None:
+        limits = _ASYNC_LIMITS[loop] = (asyncio.Semaphore(config.MAX_CONCURRENT_API_CALLS), {})
+    bulkhead, limiters = limits
+    limiter = limiters.get(api_name)
+    if limiter is None:
+        limiter = limiters[api_name] = SlidingWindowRateLimiter(config.API_REQUESTS_PER_MINUTE)
+    return bulkhead, limiter
+
+@contextlib.asynccontextmanager
+async def _client_session(session=None):
+    """Yields session, or a new aiohttp.ClientSession closed on exit when none is given."""
+    if aiohttp is None:
+        raise utils.ConfigError("aiohttp is not installed; the async fetchers require it.")
+    if session is not None:
+        yield session
+    else:
+        async with aiohttp.ClientSession() as new_session:
+            yield new_session
+
+async def _aget(session, api_name: str, url: str, params: dict, timeout: float) -> tuple[int, bytes]:
+    """GETs url within the bulkhead and api_name's rate limit; returns (status, body)."""
+    bulkhead, limiter = _async_limits(api_name)
+    async with bulkhead:
+        await limiter.acquire()
+        wait_seconds = _rate_limit_wait_seconds(api_name, raise_if_long=False) # The long case is quota_guarded's
+        if wait_seconds:
+            await asyncio.sleep(wait_seconds)
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            _apply_rate_limit(response.headers, api_name)
+            return response.status, await response.read()
+
+FINMIND_REQUEST_TIMEOUT_SECONDS = 30
+
+@quota_guarded("finmind")
+@async_retry_decorator
+async def aget_finmind_data(dataset: str, stock_id: str, start_date: str, end_date: str,
+                            api_token: str | None = None, session=None, **kwargs) -> pd.DataFrame | None:
+    """
+    Async get_finmind_data: same arguments and result. Pass one aiohttp.ClientSession as
+    session when gathering many calls so they share its connection pool.
+    """
+    if config.SIMULATION_MODE:
+        return get_finmind_data(dataset, stock_id, start_date, end_date, api_token=api_token, **kwargs)
+
+    params = _finmind_request_params(dataset, stock_id, start_date, end_date, api_token, kwargs)
+    logger.info(f"Fetching FinMind data (async) for {dataset} / {stock_id} from {start_date} to {end_date}")
+    async with _client_session(session) as client:
+        status_code, body = await _aget(client, "finmind", FINMIND_DATA_URL, params, FINMIND_REQUEST_TIMEOUT_SECONDS)
+    if status_code >= 400:
+        error = _finmind_http_error(status_code, body.decode('utf-8', errors='replace'), dataset, stock_id)
+        logger.error(str(error))
+        raise error
+    return _finmind_frame(_loads_json(body), status_code, dataset, stock_id)
+
+@async_retry_decorator
+async def afetch_market_news(query: str, start_date: str, end_date: str,
+                             api_key: str | None = None, source: str = "default_news_api",
+                             session=None, **kwargs) -> list[dict] | None:
+    """Async fetch_market_news: same arguments and result (the real call is still a placeholder)."""
+    if config.SIMULATION_MODE:
+        return fetch_market_news(query, start_date, end_date, api_key=api_key, source=source, **kwargs)
+
+    key_to_use = _news_api_key(api_key, source)
+    # Placeholder, as in fetch_market_news: once a provider is chosen, request it with
+    # _aget(client, "news", url, {"q": query, ..., "apiKey": key_to_use}, timeout)
+    # inside `async with _client_session(session) as client:` and normalize like the sync version.
+    logger.info(f"Placeholder: Would fetch news (async) for '{query}' from {source} between {start_date} and {end_date}.")
+    return []
+
+
 if __name__ == '__main__':
     logger.info("--- Running financial_data_fetcher.py direct execution tests ---")
 
@@ -550,16 +1339,14 @@ if __name__ == '__main__':
     # --- Create Dummy Mock Files ---
     # FRED Mock (json_df_records)
     fred_mock_params = {"series_id": "GDPC1", "start_date": "2020-01-01", "end_date": "2020-12-31"}
-    fred_mock_filename = f"fred_series_GDPC1_{urlencode(sorted(fred_mock_params.items()))[:50]}.json" # Simplified
-    fred_mock_path = os.path.join(config.MOCK_DATA_DIR, fred_mock_filename)
+    fred_mock_path = os.path.join(config.MOCK_DATA_DIR, f"{_mock_file_base('fred', 'series_GDPC1', fred_mock_params)}.json")
     fred_sample_data = [{'date': '2020-01-01', 'value': 20000.0}, {'date': '2020-04-01', 'value': 19000.0}]
     with open(fred_mock_path, 'w') as f: json.dump(fred_sample_data, f)
     logger.info(f"Created FRED mock file: {fred_mock_path}")
 
     # yfinance Mock (csv)
     yf_mock_params = {"ticker": "TESTMSFT", "start_date": "2020-01-01", "end_date": "2020-01-05", "interval": "1d"}
-    # yf_mock_filename = f"yfinance_ticker_TESTMSFT_{urlencode(sorted(yf_mock_params.items()))[:80]}.csv" # Simplified
-    yf_mock_filename_base = f"yfinance_ticker_TESTMSFT_start_date=2020-01-01_end_date=2020-01-05_interval=1d" # matching load_simulated_data format
+    yf_mock_filename_base = _mock_file_base("yfinance", "ticker_TESTMSFT", yf_mock_params) # matching load_simulated_data format
     yf_mock_path = os.path.join(config.MOCK_DATA_DIR, f"{yf_mock_filename_base}.csv")
 
     yf_sample_df = pd.DataFrame({
@@ -573,7 +1360,7 @@ if __name__ == '__main__':
 
     # FinMind Mock (json_df_records)
     finmind_mock_params = {"dataset": "TestStockPrice", "stock_id": "0050", "start_date": "2020-01-01", "end_date": "2020-01-05"}
-    finmind_mock_filename_base = f"finmind_dataset_TestStockPrice_stock_id=0050_start_date=2020-01-01_end_date=2020-01-05"
+    finmind_mock_filename_base = _mock_file_base("finmind", "dataset_TestStockPrice_stock_0050", finmind_mock_params)
     finmind_mock_path = os.path.join(config.MOCK_DATA_DIR, f"{finmind_mock_filename_base}.json")
     finmind_sample_data = [{'date': '2020-01-02', 'stock_id': '0050', 'Trading_Volume': 1000, 'Close': 80.0},
                            {'date': '2020-01-03', 'stock_id': '0050', 'Trading_Volume': 1200, 'Close': 81.0}]
@@ -582,7 +1369,7 @@ if __name__ == '__main__':
 
     # News Mock (json_list_dict)
     news_mock_params = {"query": "test_query", "start_date": "2020-01-01", "end_date": "2020-01-02", "source": "test_news"}
-    news_mock_filename_base = f"news_query_test_query_start_date=2020-01-01_end_date=2020-01-02_source_test_news"
+    news_mock_filename_base = _mock_file_base("news", "query_test_query_source_test_news", news_mock_params)
     news_mock_path = os.path.join(config.MOCK_DATA_DIR, f"{news_mock_filename_base}.json")
     news_sample_data = [{'date': '2020-01-01T10:00:00Z', 'headline': 'Test News 1', 'summary': 'Summary 1', 'source': 'Test Source'},
                         {'date': '2020-01-01T12:00:00Z', 'headline': 'Test News 2', 'summary': 'Summary 2', 'source': 'Test Source'}]
@@ -599,6 +1386,8 @@ if __name__ == '__main__':
     fred_df_sim = get_fred_data(series_id="GDPC1", start_date="2020-01-01", end_date="2020-12-31")
     assert fred_df_sim is not None and not fred_df_sim.empty, "FRED simulation failed"
     assert 'value' in fred_df_sim.columns and 'date' in fred_df_sim.columns, "FRED sim columns incorrect"
+    fred_csv_style = _FRED_ADAPTER.apply(pd.DataFrame({'DATE': ['2020-01-01'], 'GDPC1': [1.0]}), extra_rename={'GDPC1': 'value'})
+    assert list(fred_csv_style.columns) == ['date', 'value'] and fred_csv_style['date'].dtype.kind == 'M', "FRED adapter failed"
     logger.info(f"FRED sim data (first 2 rows):\n{fred_df_sim.head(2)}")
 
     # Test yfinance
@@ -616,8 +1405,38 @@ if __name__ == '__main__':
     # Test News
     news_list_sim = fetch_market_news(query="test_query", start_date="2020-01-01", end_date="2020-01-02", source="test_news")
     assert news_list_sim is not None and len(news_list_sim) > 0, "News simulation failed"
+
+    # Repeated loads are served from the parse cache, as independent copies
+    news_list_sim[0]['headline'] = "modified by caller"
+    news_list_again = fetch_market_news(query="test_query", start_date="2020-01-01", end_date="2020-01-02", source="test_news")
+    assert news_list_again[0]['headline'] == 'Test News 1', "Cached mock data was mutated through a returned copy"
+    assert _parse_mock_file.cache_info().hits >= 1, "Mock parse cache was not used"
+    clear_mock_cache()
+
+    # Parquet copies of the mocks are preferred and load to the same frames
+    parquet_paths = convert_mock_data_to_parquet()
+    assert any(p.startswith(yf_mock_filename_base, len(config.MOCK_DATA_DIR) + 1) for p in parquet_paths), "yfinance mock not converted"
+    yf_df_parquet = get_yfinance_data(ticker="TESTMSFT", start_date="2020-01-01", end_date="2020-01-05", interval="1d", force_refresh=True)
+    pd.testing.assert_frame_equal(yf_df_parquet, yf_df_sim)
+    for path in parquet_paths:
+        os.remove(path)
+    clear_mock_cache()
     logger.info(f"News sim data (first item):\n{news_list_sim[0] if news_list_sim else 'Empty'}")
 
+    # Test multi-ticker yfinance fetch (per-ticker mocks in simulation mode)
+    yf_multi_sim = get_yfinance_data_multi(["TESTMSFT", "TESTMSFT"], start_date="2020-01-01", end_date="2020-01-05")
+    assert list(yf_multi_sim) == ["TESTMSFT"] and not yf_multi_sim["TESTMSFT"].empty, "yfinance multi simulation failed"
+
+    # Test concurrent fetching over the same mocks
+    concurrent_results = fetch_concurrently({
+        "GDPC1": (get_fred_data, ("GDPC1", "2020-01-01", "2020-12-31"), {}),
+        "TESTMSFT": (get_yfinance_data, ("TESTMSFT", "2020-01-01", "2020-01-05"), {"interval": "1d"}),
+        "TESTMSFT alias": (get_yfinance_data, ("TESTMSFT", "2020-01-01", "2020-01-05"), {"interval": "1d"}),
+    })
+    assert set(concurrent_results) == {"GDPC1", "TESTMSFT", "TESTMSFT alias"}, "Concurrent fetch lost tasks"
+    assert concurrent_results["TESTMSFT"] is concurrent_results["TESTMSFT alias"], "Duplicate call was not shared"
+    assert all(df is not None and not df.empty for df in concurrent_results.values()), "Concurrent fetch failed"
+
     config.SIMULATION_MODE = original_sim_mode # Restore original mode
 
     # --- Test Real API Calls (if keys are available and not in CI/restricted env) ---
@@ -685,11 +1504,140 @@ if __name__ == '__main__':
         logger.info("Skipping REAL API Calls tests (RUN_REAL_API_TESTS not true).")
 
 
+    # Async variants: gathered calls share the bulkhead; simulation mode serves them from mocks
+    async def _gather_async_fetches():
+        return await asyncio.gather(
+            aget_finmind_data(dataset="TestStockPrice", stock_id="0050", start_date="2020-01-01", end_date="2020-01-05"),
+            afetch_market_news(query="test_query", start_date="2020-01-01", end_date="2020-01-02", source="test_news"))
+    config.SIMULATION_MODE = True
+    async_finmind_df, async_news = asyncio.run(_gather_async_fetches())
+    config.SIMULATION_MODE = original_sim_mode
+    assert async_finmind_df is not None and len(async_finmind_df) == 2, "Async FinMind simulation failed"
+    assert async_news and async_news[0]['headline'] == 'Test News 1', "Async news simulation failed"
+
+    async def _time_rate_limited_calls(n_calls):
+        limiter = SlidingWindowRateLimiter(max_calls=2, window_seconds=0.2)
+        start = time.monotonic()
+        for _ in range(n_calls):
+            await limiter.acquire()
+        return time.monotonic() - start
+    assert asyncio.run(_time_rate_limited_calls(2)) < 0.1, "Rate limiter delayed calls within its limit"
+    assert asyncio.run(_time_rate_limited_calls(3)) >= 0.2, "Rate limiter let a third call through the window"
+    logger.info("Async fetcher tests passed.")
+
+    # AIMD: healthy calls grow the limit additively, a 5xx halves it
+    aimd = AIMDController("TEST_API", c_min=1, c_max=4, target_latency=1.0)
+    aimd.limit = 2.0
+    aimd(lambda: None)()
+    assert aimd.limit == 2.5, f"AIMD additive increase wrong: {aimd.limit}"
+    def _server_error():
+        raise utils.APIError("Simulated server error", status_code=503)
+    try:
+        aimd(_server_error)()
+    except utils.APIError:
+        pass
+    assert aimd.limit == 1.25 and aimd._in_flight == 0, f"AIMD multiplicative decrease wrong: {aimd.limit}"
+    logger.info("AIMD controller tests passed.")
+
+    # Streamed FinMind parsing matches parsing the whole body
+    if ijson is not None:
+        import io
+        finmind_body = {'msg': 'success', 'status': 200,
+                        'data': [{'date': '2024-01-02', 'stock_id': '2330', 'close': 593.0},
+                                 {'date': '2024-01-03', 'stock_id': '2330', 'close': 578.0, 'spread': -15.0}]}
+        streamed = _finmind_stream_body(io.BytesIO(json.dumps(finmind_body).encode('utf-8')))
+        assert streamed['msg'] == 'success' and streamed['status'] == 200, f"Streamed header fields wrong: {streamed}"
+        pd.testing.assert_frame_equal(_finmind_frame(streamed, 200, "TestStockPrice", "2330"),
+                                      _finmind_frame(finmind_body, 200, "TestStockPrice", "2330"))
+
+    # Retry classification: most specific registered type decides
+    assert retry_if_api_error_is_server_side_or_rate_limit(utils.RateLimitError("limit", status_code=402))
+    assert retry_if_api_error_is_server_side_or_rate_limit(utils.FinMindAPIError("server", status_code=502))
+    assert not retry_if_api_error_is_server_side_or_rate_limit(utils.FredAPIError("bad key", status_code=401))
+    assert retry_if_api_error_is_server_side_or_rate_limit(requests.exceptions.ConnectionError("reset"))
+    assert not retry_if_api_error_is_server_side_or_rate_limit(ValueError("not an API error"))
+
+    # Rate-limit hints: a nearly spent quota delays the next call until its reset
+    _apply_rate_limit({'X-RateLimit-Remaining': '1', 'X-RateLimit-Reset': '0.2'}, "test_api")
+    assert 0 < _rate_limit_wait_seconds("test_api") <= 0.2, "Low remaining quota did not delay the next call"
+    _apply_rate_limit({'Retry-After': '3600'}, "test_api")
+    try:
+        _maybe_wait("test_api")
+        assert False, "A long Retry-After should raise instead of blocking"
+    except utils.RateLimitError:
+        pass
+    _apply_rate_limit({'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': '60'}, "test_api")
+    assert _rate_limit_wait_seconds("test_api") == 0.0, "Ample quota should not delay calls"
+
+    # An exhausted quota is refused before the breaker: no retries, no AIMD cut, no breaker failure
+    _apply_rate_limit({'Retry-After': '3600'}, "fred")
+    config.SIMULATION_MODE = False
+    breaker_failures, fred_limit = fred_breaker.fail_counter, fred_aimd.limit
+    refused_start = time.monotonic()
+    try:
+        get_fred_data("GDPC1", "2020-01-01", "2020-12-31", api_key="unused", force_refresh=True)
+        assert False, "Exhausted FRED quota did not raise"
+    except utils.RateLimitError:
+        pass
+    finally:
+        config.SIMULATION_MODE = original_sim_mode
+        _RATE_LIMIT_STATE.pop("fred", None)
+    assert time.monotonic() - refused_start < 1, "Locally refused call was retried"
+    assert fred_breaker.fail_counter == breaker_failures and fred_aimd.limit == fred_limit, "Refused call counted as a failure"
+    logger.info("Rate-limit hint tests passed.")
+
+    # Test batched yfinance downloads against a stand-in yf.download: batches of _YF_BATCH_SIZE,
+    # and tickers cached by an earlier run are not downloaded again
+    import tempfile
+    download_batches = []
+    class _FakeYFinance:
+        @staticmethod
+        def download(tickers, start, end, **kwargs):
+            download_batches.append(list(tickers))
+            dates = pd.date_range(start, periods=2, name='Date')
+            fields = ['Open', 'High', 'Low', 'Close', 'Volume']
+            columns = pd.MultiIndex.from_product([tickers, fields])
+            return pd.DataFrame(1.0, index=dates, columns=columns)
+    original_yf, original_cache_dir = _yf, config.FETCH_CACHE_DIR
+    _yf = lambda: _FakeYFinance
+    config.SIMULATION_MODE = False
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config.FETCH_CACHE_DIR = cache_dir
+            batch_tickers = [f"T{i}" for i in range(_YF_BATCH_SIZE + 5)]
+            first = get_yfinance_data_multi(batch_tickers[:3], "2020-01-01", "2020-01-05")
+            assert download_batches == [batch_tickers[:3]] and len(first["T0"]) == 2
+            download_batches.clear()
+            batched = get_yfinance_data_multi(batch_tickers, "2020-01-01", "2020-01-05")
+            assert download_batches == [batch_tickers[3:3 + _YF_BATCH_SIZE], batch_tickers[3 + _YF_BATCH_SIZE:]], download_batches
+            assert list(batched) == batch_tickers and all(len(df) == 2 for df in batched.values())
+            # The per-ticker fetcher reads the same cache entries
+            assert len(get_yfinance_data("T0", "2020-01-01", "2020-01-05")) == 2 and len(download_batches) == 2
+    finally:
+        _yf, config.FETCH_CACHE_DIR = original_yf, original_cache_dir
+        config.SIMULATION_MODE = original_sim_mode
+    logger.info("Batched yfinance download tests passed.")
+
+    # Test fetch cache keys and freshness
+    assert _fetch_cache_path("yfinance", "BRK/A", "2020-01-01", "2020-01-05", {}) != \
+        _fetch_cache_path("yfinance", "BRK_A", "2020-01-01", "2020-01-05", {}), "Sanitized ids share a cache file"
+    with tempfile.NamedTemporaryFile(suffix=".parquet") as stale_entry:
+        day_old = time.time() - config.FETCH_CACHE_REVISED_TTL_SECONDS - 1
+        os.utime(stale_entry.name, (day_old, day_old))
+        assert _fetch_cache_is_fresh(stale_entry.name, "2020-01-05"), "Closed range should be final"
+        assert not _fetch_cache_is_fresh(stale_entry.name, "2020-01-05", revised=True), "Revised source never expired"
+    try:
+        disk_cached("fred", key=("series", "start_date", "end_date"))(get_fred_data.__wrapped__)
+        assert False, "disk_cached accepted a key parameter the function does not have"
+    except TypeError:
+        pass
+    logger.info("Fetch cache key tests passed.")
+
     # Test retry and circuit breaker (conceptual - hard to test deterministically without mocks for server errors)
     logger.info("--- Conceptual test for retry and circuit breaker ---")
-    # To truly test these, you'd mock the 'requests.get' or library calls to raise specific exceptions.
+    # To truly test these, you'd mock '_SESSION.get' or library calls to raise specific exceptions.
     # For example, to test fred_breaker:
-    # with mock.patch('fredapi.Fred.get_series', side_effect=utils.APIError("Simulated server error", status_code=500)):
+    # with mock.patch.object(_SESSION, 'get', side_effect=utils.APIError("Simulated server error", status_code=500)):
     #     for i in range(config.CIRCUIT_BREAKER_FAIL_MAX + 1):
     #         try:
     #             get_fred_data("FAIL_SERIES", "2023-01-01", "2023-01-02")
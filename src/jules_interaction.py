@@ -16,6 +16,11 @@ except ImportError:
         "Jules Interaction functionality will be limited to simulation mode or raise errors."
     )
 
+try:
+    import orjson # Optional: faster JSON serialization of prompt payloads
+except ImportError:
+    orjson = None
+
 
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -186,6 +191,16 @@ MONTHLY_ANALYSIS_REPORT_PROMPT_TEMPLATE = """
 """
 
 
+def _dumps_for_prompt(data) -> str:
+    """
+    Serializes data as 2-space indented, non-ASCII-escaped JSON for a prompt. Uses orjson when
+    installed (several times faster than json.dumps on large post lists; same layout).
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
 # --- API Interaction Functions ---
 @gemini_retry_decorator
 def generate_monthly_transcript(posts_data: list[dict]) -> str | None:
@@ -202,7 +217,7 @@ def generate_monthly_transcript(posts_data: list[dict]) -> str | None:
 
     try:
         # Format posts_data into a JSON string for the prompt
-        posts_data_json_str = json.dumps(posts_data, ensure_ascii=False, indent=2)
+        posts_data_json_str = _dumps_for_prompt(posts_data)
     except Exception as e:
         logger.error(f"Error serializing posts_data to JSON: {e}", exc_info=True)
         raise utils.DataProcessingError(f"Failed to serialize posts_data for prompt: {e}")
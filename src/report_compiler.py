@@ -188,11 +188,13 @@ def compile_html_report(report_title: str, sections: list[dict],
         raise # Re-raise the error as it's critical
 
     full_output_path = os.path.join(final_output_dir, output_filename)
-    main_html_content = ""
+    # Sections (base64 charts in particular) can be large; collect the pieces and join once
+    # rather than re-copying the growing string on every +=
+    html_parts = []
 
     for i, section in enumerate(sections):
         section_title = section.get('title', f'Section {i+1}')
-        main_html_content += f"<div class='content-section'>\n<h2>{section_title}</h2>\n"
+        html_parts.append(f"<div class='content-section'>\n<h2>{section_title}</h2>\n")
 
         section_type = section.get('type')
 
@@ -200,18 +202,18 @@ def compile_html_report(report_title: str, sections: list[dict],
             if section_type == 'markdown':
                 content = section.get('content')
                 if isinstance(content, str):
-                    main_html_content += convert_markdown_to_html(content)
+                    html_parts.append(convert_markdown_to_html(content))
                 else:
                     logger.warning(f"Markdown content for section '{section_title}' is not a string. Skipping.")
-                    main_html_content += "<p>Content for this section is invalid (expected markdown string).</p>"
+                    html_parts.append("<p>Content for this section is invalid (expected markdown string).</p>")
 
             elif section_type == 'table':
                 dataframe = section.get('dataframe')
                 if isinstance(dataframe, pd.DataFrame):
-                    main_html_content += convert_df_to_html_table(dataframe)
+                    html_parts.append(convert_df_to_html_table(dataframe))
                 else:
                     logger.warning(f"DataFrame for section '{section_title}' is not a valid DataFrame. Skipping.")
-                    main_html_content += "<p>Data for this table is invalid.</p>"
+                    html_parts.append("<p>Data for this table is invalid.</p>")
 
             elif section_type == 'chart':
                 chart_data = section.get('data')
@@ -221,24 +223,24 @@ def compile_html_report(report_title: str, sections: list[dict],
                 if callable(chart_function) and isinstance(chart_data, pd.DataFrame):
                     chart_html = chart_function(chart_data, title=chart_plot_title)
                     if chart_html:
-                        main_html_content += f"<div class='chart'>{chart_html}</div>"
+                        html_parts.append(f"<div class='chart'>{chart_html}</div>")
                     else:
                         logger.warning(f"Chart generation returned None for section '{section_title}'.")
-                        main_html_content += "<p>Chart could not be generated for this section.</p>"
+                        html_parts.append("<p>Chart could not be generated for this section.</p>")
                 else:
                     logger.warning(f"Invalid chart data or function for section '{section_title}'. Skipping.")
-                    main_html_content += "<p>Chart data or generation function is invalid.</p>"
+                    html_parts.append("<p>Chart data or generation function is invalid.</p>")
 
             else:
                 logger.warning(f"Unknown section type '{section_type}' for section '{section_title}'.")
-                main_html_content += f"<p>Unknown content type: {section_type}</p>"
+                html_parts.append(f"<p>Unknown content type: {section_type}</p>")
         except Exception as e:
             logger.error(f"Error processing section '{section_title}' (type: {section_type}): {e}", exc_info=True)
-            main_html_content += f"<p>Error rendering this section: {e}</p>"
+            html_parts.append(f"<p>Error rendering this section: {e}</p>")
 
-        main_html_content += "</div>\n"
+        html_parts.append("</div>\n")
 
-    final_html = HTML_TEMPLATE.format(report_title=report_title, main_content=main_html_content)
+    final_html = HTML_TEMPLATE.format(report_title=report_title, main_content="".join(html_parts))
 
     try:
         with open(full_output_path, 'w', encoding='utf-8') as f:
@@ -42,6 +42,14 @@ class FinMindAPIError(APIError):
     """Specific error for FinMind API."""
     pass
 
+class YFinanceError(APIError):
+    """Specific error for yfinance data fetches."""
+    pass
+
+class RateLimitError(APIError):
+    """Raised when an API rejects a request for exceeding its rate or usage limit."""
+    pass
+
 # File System Utils
 def ensure_directory_exists(dir_path: str):
     """